@@ -1,12 +1,115 @@
 import os
+import argparse
+import contextlib
 import datetime
 
-def read_file_content(filepath):
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
-    except Exception as e:
-        return f"Error reading {filepath}: {e}"
+DEFAULT_OUTPUT = "docs/aistudio/STARLIST_GEM_KNOWLEDGE.md"
+CHUNK_SIZE = 64 * 1024  # characters read per chunk while copying a source doc
+TRUNCATION_NOTE = "... (truncated: {reason})"
+BUDGET_REASONS = ("output byte budget", "output token budget", "section limit")
+# Room held back while copying a section so its truncation note always fits.
+TRUNCATION_ROOM = "\n" + TRUNCATION_NOTE.format(reason=max(BUDGET_REASONS, key=len))
+
+
+def estimate_tokens(text):
+    # Rough estimate without a tokenizer: ~4 ASCII characters per token,
+    # and about one token per non-ASCII (e.g. Japanese) character.
+    ascii_count = len(text.encode('ascii', 'ignore'))
+    return (ascii_count + 3) // 4 + (len(text) - ascii_count)
+
+
+class BudgetedWriter:
+    """Streams text to a file while keeping it within a byte and token budget.
+
+    Nothing is written past ``max_bytes`` / ``max_tokens``: a section's
+    heading is only started once its closing fence and a truncation note fit
+    too, and that closing text stays reserved (see ``reserve``) while the
+    section body is copied.
+    """
+
+    def __init__(self, handle, max_bytes=None, max_tokens=None):
+        self.handle = handle
+        self.max_bytes = max_bytes
+        self.max_tokens = max_tokens
+        self.bytes_written = 0
+        self.tokens_written = 0
+        self.at_line_start = True
+        self.reserved_bytes = 0
+        self.reserved_tokens = 0
+
+    def overflow(self, size, tokens, section_bytes=0, section_limit=None):
+        """Return why ``size`` more bytes would not fit, or None if they do."""
+        byte_budget, token_budget, section = BUDGET_REASONS
+        if self.max_bytes is not None and self.bytes_written + self.reserved_bytes + size > self.max_bytes:
+            return byte_budget
+        if self.max_tokens is not None and self.tokens_written + self.reserved_tokens + tokens > self.max_tokens:
+            return token_budget
+        if section_limit is not None and section_bytes + size > section_limit:
+            return section
+        return None
+
+    def fits(self, text):
+        return self.overflow(len(text.encode('utf-8')), estimate_tokens(text)) is None
+
+    @contextlib.contextmanager
+    def reserve(self, text):
+        """Hold back room for ``text`` (closing fences, notes) while the body is written."""
+        size, tokens = len(text.encode('utf-8')), estimate_tokens(text)
+        self.reserved_bytes += size
+        self.reserved_tokens += tokens
+        try:
+            yield
+        finally:
+            self.reserved_bytes -= size
+            self.reserved_tokens -= tokens
+
+    def write(self, text):
+        # Unchecked: callers make sure the text fits (``fits``/``overflow``)
+        # or was reserved beforehand.
+        if not text:
+            return
+        self.handle.write(text)
+        self.bytes_written += len(text.encode('utf-8'))
+        self.tokens_written += estimate_tokens(text)
+        self.at_line_start = text.endswith("\n")
+
+    def write_line(self, text=""):
+        self.write(text + "\n")
+
+    def write_lines(self, lines, section_limit=None, section_bytes=0):
+        """Write lines until one would not fit; returns (bytes, truncation reason)."""
+        for line in lines:
+            size = len(line.encode('utf-8'))
+            reason = self.overflow(size, estimate_tokens(line), section_bytes, section_limit)
+            if reason:
+                return section_bytes, reason
+            self.write(line)
+            section_bytes += size
+        return section_bytes, None
+
+    def copy_file(self, filepath, section_limit=None):
+        """Copy ``filepath`` chunk by chunk; returns a truncation reason or None."""
+        copied = 0
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), ""):
+                    size = len(chunk.encode('utf-8'))
+                    if not self.overflow(size, estimate_tokens(chunk), copied, section_limit):
+                        self.write(chunk)
+                        copied += size
+                        continue
+                    # Fill what is left of the budget line by line, then stop.
+                    lines = chunk.splitlines(keepends=True)
+                    return self.write_lines(lines, section_limit, copied)[1]
+        except Exception as e:
+            return self.write_lines([f"Error reading {filepath}: {e}"], section_limit, copied)[1]
+        return None
+
+    def truncated(self, reason):
+        if not self.at_line_start:
+            self.write("\n")
+        self.write(TRUNCATION_NOTE.format(reason=reason))
+
 
 def get_directory_structure(rootdir, max_depth=2):
     structure = ""
@@ -31,8 +134,49 @@ def get_directory_structure(rootdir, max_depth=2):
             
     return structure
 
-def generate_context():
-    output_path = "docs/aistudio/STARLIST_GEM_KNOWLEDGE.md"
+def iter_structure_lines(base_dir, structure_dirs):
+    for d in structure_dirs:
+        target = os.path.join(base_dir, d)
+        if not os.path.exists(target):
+            continue
+        yield f"\n--- Directory: {d} ---\n"
+        for root, dirs, files in os.walk(target):
+            level = root.replace(target, '').count(os.sep)
+            if level > 1:
+                dirs[:] = []
+                continue
+            indent = '  ' * level
+            dirname = os.path.basename(root)
+            if dirname.startswith('.') or dirname == '__pycache__' or dirname == 'node_modules':
+                continue
+            yield f"{indent}{dirname}/\n"
+            for f in files:
+                if not f.startswith('.'):
+                    yield f"{indent}  {f}\n"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate the STARLIST Gemini Gem knowledge base")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Knowledge base file to write.")
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        help="Keep the whole output within this many bytes.",
+    )
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        help="Keep the whole output within this estimated token count.",
+    )
+    parser.add_argument(
+        "--section-max-bytes",
+        type=int,
+        help="Truncate each section (source doc or directory listing) to this many bytes.",
+    )
+    return parser.parse_args()
+
+
+def generate_context(output_path=DEFAULT_OUTPUT, max_bytes=None, max_tokens=None, section_max_bytes=None):
     base_dir = os.getcwd()
     
     # Define source files
@@ -59,61 +203,64 @@ def generate_context():
         }
     ]
 
-    content = []
-    content.append(f"# STARLIST Project Knowledge Base for Gemini Gems")
-    content.append(f"Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    
-    content.append("> This document is a consolidated knowledge base for the Starlist project. Use this as the primary source of truth for the Starlist Custom Gem.\n")
-
-    # Append File Contents
-    for source in sources:
-        full_path = os.path.join(base_dir, source['path'])
-        content.append(f"## {source['title']}")
-        content.append(f"**Source:** `{source['path']}`")
-        content.append(f"**Description:** {source['description']}\n")
-        content.append("```markdown")
-        content.append(read_file_content(full_path))
-        content.append("```\n")
-        content.append("---\n")
-
-    # Append Directory Structure
-    content.append("## 5. Project Directory Structure")
-    content.append("```")
-    # Simple custom walker or just listing key dirs
-    # listing root, lib, server, supabase, docs
-    structure_dirs = ['.', 'lib', 'server', 'supabase', 'docs']
-    
-    # Using a simplified listing to ensure it works across environments
-    # Actually, let's just use a hardcoded logic for key directories to be safe and clean
-    for d in structure_dirs:
-        target = os.path.join(base_dir, d)
-        if os.path.exists(target):
-             content.append(f"\n--- Directory: {d} ---")
-             # content.append(get_directory_structure(target, max_depth=2)) 
-             # Let's use list_dir style for better reliability if possible, but simple walk is fine
-             for root, dirs, files in os.walk(target):
-                level = root.replace(target, '').count(os.sep)
-                if level > 1: continue
-                indent = '  ' * level
-                dirname = os.path.basename(root)
-                if dirname.startswith('.') or dirname == '__pycache__' or dirname == 'node_modules': continue
-                content.append(f"{indent}{dirname}/")
-                for f in files:
-                    if not f.startswith('.'):
-                        content.append(f"{indent}  {f}")
-    
-    content.append("```\n")
-
-    # Write output
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    # Sources are copied chunk by chunk straight into the output file, so
+    # memory use stays flat however large the source docs grow. Once a
+    # section's framing no longer fits the budget, it and every later section
+    # are left out.
+    omitted = []
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(content))
-    
-    print(f"Successfully generated knowledge base at: {output_path}")
-
-if __name__ == "__main__":
-    generate_context()
+        out = BudgetedWriter(f, max_bytes=max_bytes, max_tokens=max_tokens)
+        preamble = (
+            "# STARLIST Project Knowledge Base for Gemini Gems\n"
+            f"Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            "> This document is a consolidated knowledge base for the Starlist project. Use this as the primary source of truth for the Starlist Custom Gem.\n\n"
+        )
+        if out.fits(preamble):
+            out.write(preamble)
+        else:
+            omitted.append("header")
 
+        # Append File Contents
+        for source in sources:
+            full_path = os.path.join(base_dir, source['path'])
+            header = (
+                f"## {source['title']}\n"
+                f"**Source:** `{source['path']}`\n"
+                f"**Description:** {source['description']}\n\n"
+                "```markdown\n"
+            )
+            footer = "\n```\n\n---\n\n"
+            if omitted or not out.fits(header + footer + TRUNCATION_ROOM):
+                omitted.append(source['path'])
+                continue
+            out.write(header)
+            with out.reserve(footer + TRUNCATION_ROOM):
+                reason = out.copy_file(full_path, section_max_bytes)
+            if reason:
+                out.truncated(reason)
+            out.write(footer)
 
+        # Append Directory Structure
+        header = "## 5. Project Directory Structure\n```\n"
+        footer = "```\n"
+        if omitted or not out.fits(header + footer + TRUNCATION_ROOM + "\n"):
+            omitted.append("directory structure")
+        else:
+            out.write(header)
+            structure_dirs = ['.', 'lib', 'server', 'supabase', 'docs']
+            lines = iter_structure_lines(base_dir, structure_dirs)
+            with out.reserve(footer + TRUNCATION_ROOM + "\n"):
+                _, reason = out.write_lines(lines, section_max_bytes)
+            if reason:
+                out.truncated(reason)
+                out.write_line()
+            out.write(footer)
 
+    print(f"Successfully generated knowledge base at: {output_path} ({out.bytes_written} bytes, ~{out.tokens_written} tokens)")
+    if omitted:
+        print(f"Left out to stay within the budget: {', '.join(omitted)}")
 
+if __name__ == "__main__":
+    args = parse_args()
+    generate_context(args.output, args.max_bytes, args.max_tokens, args.section_max_bytes)
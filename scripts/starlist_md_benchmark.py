@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""Throughput benchmark for scripts/starlist_md_validator.py.
+
+Generates a synthetic STARLIST docs corpus (frontmatter, ToCs, mermaid
+blocks, tables, cross-document links and code fences, with a realistic
+share of defects), then times the validator phases and prints one JSON
+line per phase with files/sec, MB/sec and the peak RSS reached so far.
+Phases share one process, so ``peak_rss_so_far_mb`` is cumulative: a phase
+only shows its own peak when it exceeds every earlier one. Use ``--output`` to
+append the lines (tagged with the current commit) to a JSONL history so
+runs can be compared across commits.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, TextIO
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import starlist_md_validator as validator  # noqa: E402
+
+AREAS = ["docs/ops", "docs/reports", "docs/planning", "guides"]
+DOCS_PER_DIR = 500
+PHASES = ["check", "check-cached", "report", "autofix"]
+SENTENCES = [
+    "This document describes the operational flow for the STARLIST platform.",
+    "各チームは変更前にレビュー担当者へ共有してください。",
+    "Metrics are exported every five minutes and retained for thirty days.",
+    "障害発生時は Runbook の手順に従い、一次対応を実施します。",
+    "The release checklist must be completed before tagging a version.",
+    "データ移行は段階的に実施し、ロールバック手順を事前に確認します。",
+    "Owners review this page at least once per quarter.",
+]
+
+
+def corpus_path(root: Path, number: int) -> Path:
+    area = AREAS[number % len(AREAS)]
+    return root / area / f"batch-{number // DOCS_PER_DIR:03d}" / f"doc-{number:06d}.md"
+
+
+def synthetic_document(rng: random.Random, root: Path, number: int, count: int) -> str:
+    """One Markdown document; roughly one in ten carries a fixable or manual defect."""
+    path = corpus_path(root, number)
+    lines: List[str] = []
+    roll = rng.random()
+    if roll >= 0.05:
+        lines.append("---")
+        lines.append("source_of_truth: true")
+        lines.append("version: 1.0.0" if roll >= 0.1 else "version: v1")
+        if roll >= 0.15:
+            lines.append("updated_date: 2025-01-15")
+        lines.append("owner: STARLIST Docs Team")
+        lines.extend(["---", ""])
+    lines.extend([f"# Synthetic Document {number}", ""])
+
+    sections = [
+        name
+        for name in ("背景", "要件", "Runbook", "更新", "DoD (Definition of Done)")
+        if rng.random() < 0.92
+    ]
+    if rng.random() < 0.7:
+        lines.append("## 目次")
+        lines.extend(f"- [{name}](#{validator.slugify(name)})" for name in sections)
+        lines.append("")
+
+    for name in sections:
+        lines.extend([f"## {name}", ""])
+        for _ in range(rng.randint(1, 4)):
+            sentence = rng.choice(SENTENCES)
+            if rng.random() < 0.03:
+                sentence += " Details are tbd."
+            lines.append(sentence)
+        lines.append("")
+        if rng.random() < 0.4:
+            other = corpus_path(root, rng.randrange(count))
+            target = os.path.relpath(other, path.parent)
+            if rng.random() < 0.05:
+                target = target.replace(".md", "-missing.md")
+            anchor = "#runbook" if rng.random() < 0.3 else ""
+            lines.extend([f"See [related document]({target}{anchor}).", ""])
+        if rng.random() < 0.3:
+            lines.extend(["```mermaid", "graph TD", "  A[Request] --> B[Review]", "```", ""])
+        if rng.random() < 0.5:
+            separator = "| --- | --- |" if rng.random() >= 0.05 else "| --- |"
+            lines.extend(["| Key | Value |", separator])
+            lines.extend(f"| item-{row} | {rng.randint(0, 999)} |" for row in range(rng.randint(1, 6)))
+            lines.append("")
+        if rng.random() < 0.4:
+            language = rng.choice(["bash", "ts", "dart", "json", "yaml", ""])
+            lines.extend([f"```{language}", "echo synthetic", "```", ""])
+
+    if rng.random() < 0.5:
+        lines.extend(["## Cursor Implementation Prompt", "Implement the change.", ""])
+        lines.extend(["## GitHub Copilot Implementation Prompt", "Implement the change.", ""])
+    return "\n".join(lines) + "\n"
+
+
+def generate_corpus(root: Path, count: int, seed: int = 0) -> int:
+    """Write ``count`` synthetic documents under ``root``; returns total bytes."""
+    rng = random.Random(seed)
+    total = 0
+    for number in range(count):
+        path = corpus_path(root, number)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = synthetic_document(rng, root, number, count).encode("utf-8")
+        path.write_bytes(data)
+        total += len(data)
+    return total
+
+
+def peak_rss_so_far_mb() -> float:
+    """High-water RSS of this process and its reaped children since start-up."""
+    scale = 1 if sys.platform == "darwin" else 1024
+    usage = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return round(usage * scale / (1024 * 1024), 1)
+
+
+def current_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def timed(phase: str, files: int, size: int, action: Callable[[], int]) -> dict:
+    start = time.perf_counter()
+    findings = action()
+    seconds = time.perf_counter() - start
+    return {
+        "type": "benchmark",
+        "phase": phase,
+        "files": files,
+        "bytes": size,
+        "seconds": round(seconds, 4),
+        "files_per_sec": round(files / seconds, 1) if seconds else None,
+        "mb_per_sec": round(size / (1024 * 1024) / seconds, 2) if seconds else None,
+        "peak_rss_so_far_mb": peak_rss_so_far_mb(),
+        "findings": findings,
+    }
+
+
+def run_benchmark(
+    root: Path,
+    count: int,
+    seed: int = 0,
+    jobs: int = 1,
+    phases: Optional[List[str]] = None,
+    prefetch: int = 0,
+) -> List[dict]:
+    """Generate a corpus of ``count`` docs under ``root`` and time each phase."""
+    phases = phases or PHASES
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        return _run_phases(root, count, seed, jobs, phases, prefetch, devnull)
+
+
+def _run_phases(
+    root: Path,
+    count: int,
+    seed: int,
+    jobs: int,
+    phases: List[str],
+    prefetch: int,
+    devnull: TextIO,
+) -> List[dict]:
+    size = generate_corpus(root, count, seed)
+    targets = [corpus_path(root, number) for number in range(count)]
+    state: Dict[str, object] = {}
+
+    def silent_logger() -> validator.CheckLogger:
+        # Keeps entries for the summary but discards the JSON-lines stream.
+        return validator.CheckLogger(stream=devnull)
+
+    # "check" and "autofix" make the calls ``main`` makes for a --no-cache
+    # run (without and with --autofix); "check-cached" adds the result cache.
+    def check() -> int:
+        index = validator.PathIndex.build(root)
+        logger = silent_logger()
+        validator.run_checks(
+            targets,
+            root,
+            logger,
+            jobs=jobs,
+            index=index,
+            anchors=validator.AnchorIndex(),
+            prefetch=prefetch,
+        )
+        state.update(index=index, logger=logger)
+        return len(logger.entries)
+
+    def check_cached() -> int:
+        cache = state["cache"]
+        logger = silent_logger()
+        validator.run_checks(
+            targets, root, logger, jobs=jobs, cache=cache, index=state["index"], prefetch=prefetch
+        )
+        return len(logger.entries)
+
+    def report() -> int:
+        logger = state["logger"]
+        stats = validator.IssueStats.from_entries(root, logger.entries)
+        stream = validator.ReportStream(root / "issues.jsonl")
+        for entry in logger.entries:
+            stream.write(
+                entry.path,
+                {
+                    "severity": "error",
+                    "file": str(entry.path),
+                    "line": entry.line,
+                    "check": entry.check,
+                    "message": entry.message,
+                    "fixable": entry.fixable,
+                },
+            )
+        stream.close()
+        summary = {
+            "timestamp": "1970-01-01T00:00:00+00:00Z",
+            "command": "starlist_md_benchmark",
+            "files_scanned": count,
+            "errors": len(logger.entries),
+            "reports_generated": 1,
+            "fixes_applied": False,
+            "stats": stats.as_dict(),
+        }
+        args = argparse.Namespace(autofix=False, dry_run=True, root=root)
+        validator.build_report(
+            root / "report.md",
+            summary,
+            logger.entries,
+            args,
+            issue_log=root / "issues.jsonl",
+            stats=stats,
+        )
+        return len(logger.entries)
+
+    def autofix() -> int:
+        index = validator.PathIndex.build(root)
+        anchors = validator.AnchorIndex()
+        fixer = validator.Autofixer()
+        graph = validator.LinkGraph(root)
+
+        def on_document(doc: validator.ParsedDocument) -> None:
+            fixer.feed(doc)
+            graph.record(doc, index)
+
+        logger = silent_logger()
+        outcomes: list = []
+        validator.run_checks(
+            targets,
+            root,
+            logger,
+            jobs=jobs,
+            index=index,
+            anchors=anchors,
+            outcomes=outcomes,
+            prefetch=prefetch,
+            on_document=on_document,
+        )
+        changed = fixer.commit(targets, logger)
+        graph.refresh(targets, index)
+        for path in changed:
+            anchors.slugs.pop(str(path), None)
+        rechecked = silent_logger()
+        validator.recheck_changed(
+            targets,
+            outcomes,
+            changed,
+            root,
+            rechecked,
+            jobs=jobs,
+            index=index,
+            anchors=anchors,
+            graph=graph,
+            prefetch=prefetch,
+        )
+        return len(rechecked.entries)
+
+    # The cached and report phases reuse the index and findings from "check".
+    results = [timed("check", count, size, check)]
+    if "check-cached" in phases:
+        cache = validator.ResultCache(root / "cache.json")
+        validator.run_checks(targets, root, silent_logger(), cache=cache, index=state["index"])
+        state["cache"] = cache
+        results.append(timed("check-cached", count, size, check_cached))
+    if "report" in phases:
+        results.append(timed("report", count, size, report))
+    if "autofix" in phases:
+        results.append(timed("autofix", count, size, autofix))
+    return [result for result in results if result["phase"] in phases]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="STARLIST Markdown validator benchmark")
+    parser.add_argument(
+        "--docs",
+        type=int,
+        nargs="+",
+        default=[1000],
+        help="Corpus sizes to benchmark (e.g. 1000 10000 100000).",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Corpus generator seed.")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for run_checks.")
+    parser.add_argument(
+        "--prefetch", type=int, default=0, help="Read-ahead depth passed to run_checks."
+    )
+    parser.add_argument(
+        "--phases",
+        nargs="+",
+        choices=PHASES,
+        default=PHASES,
+        help="Phases to time (check always runs first when another phase needs it).",
+    )
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        help="Generate corpora here and keep them (default: a removed temp directory).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Append result lines, tagged with the current commit, to this JSONL file.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    commit = current_commit()
+    for count in args.docs:
+        base = args.workdir or Path(tempfile.mkdtemp(prefix="starlist-md-bench-"))
+        root = (base / f"corpus-{count}").resolve()
+        if root.exists():
+            shutil.rmtree(root)
+        try:
+            results = run_benchmark(
+                root, count, args.seed, args.jobs, args.phases, args.prefetch
+            )
+        finally:
+            if args.workdir is None:
+                shutil.rmtree(base, ignore_errors=True)
+        for result in results:
+            result = {
+                **result,
+                "docs": count,
+                "jobs": args.jobs,
+                "prefetch": args.prefetch,
+                "commit": commit,
+            }
+            line = json.dumps(result, ensure_ascii=False)
+            print(line, flush=True)
+            if args.output:
+                with open(args.output, "a", encoding="utf-8") as handle:
+                    handle.write(line + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,29 @@
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import hashlib
 import json
 import os
 import re
+import select
 import shlex
+import shutil
+import struct
+import subprocess
 import sys
 import tempfile
+import time
+from array import array
+from collections import Counter, deque
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import accumulate, islice
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, TextIO, Tuple
+from urllib.parse import unquote, urlparse
 
 REQUIRED_FRONTMATTER = [
     "source_of_truth",
@@ -123,13 +136,142 @@ GITHUB_COPILOT_PROMPT_KEYWORDS = [
 ]
 
 
+class ForbiddenWordMatcher:
+    """Finds every forbidden term with one regex scan of a whole document.
+
+    Equivalent to running ``re.search(rf"\b{word}\b", line)`` per word and per
+    line: hits are reported once per (line, word) in word-list order. Words
+    that can start at the same offset (one is a prefix of another) are
+    re-checked individually because an alternation only reports one of them.
+    """
+
+    def __init__(self, words: Sequence[str]) -> None:
+        self.words = list(words)
+        unique = sorted(set(self.words), key=len, reverse=True)
+        self.pattern = None
+        if unique:
+            alternation = "|".join(re.escape(word) for word in unique)
+            self.pattern = re.compile(rf"(?=\b({alternation})\b)")
+        self.word_patterns = {
+            word: re.compile(rf"\b{re.escape(word)}\b") for word in unique
+        }
+        self.overlaps = {
+            word: [
+                other
+                for other in unique
+                if other != word and (other.startswith(word) or word.startswith(other))
+            ]
+            for word in unique
+        }
+
+    def find_lines(self, lowered: str) -> List[Tuple[int, str]]:
+        """Return ``(0-based line index, word)`` pairs for ``lowered`` text."""
+        if self.pattern is None:
+            return []
+        hits: Dict[int, set] = {}
+        offsets: Optional[List[int]] = None
+        for match in self.pattern.finditer(lowered):
+            if offsets is None:
+                offsets = list(
+                    accumulate(len(line) for line in lowered.splitlines(keepends=True))
+                )
+            position = match.start()
+            found = hits.setdefault(bisect_right(offsets, position), set())
+            word = match.group(1)
+            found.add(word)
+            for other in self.overlaps[word]:
+                if self.word_patterns[other].match(lowered, position):
+                    found.add(other)
+        return [
+            (idx, word)
+            for idx in sorted(hits)
+            for word in self.words
+            if word in hits[idx]
+        ]
+
+
+FORBIDDEN_WORD_MATCHER = ForbiddenWordMatcher(FORBIDDEN_WORDS)
+
+
+class KeywordGroupMatcher:
+    """Reports which keyword groups occur in lowered text, in one scan.
+
+    Equivalent to ``any(keyword.lower() in lowered for keyword in group)`` per
+    group. Keywords are lowered and de-duplicated, and a keyword containing
+    another keyword of its group is dropped. When every keyword ends with a
+    common suffix, the text is scanned once for that anchor and each hit is
+    tested with ``endswith``; otherwise each keyword falls back to ``in``.
+    """
+
+    def __init__(self, groups: Dict[str, Sequence[str]]) -> None:
+        self.groups: Dict[str, List[str]] = {}
+        for name, keywords in groups.items():
+            lowered = sorted({keyword.lower() for keyword in keywords}, key=len)
+            self.groups[name] = [
+                keyword
+                for idx, keyword in enumerate(lowered)
+                if not any(shorter in keyword for shorter in lowered[:idx])
+            ]
+        reversed_keywords = [
+            keyword[::-1] for keywords in self.groups.values() for keyword in keywords
+        ]
+        self.anchor = os.path.commonprefix(reversed_keywords)[::-1] if reversed_keywords else ""
+
+    def find(self, lowered: str) -> set:
+        if not self.anchor:
+            return {
+                name
+                for name, keywords in self.groups.items()
+                if any(keyword in lowered for keyword in keywords)
+            }
+        found: set = set()
+        pending = {name: keywords for name, keywords in self.groups.items() if keywords}
+        position = lowered.find(self.anchor)
+        while position != -1 and pending:
+            end = position + len(self.anchor)
+            for name, keywords in list(pending.items()):
+                if any(lowered.endswith(keyword, 0, end) for keyword in keywords):
+                    found.add(name)
+                    del pending[name]
+            position = lowered.find(self.anchor, position + 1)
+        return found
+
+
+PROMPT_KEYWORD_MATCHER = KeywordGroupMatcher(
+    {"cursor": CURSOR_PROMPT_KEYWORDS, "copilot": GITHUB_COPILOT_PROMPT_KEYWORDS}
+)
+
+
 def determine_governance(path: Path) -> bool:
     parts_lower = {part.lower() for part in path.parts}
     return "docs" in parts_lower and "ops" in parts_lower
 
+DEFAULT_FLUSH_SIZE = 512
+WATCH_DEBOUNCE_SECONDS = 0.1
+CACHE_VERSION = 1
+DEFAULT_CACHE_PATH = Path(".cache") / "starlist_md_validator.json"
+LINK_GRAPH_VERSION = 3
+DEFAULT_LINK_GRAPH_PATH = Path(".cache") / "starlist_md_links.json"
+
 IMAGE_PATTERN = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
 LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
 HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+)")
+TOC_START_PATTERN = re.compile(r"^##\s+(目次|Table of Contents)")
+TOC_END_PATTERN = re.compile(r"^##\s+")
+TOC_ENTRY_PATTERN = re.compile(r"\[[^\]]+\]\(#([^)]+)\)")
+HTML_ANCHOR_PATTERN = re.compile(r"""<a\s[^>]*?(?:id|name)\s*=\s*["']([^"']+)["']""")
+
+SECTION_RULES = [
+    (re.compile(r"^##\s+(背景|Background)"), "section-background", "背景セクション"),
+    (re.compile(r"^##\s+(要件|Requirements)"), "section-requirements", "要件セクション"),
+    (re.compile(r"^##\s+Runbook"), "section-runbook", "Runbook セクション"),
+    (re.compile(r"^##\s+(更新|Updates)"), "section-update", "更新セクション"),
+    (
+        re.compile(r"^##\s+DoD\s+\(Definition of Done\)"),
+        "section-dod",
+        "DoD (Definition of Done) セクション",
+    ),
+]
 
 
 @dataclass
@@ -141,9 +283,182 @@ class IssueEntry:
     fixable: bool
 
 
-class CheckLogger:
+class IssueStore:
+    """Append-only, column-oriented storage for logged errors.
+
+    Paths, check codes and messages are interned once each; a finding is one
+    slot in four integer columns and a byte column. ``len``, truthiness,
+    slicing, iteration and ``==`` behave like the former ``List[IssueEntry]``,
+    but ``IssueEntry`` objects are only built for the rows asked for, and
+    ``==``, ``rows`` and ``count_by`` read the columns directly.
+    """
+
     def __init__(self) -> None:
-        self.entries: List[IssueEntry] = []
+        self.paths: List[Path] = []
+        self.checks: List[str] = []
+        self.messages: List[str] = []
+        self._ids: Tuple[Dict[str, int], Dict[str, int], Dict[str, int]] = ({}, {}, {})
+        self._file = array("I")
+        self._line = array("i")
+        self._check = array("I")
+        self._message = array("I")
+        self._fixable = bytearray()
+
+    @staticmethod
+    def _intern(ids: Dict[str, int], table: list, key: str, make: Callable = str) -> int:
+        number = ids.get(key)
+        if number is None:
+            number = ids[key] = len(table)
+            table.append(make(key))
+        return number
+
+    def path(self, file: str) -> Path:
+        """The interned ``Path`` for ``file`` (without storing a finding)."""
+        return self.paths[self._intern(self._ids[0], self.paths, file, Path)]
+
+    def append(self, file: str, line: int, check: str, message: str, fixable: bool) -> Path:
+        """Store one finding; returns the interned ``Path`` for ``file``."""
+        file_ids, check_ids, message_ids = self._ids
+        file_id = self._intern(file_ids, self.paths, file, Path)
+        self._file.append(file_id)
+        self._line.append(line)
+        self._check.append(self._intern(check_ids, self.checks, check))
+        self._message.append(self._intern(message_ids, self.messages, message))
+        self._fixable.append(1 if fixable else 0)
+        return self.paths[file_id]
+
+    def __len__(self) -> int:
+        return len(self._line)
+
+    def rows(self, start: int = 0, stop: Optional[int] = None, step: int = 1) -> Iterator[tuple]:
+        """Yield ``(path, line, check, message, fixable)`` tuples straight from the columns."""
+        return self._rows_in(slice(start, stop, step))
+
+    def _rows_in(self, window: slice) -> Iterator[tuple]:
+        paths, checks, messages = self.paths, self.checks, self.messages
+        for file_id, line, check_id, message_id, fixable in zip(
+            self._file[window],
+            self._line[window],
+            self._check[window],
+            self._message[window],
+            self._fixable[window],
+        ):
+            yield paths[file_id], line, checks[check_id], messages[message_id], bool(fixable)
+
+    def __iter__(self) -> Iterator[IssueEntry]:
+        return (IssueEntry(*row) for row in self.rows())
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [IssueEntry(*row) for row in self._rows_in(key)]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("issue index out of range")
+        return IssueEntry(
+            self.paths[self._file[key]],
+            self._line[key],
+            self.checks[self._check[key]],
+            self.messages[self._message[key]],
+            bool(self._fixable[key]),
+        )
+
+    @staticmethod
+    def _same_column(ours: array, our_table: list, theirs: array, their_table: list) -> bool:
+        if our_table == their_table:
+            return ours == theirs
+        return all(our_table[a] == their_table[b] for a, b in zip(ours, theirs))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IssueStore):
+            return (
+                len(self) == len(other)
+                and self._line == other._line
+                and self._fixable == other._fixable
+                and self._same_column(self._check, self.checks, other._check, other.checks)
+                and self._same_column(self._file, self.paths, other._file, other.paths)
+                and self._same_column(self._message, self.messages, other._message, other.messages)
+            )
+        if isinstance(other, list):
+            return len(self) == len(other) and all(
+                type(entry) is IssueEntry
+                and row == (entry.path, entry.line, entry.check, entry.message, entry.fixable)
+                for row, entry in zip(self.rows(), other)
+            )
+        return NotImplemented
+
+    def count_by(self, column: str) -> Counter:
+        """Count findings per ``"file"`` (path string) or ``"check"`` without building rows."""
+        if column == "file":
+            counts = Counter(self._file)
+            return Counter({str(self.paths[number]): count for number, count in counts.items()})
+        counts = Counter(self._check)
+        return Counter({self.checks[number]: count for number, count in counts.items()})
+
+
+PAYLOAD_KEYS = ("severity", "file", "line", "check", "message", "fixable")
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+_encode_json_string = json.encoder.encode_basestring
+
+
+def dumps_payload(payload: dict) -> str:
+    """Serialize a payload exactly like ``json.dumps(payload, ensure_ascii=False)``.
+
+    Plain findings (the six standard keys with str/int/bool values) are
+    formatted directly; anything else goes through a shared encoder.
+    """
+    if len(payload) == len(PAYLOAD_KEYS) and tuple(payload) == PAYLOAD_KEYS:
+        severity = payload["severity"]
+        file = payload["file"]
+        line = payload["line"]
+        check = payload["check"]
+        message = payload["message"]
+        fixable = payload["fixable"]
+        if (
+            type(severity) is str
+            and type(file) is str
+            and type(line) is int
+            and type(check) is str
+            and type(message) is str
+            and type(fixable) is bool
+        ):
+            return (
+                f'{{"severity": {_encode_json_string(severity)}, '
+                f'"file": {_encode_json_string(file)}, '
+                f'"line": {line}, '
+                f'"check": {_encode_json_string(check)}, '
+                f'"message": {_encode_json_string(message)}, '
+                f'"fixable": {"true" if fixable else "false"}}}'
+            )
+    return _JSON_ENCODER.encode(payload)
+
+
+class CheckLogger:
+    """Emits one JSON line per finding and keeps the errors for the summary.
+
+    Lines are buffered and written ``flush_size`` at a time; call ``flush``
+    before printing anything else to stdout so the stream stays ordered.
+    ``max_entries`` caps how many errors are kept in ``entries`` (sinks and
+    ``error_count`` still see every one), so a run that only needs the
+    stream, the aggregates and the first report rows keeps bounded memory.
+    ``stream`` receives the JSON lines instead of standard output (e.g. an
+    ``os.devnull`` handle to discard them).
+    """
+
+    def __init__(
+        self,
+        flush_size: int = 1,
+        max_entries: Optional[int] = None,
+        stream: Optional[TextIO] = None,
+    ) -> None:
+        self.entries = IssueStore()
+        self.stream = stream
+        self.max_entries = max_entries
+        self.error_count = 0
+        self.flush_size = max(1, flush_size)
+        self._pending: List[str] = []
+        # Objects with ``write(path, payload)`` that see every error as it lands.
+        self.sinks: list = []
 
     def log(
         self,
@@ -165,9 +480,31 @@ class CheckLogger:
         }
         if extra:
             payload.update(extra)
-        print(json.dumps(payload, ensure_ascii=False))
-        if severity == "error":
-            self.entries.append(IssueEntry(path, line, check, message, fixable))
+        self.write(payload)
+
+    def write(self, payload: dict) -> None:
+        self._pending.append(dumps_payload(payload))
+        if len(self._pending) >= self.flush_size:
+            self.flush()
+        if payload["severity"] == "error":
+            self.error_count += 1
+            if self.max_entries is None or len(self.entries) < self.max_entries:
+                path = self.entries.append(
+                    payload["file"],
+                    payload["line"],
+                    payload["check"],
+                    payload["message"],
+                    payload["fixable"],
+                )
+            else:
+                path = self.entries.path(payload["file"])
+            for sink in self.sinks:
+                sink.write(path, payload)
+
+    def flush(self) -> None:
+        if self._pending:
+            (self.stream or sys.stdout).write("\n".join(self._pending) + "\n")
+            self._pending.clear()
 
     def error(
         self,
@@ -183,6 +520,17 @@ class CheckLogger:
         self.log("info", path, 0, "autofix", message, False, extra)
 
 
+class RecordingLogger(CheckLogger):
+    """Collects payloads instead of printing them (used by worker processes)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[dict] = []
+
+    def write(self, payload: dict) -> None:
+        self.records.append(payload)
+
+
 def atomic_write(path: Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with tempfile.NamedTemporaryFile(
@@ -194,12 +542,245 @@ def atomic_write(path: Path, content: str) -> None:
     os.replace(tmp.name, path)
 
 
+class BatchWriter:
+    """Stages many ``atomic_write`` calls and commits them as one batch.
+
+    ``write`` only creates a temporary file next to the target. ``commit``
+    fsyncs every staged file, renames them into place and then fsyncs each
+    parent directory once; ``abort`` (or leaving the ``with`` block on an
+    exception) removes the staged files so no target is touched.
+
+    If a rename fails, targets already replaced are restored from backups
+    (hard links, or copies where linking is not possible) and every staged
+    file is removed before the error propagates. Each rename is atomic, but
+    a crash in the middle of ``commit`` can still leave only part of the
+    batch in place.
+    """
+
+    def __init__(self) -> None:
+        self._staged: List[Tuple[Path, str]] = []
+
+    def __enter__(self) -> "BatchWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def open(self, path: Path):
+        """Stage ``path`` and return a writable text handle to its temp file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = tempfile.NamedTemporaryFile("w", encoding="utf-8", delete=False, dir=path.parent)
+        self._staged.append((path, tmp.name))
+        return tmp
+
+    def write(self, path: Path, content: str) -> None:
+        with self.open(path) as tmp:
+            tmp.write(content)
+
+    def commit(self) -> None:
+        try:
+            for _, name in self._staged:
+                fd = os.open(name, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+        except BaseException:
+            self.abort()
+            raise
+        replaced: List[Tuple[Path, Optional[str]]] = []
+        try:
+            for path, name in self._staged:
+                backup = None
+                try:
+                    if os.path.islink(path) or os.path.isfile(path):
+                        backup = name + ".bak"
+                        try:
+                            os.link(path, backup, follow_symlinks=False)
+                        except OSError:
+                            shutil.copy2(path, backup, follow_symlinks=False)
+                    os.replace(name, path)
+                except BaseException:
+                    if backup is not None:
+                        _unlink_quietly(backup)
+                    raise
+                replaced.append((path, backup))
+        except BaseException:
+            for path, backup in reversed(replaced):
+                try:
+                    if backup is None:
+                        os.unlink(path)
+                    else:
+                        os.replace(backup, path)
+                except OSError:
+                    pass
+            self.abort()
+            raise
+        parents = []
+        for path, backup in replaced:
+            if backup is not None:
+                _unlink_quietly(backup)
+            if path.parent not in parents:
+                parents.append(path.parent)
+        self._staged.clear()
+        for parent in parents:
+            try:
+                fd = os.open(parent, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+    def abort(self) -> None:
+        for _, name in self._staged:
+            _unlink_quietly(name)
+        self._staged.clear()
+
+
+def _unlink_quietly(name: str) -> None:
+    try:
+        os.unlink(name)
+    except OSError:
+        pass
+
+
+def content_digest(raw_content: bytes) -> str:
+    return hashlib.blake2b(raw_content, digest_size=16).hexdigest()
+
+
+def rules_fingerprint(rules: Optional["RuleSet"] = None) -> str:
+    """Fingerprint of the rule tables, rule selection and validator source."""
+    tables = {
+        "REQUIRED_FRONTMATTER": REQUIRED_FRONTMATTER,
+        "FORBIDDEN_WORDS": FORBIDDEN_WORDS,
+        "DISALLOWED_EXTERNAL_DOMAINS": DISALLOWED_EXTERNAL_DOMAINS,
+        "MERMAID_KEYWORDS": MERMAID_KEYWORDS,
+        "ALLOWED_CODE_LANGUAGES": sorted(ALLOWED_CODE_LANGUAGES),
+        "TS_LANGUAGE_SET": sorted(TS_LANGUAGE_SET),
+        "DART_LANGUAGE_SET": sorted(DART_LANGUAGE_SET),
+        "FORBIDDEN_FRONTMATTER_VARIATIONS": FORBIDDEN_FRONTMATTER_VARIATIONS,
+        "REQUIRED_SECTIONS": REQUIRED_SECTIONS,
+        "CURSOR_PROMPT_KEYWORDS": CURSOR_PROMPT_KEYWORDS,
+        "GITHUB_COPILOT_PROMPT_KEYWORDS": GITHUB_COPILOT_PROMPT_KEYWORDS,
+    }
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(json.dumps(tables, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+    hasher.update(Path(__file__).read_bytes())
+    if rules is not None and (rules.select or rules.ignore):
+        hasher.update(rules.key.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class ResultCache:
+    """Persistent per-file results keyed by content digest and rule fingerprint.
+
+    Each entry also remembers the existence of every link/image target probed
+    while checking the file (and the anchor fingerprint of documents targeted
+    with ``#section``); a hit is only served while those still match.
+    """
+
+    def __init__(self, path: Path, fingerprint: Optional[str] = None) -> None:
+        self.path = path
+        self.fingerprint = fingerprint or rules_fingerprint()
+        self.entries: Dict[str, dict] = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> "ResultCache":
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self
+        if (
+            isinstance(data, dict)
+            and data.get("version") == CACHE_VERSION
+            and data.get("fingerprint") == self.fingerprint
+        ):
+            self.entries = data.get("files", {})
+        return self
+
+    def lookup(
+        self,
+        path: Path,
+        digest: str,
+        index: Optional[PathIndex] = None,
+        anchors: Optional[AnchorIndex] = None,
+    ) -> Optional[List[dict]]:
+        entry = self.entries.get(str(path))
+        if entry is None or entry["digest"] != digest:
+            self.misses += 1
+            return None
+        exists = index.exists if index is not None else os.path.exists
+        if anchors is None:
+            anchors = AnchorIndex()
+        for target, expected in entry["deps"].items():
+            if target.endswith("#"):
+                current: object = anchors.fingerprint(target[:-1])
+            else:
+                current = exists(target)
+            if current != expected:
+                self.misses += 1
+                return None
+        self.hits += 1
+        return entry["records"]
+
+    def store(
+        self, path: Path, digest: str, records: List[dict], deps: Dict[str, object]
+    ) -> None:
+        self.entries[str(path)] = {"digest": digest, "records": records, "deps": deps}
+        self.dirty = True
+
+    def save(self, writer: Optional[BatchWriter] = None) -> None:
+        if not self.dirty:
+            return
+        live = {key: value for key, value in self.entries.items() if os.path.exists(key)}
+        payload = {
+            "version": CACHE_VERSION,
+            "fingerprint": self.fingerprint,
+            "files": live,
+        }
+        write = writer.write if writer is not None else atomic_write
+        write(self.path, json.dumps(payload, ensure_ascii=False))
+        self.dirty = False
+
+
 def slugify(text: str) -> str:
     normalized = re.sub(r"\s+", "-", text.strip().lower())
     normalized = re.sub(r"[^a-z0-9\-]", "", normalized)
     return normalized.strip("-")
 
 
+# Inline markup reduced to the text GitHub renders for a heading.
+HEADING_MARKUP = (
+    (re.compile(r"\s+#+\s*$"), ""),  # closing hashes
+    (re.compile(r"!\[[^\]]*\]\([^)]*\)"), ""),  # images
+    (re.compile(r"\[([^\]]*)\](?:\([^)]*\)|\[[^\]]*\])"), r"\1"),  # links
+    (re.compile(r"<[^>]*>"), ""),  # inline HTML
+    (re.compile(r"(?<!\w)(__?)(?=\S)(.+?)(?<=\S)\1(?!\w)"), r"\2"),  # _emphasis_
+)
+
+
+def heading_slug(text: str) -> str:
+    """The anchor GitHub generates for a heading (before ``-1`` suffixes).
+
+    Link, image, HTML and emphasis markup is reduced to its text, the rest is
+    lowercased, punctuation other than ``-`` and ``_`` is dropped and every
+    space becomes one hyphen, so ``## [Foo](bar.md)`` gives ``foo`` and
+    ``Foo  Bar`` gives ``foo--bar``.
+    """
+    for pattern, replacement in HEADING_MARKUP:
+        text = pattern.sub(replacement, text)
+    return re.sub(r"[^\w\- ]", "", text.strip().lower()).replace(" ", "-")
+
+
 def balanced_braces(text: str) -> bool:
     stack: List[str] = []
     pairs = {"(": ")", "{": "}", "[": "]"}
@@ -230,6 +811,149 @@ def parse_frontmatter(lines: Sequence[str]) -> Tuple[Optional[dict], Optional[in
     return {}, 0, None
 
 
+class GitIgnore:
+    """The subset of ``.gitignore`` semantics needed to prune target discovery.
+
+    Rules from every ``.gitignore`` met on the way down apply to the paths
+    below it; the last matching rule wins and ``!`` re-includes. Patterns
+    use ``fnmatch``, so ``*`` also matches ``/``. As in git, nothing below an
+    ignored directory is visited, so it cannot be re-included.
+    """
+
+    def __init__(self, rules: Sequence[tuple] = ()) -> None:
+        # (base directory, compiled pattern, negate, dir_only, anchored)
+        self.rules = tuple(rules)
+
+    def child(self, directory: str) -> "GitIgnore":
+        try:
+            with open(os.path.join(directory, ".gitignore"), encoding="utf-8") as handle:
+                lines = handle.read().splitlines()
+        except (OSError, UnicodeDecodeError):
+            return self
+        rules = list(self.rules)
+        for line in lines:
+            pattern = line.rstrip()
+            if not pattern or pattern.startswith("#"):
+                continue
+            negate = pattern.startswith("!")
+            pattern = pattern[1:] if negate else pattern
+            dir_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+            if pattern.startswith("**/") and "/" not in pattern[3:]:
+                pattern = pattern[3:]
+            # A leading or inner slash anchors the pattern to ``directory``.
+            anchored = "/" in pattern
+            compiled = re.compile(fnmatch.translate(pattern.lstrip("/")))
+            rules.append((directory, compiled, negate, dir_only, anchored))
+        return GitIgnore(rules)
+
+    def ignored(self, path: str, name: str, is_dir: bool) -> bool:
+        ignored = False
+        for base, pattern, negate, dir_only, anchored in self.rules:
+            if dir_only and not is_dir:
+                continue
+            subject = path[len(base) + 1 :] if anchored else name
+            if pattern.match(subject.replace(os.sep, "/")):
+                ignored = not negate
+        return ignored
+
+
+def iter_markdown_files(
+    root: Path, globs: Optional[Sequence[str]] = None, gitignore: bool = True
+) -> Iterator[Path]:
+    """Lazily yield ``*.md`` files under ``root`` with an ``os.scandir`` walk.
+
+    ``SKIP_DIRS`` and ``.gitignore``'d directories are pruned before they are
+    entered and symlinked directories are not followed. ``globs`` are
+    ``fnmatch`` patterns against the root-relative POSIX path.
+    """
+    top = str(root)
+    ignore = GitIgnore().child(top) if gitignore else GitIgnore()
+    stack = [(top, ignore)]
+    while stack:
+        current, ignore = stack.pop()
+        try:
+            with os.scandir(current) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir() and not entry.is_symlink()
+                if is_dir:
+                    if entry.name not in SKIP_DIRS and not ignore.ignored(
+                        entry.path, entry.name, True
+                    ):
+                        subdirs.append(entry.path)
+                    continue
+                if not entry.name.endswith(".md") or not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            if ignore.ignored(entry.path, entry.name, False):
+                continue
+            if globs:
+                relative = os.path.relpath(entry.path, top).replace(os.sep, "/")
+                if not any(fnmatch.fnmatchcase(relative, pattern) for pattern in globs):
+                    continue
+            yield Path(entry.path)
+        for subdir in reversed(subdirs):
+            stack.append((subdir, ignore.child(subdir) if gitignore else ignore))
+
+
+class TargetFilter:
+    """Per-path form of ``iter_markdown_files`` for files that appear later.
+
+    A path is admitted when ``iter_markdown_files(root, globs, gitignore)``
+    would yield it: a ``.md`` file whose directories are neither in
+    ``SKIP_DIRS`` nor ``.gitignore``'d, that is not ignored itself and that
+    matches ``globs``. Rules are memoized per directory; call ``reset`` when
+    a ``.gitignore`` changes.
+    """
+
+    def __init__(
+        self, root: Path, globs: Optional[Sequence[str]] = None, gitignore: bool = True
+    ) -> None:
+        self.root = str(root)
+        self.globs = globs
+        self.gitignore = gitignore
+        self._rules: Dict[str, Optional[GitIgnore]] = {}
+
+    def reset(self) -> None:
+        self._rules.clear()
+
+    def rules(self, directory: str) -> Optional[GitIgnore]:
+        """Rules in force inside ``directory``, or None when it is pruned."""
+        if directory in self._rules:
+            return self._rules[directory]
+        if directory == self.root:
+            rules: Optional[GitIgnore] = GitIgnore()
+            if self.gitignore:
+                rules = rules.child(directory)
+        else:
+            parent, name = os.path.split(directory)
+            up = self.rules(parent) if parent != directory and parent.startswith(self.root) else None
+            if up is None or name in SKIP_DIRS or up.ignored(directory, name, True):
+                rules = None
+            else:
+                rules = up.child(directory) if self.gitignore else up
+        self._rules[directory] = rules
+        return rules
+
+    def __call__(self, path: Path) -> bool:
+        name = path.name
+        if not name.endswith(".md"):
+            return False
+        rules = self.rules(str(path.parent))
+        if rules is None or rules.ignored(str(path), name, False):
+            return False
+        if self.globs:
+            relative = os.path.relpath(path, self.root).replace(os.sep, "/")
+            return any(fnmatch.fnmatchcase(relative, pattern) for pattern in self.globs)
+        return True
+
+
 def collect_targets(args: argparse.Namespace, root: Path) -> List[Path]:
     raw_paths: List[Path] = []
     if args.stdin_0:
@@ -248,12 +972,14 @@ def collect_targets(args: argparse.Namespace, root: Path) -> List[Path]:
             continue
         if candidate.is_file():
             normalized.append(candidate)
-    normalized = sorted(set(normalized))
-    if not normalized:
-        # If no paths provided, scan all .md files recursively
-        for md_file in root.rglob("*.md"):
-            if not any(part in SKIP_DIRS for part in md_file.parts):
-                normalized.append(md_file)
+    globs = getattr(args, "glob", None)
+    if getattr(args, "all", False) or globs:
+        normalized.extend(iter_markdown_files(root, globs))
+    elif not normalized:
+        if getattr(args, "no_discover", False):
+            raise SystemExit("No markdown targets were provided.")
+        # Fallback when no existing explicit paths are given: scan the tree.
+        normalized.extend(iter_markdown_files(root))
     normalized = sorted(set(normalized))
     if not normalized:
         raise SystemExit("No markdown targets were found.")
@@ -273,14 +999,6 @@ def extract_headings(lines: Sequence[str]) -> List[Tuple[int, int, str]]:
     return captured
 
 
-def find_heading_line(lines: Sequence[str], pattern: str) -> Optional[int]:
-    compiled = re.compile(pattern)
-    for idx, line in enumerate(lines):
-        if compiled.match(line):
-            return idx + 1
-    return None
-
-
 def parse_toc(lines: Sequence[str]) -> Optional[List[str]]:
     start = None
     for idx, line in enumerate(lines):
@@ -299,427 +1017,1763 @@ def parse_toc(lines: Sequence[str]) -> Optional[List[str]]:
     return entries
 
 
-def run_checks(
-    targets: Iterable[Path], root: Path, logger: CheckLogger
-) -> int:
-    scanned = 0
-    for path in targets:
-        if not path.exists():
-            continue
-        # Check for BOM
-        with open(path, 'rb') as f:
-            raw_content = f.read()
-        if raw_content.startswith(b'\xef\xbb\xbf'):
-            logger.error(
-                path,
-                1,
-                "bom-detected",
-                "File contains BOM (Byte Order Mark) at the beginning.",
-            )
-        content = raw_content.decode("utf-8", errors="replace")
-        lines = content.splitlines()
+class PathIndex:
+    """Run-scoped snapshot of the tree used for link and image existence checks.
 
-        # Check for empty file
-        if not content.strip():
-            logger.error(
-                path,
-                1,
-                "empty-file",
-                "File is empty or contains only whitespace.",
-            )
-        scanned += 1
+    ``build`` walks ``root`` once with ``os.scandir`` (pruning ``SKIP_DIRS``
+    and never following symlinks). Lookups whose parent directory was walked
+    are answered from memory; anything else (pruned trees, symlinks, paths
+    outside the root) falls back to ``Path.resolve`` and ``exists``. Results
+    are memoized per (directory, target), and the index pickles cheaply for
+    worker processes. Long-lived callers apply change events with ``update``
+    instead of rebuilding.
+    """
 
-        frontmatter, fm_start, fm_end = parse_frontmatter(lines)
-        governed = determine_governance(path)
-        if governed:
-            if frontmatter is None:
-                logger.error(
-                    path,
-                    1,
-                    "frontmatter-missing",
-                    "Frontmatter block missing or malformed (requires --- at start).",
-                    fixable=True,
-                )
-            elif fm_end is None:
-                logger.error(
-                    path,
-                    1,
-                    "frontmatter-unclosed",
-                    "Frontmatter block opened but never closed with ---.",
-                    fixable=True,
-                )
-            else:
-                for key in REQUIRED_FRONTMATTER:
-                    if key not in frontmatter:
-                        logger.error(
-                            path,
-                            1,
-                            f"frontmatter-missing-{key}",
-                            f"Frontmatter lacks `{key}`.",
-                            fixable=True,
-                        )
-                source_val = frontmatter.get("source_of_truth", "").lower()
-                if source_val not in {"true", "True", "TRUE"}:
-                    logger.error(
-                        path,
-                        1,
-                        "frontmatter-source",
-                        "`source_of_truth` must be `true`.",
-                        fixable=True,
-                    )
-                version_val = frontmatter.get("version", "")
-                if version_val and not re.match(r"^\d+\.\d+\.\d+(-[\w\.]+)?$", version_val):
-                    logger.error(
-                        path,
-                        1,
-                        "frontmatter-version",
-                        "`version` must follow `x.y.z` semantic versioning.",
-                    )
-                updated_val = frontmatter.get("updated_date", "")
-                if updated_val:
-                    try:
-                        datetime.strptime(updated_val, "%Y-%m-%d")
-                    except ValueError:
-                        logger.error(
-                            path,
-                            1,
-                            "frontmatter-updated-date",
-                            "`updated_date` must use `YYYY-MM-DD` format.",
-                        )
-                owner_val = frontmatter.get("owner", "")
-                if owner_val == "":
-                    logger.error(
-                        path,
-                        1,
-                        "frontmatter-owner",
-                        "`owner` must reference a responsible owner team.",
-                    )
+    def __init__(self, root: Path) -> None:
+        self.root = str(root)
+        self.dirs: set = set()
+        self.entries: set = set()
+        self.symlinks: set = set()
+        self._located: Dict[Tuple[str, str], Tuple[Path, bool]] = {}
 
-                # Check for forbidden frontmatter key variations
-                for variation in FORBIDDEN_FRONTMATTER_VARIATIONS:
-                    if variation in frontmatter:
-                        logger.error(
-                            path,
-                            1,
-                            "frontmatter-variation",
-                            f"Forbidden frontmatter key variation: `{variation}` (use `source_of_truth` instead).",
-                        )
+    @classmethod
+    def build(cls, root: Path) -> "PathIndex":
+        index = cls(root)
+        index._walk(index.root, set())
+        return index
 
-        if governed:
-            # section checks
-            sections = [
-                (r"^##\s+(背景|Background)", "section-background", "背景セクション"),
-                (r"^##\s+(要件|Requirements)", "section-requirements", "要件セクション"),
-                (r"^##\s+Runbook", "section-runbook", "Runbook セクション"),
-                (r"^##\s+(更新|Updates)", "section-update", "更新セクション"),
-                (
-                    r"^##\s+DoD\s+\(Definition of Done\)",
-                    "section-dod",
-                    "DoD (Definition of Done) セクション",
-                ),
-            ]
-            for pattern, code, label in sections:
-                if not find_heading_line(lines, pattern):
-                    logger.error(
-                        path,
-                        1,
-                        code,
-                        f"Missing required section: {label}.",
-                        fixable=True if code == "section-dod" else False,
-                    )
+    def _walk(self, top: str, added: set) -> None:
+        stack = [top]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as iterator:
+                    for entry in iterator:
+                        self.entries.add(entry.path)
+                        added.add(entry.path)
+                        if entry.is_symlink():
+                            self.symlinks.add(entry.path)
+                        elif entry.is_dir() and entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+            except OSError:
+                continue
+            self.dirs.add(current)
 
-            headings = extract_headings(lines)
-            if not headings:
-                logger.error(
-                    path,
-                    1,
-                    "heading-none",
-                    "Document does not use Markdown headings.",
-                )
-            else:
-                h1s = [entry for entry in headings if entry[1] == 1]
-                if len(h1s) > 1:
-                    logger.error(
-                        path,
-                        h1s[1][0],
-                        "heading-h1-duplicate",
-                        "Document must contain at most one H1.",
-                    )
-                last_level = 0
-                for line_no, level, text in headings:
-                    if last_level and level - last_level > 1:
-                        logger.error(
-                            path,
-                            line_no,
-                            "heading-order",
-                            "Heading levels must increase by at most one.",
-                        )
-                    last_level = level
+    def _forget(self, path: str, removed: set) -> None:
+        if path in self.entries:
+            removed.add(path)
+        self.entries.discard(path)
+        self.symlinks.discard(path)
+        if path in self.dirs:
+            prefix = path + os.sep
+            below = {entry for entry in self.entries if entry.startswith(prefix)}
+            removed |= below
+            self.entries -= below
+            self.symlinks -= below
+            self.dirs = {d for d in self.dirs if d != path and not d.startswith(prefix)}
 
-            toc_entries = parse_toc(lines)
-            if toc_entries is None:
-                logger.error(
-                    path,
-                    1,
-                    "toc-missing",
-                    "Table of Contents (目次) is required.",
-                )
-            else:
-                toc_set = set(toc_entries)
-                for line_no, level, text in headings:
-                    if level in {2, 3}:
-                        candidate = slugify(text)
-                        if candidate and candidate not in toc_set:
-                            logger.error(
-                                path,
-                                line_no,
-                                "toc-missing-entry",
-                                f"Heading `{text}` is missing from ToC.",
-                            )
-
-        # Mermaid validations
-        in_mermaid = False
-        block_start = 0
-        block_lines: List[str] = []
-        for idx, raw in enumerate(lines):
-            stripped = raw.strip()
-            if stripped.startswith("```mermaid"):
-                in_mermaid = True
-                block_start = idx + 1
-                block_lines = []
+    def update(self, paths: Iterable[str]) -> set:
+        """Re-examine changed ``paths`` and return every entry added or removed.
+
+        Each path is re-read on its own; when one of its directories is new,
+        gone or was never walked, the highest such directory is re-walked
+        instead, so only the changed part of the tree is scanned.
+        """
+        self._located.clear()
+        tops = set()
+        for path in paths:
+            path = os.path.normpath(path)
+            if not path.startswith(self.root + os.sep):
                 continue
-            if in_mermaid:
-                if stripped.startswith("```"):
-                    if not block_lines:
-                        logger.error(
-                            path,
-                            block_start,
-                            "mermaid-empty",
-                            "Mermaid block must include content.",
-                        )
-                    block_text = "\n".join(block_lines).lower()
-                    if not any(keyword in block_text for keyword in MERMAID_KEYWORDS):
-                        logger.error(
-                            path,
-                            block_start,
-                            "mermaid-keyword",
-                            "Mermaid block lacks a diagram keyword.",
-                        )
-                    in_mermaid = False
-                else:
-                    block_lines.append(raw)
-        if in_mermaid:
-            logger.error(
-                path,
-                block_start,
-                "mermaid-unclosed",
-                "Mermaid block requires closing ``` marker.",
-            )
+            top, parent = path, os.path.dirname(path)
+            while parent != self.root and (
+                parent not in self.dirs or not os.path.isdir(parent) or os.path.islink(parent)
+            ):
+                top, parent = parent, os.path.dirname(parent)
+            tops.add(top)
+        touched: set = set()
+        for top in tops:
+            parent = os.path.dirname(top)
+            while parent != self.root and parent not in tops:
+                parent = os.path.dirname(parent)
+            if parent in tops:
+                continue  # re-walked with its changed ancestor
+            self._forget(top, touched)
+            if not os.path.lexists(top):
+                continue
+            self.entries.add(top)
+            touched.add(top)
+            if os.path.islink(top):
+                self.symlinks.add(top)
+            elif os.path.isdir(top) and os.path.basename(top) not in SKIP_DIRS:
+                self._walk(top, touched)
+        return touched
 
-        # Check mermaid block count consistency
-        mermaid_blocks = []
-        for idx, line in enumerate(lines):
-            if line.strip() == "```mermaid":
-                mermaid_blocks.append({"start": idx + 1, "end": None})
-            elif line.strip() == "```" and mermaid_blocks and mermaid_blocks[-1]["end"] is None:
-                mermaid_blocks[-1]["end"] = idx + 1
-
-        mermaid_start_count = len([b for b in mermaid_blocks if b["start"] is not None])
-        mermaid_end_count = len([b for b in mermaid_blocks if b["end"] is not None])
-        if mermaid_start_count != mermaid_end_count:
-            logger.error(
-                path,
-                1,
-                "mermaid-count-mismatch",
-                f"Mermaid block count mismatch: {mermaid_start_count} starts, {mermaid_end_count} ends.",
-            )
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_located"] = {}
+        return state
 
-        # Link and image validation
-        for idx, line in enumerate(lines):
-            for match in IMAGE_PATTERN.finditer(line):
-                alt_text, target = match.groups()
-                if not alt_text.strip():
-                    logger.error(
-                        path,
-                        idx + 1,
-                        "image-alt-empty",
-                        "Image alt text should be descriptive.",
-                    )
-                target = target.split("#", 1)[0].split("?", 1)[0]
-                if not target:
-                    logger.error(
-                        path,
-                        idx + 1,
-                        "image-target-empty",
-                        "Image link must include a target path.",
-                    )
-                    continue
-                if target.startswith("http"):
-                    continue
-                candidate = (path.parent / target).resolve()
-                if not candidate.exists():
-                    logger.error(
-                        path,
-                        idx + 1,
-                        "image-missing",
-                        f"Referenced image `{target}` does not exist.",
-                    )
+    def markdown_files(self) -> List[Path]:
+        return sorted(
+            Path(entry)
+            for entry in self.entries
+            if entry.endswith(".md")
+            and entry not in self.symlinks
+            and os.path.dirname(entry) in self.dirs
+            and entry not in self.dirs
+        )
+
+    def exists(self, candidate: str) -> bool:
+        if os.path.dirname(candidate) in self.dirs and candidate not in self.symlinks:
+            return candidate in self.entries
+        return os.path.exists(candidate)
+
+    def locate(self, base_dir: str, target: str) -> Tuple[Path, bool]:
+        """Resolve ``target`` against ``base_dir`` like ``Path.resolve()``."""
+        key = (base_dir, target)
+        located = self._located.get(key)
+        if located is None:
+            located = self._locate(base_dir, target)
+            self._located[key] = located
+        return located
+
+    def _locate(self, base_dir: str, target: str) -> Tuple[Path, bool]:
+        if base_dir in self.dirs and not _has_inner_parent_ref(target):
+            # Walked directories contain no symlinks, so a lexical join is
+            # exact as long as the final component is not a symlink either.
+            candidate = os.path.normpath(os.path.join(base_dir, target))
+            if os.path.dirname(candidate) in self.dirs and candidate not in self.symlinks:
+                return Path(candidate), candidate in self.entries
+        resolved = (Path(base_dir) / target).resolve()
+        return resolved, resolved.exists()
+
+
+def _has_inner_parent_ref(target: str) -> bool:
+    """True when ``..`` follows a named component (e.g. ``dir/../x``)."""
+    seen_name = False
+    for part in target.split("/"):
+        if part == "..":
+            if seen_name:
+                return True
+        elif part not in ("", "."):
+            seen_name = True
+    return False
+
+
+SCAN_PARTS = frozenset({"headings", "fences", "links", "tables", "toc"})
+
+
+@dataclass
+class LineScan:
+    """Structural tokens gathered in a single pass over a document."""
+
+    headings: List[Tuple[int, int, str]]
+    # (0-based index, stripped line) for every line opening or closing a fence
+    fences: List[Tuple[int, str]]
+    # 0-based indexes of lines that may contain `[text](target)` links
+    link_lines: List[int]
+    # 0-based indexes of table header candidates (`|` row followed by a `-` row)
+    table_rows: List[int]
+    toc_entries: Optional[List[str]]
+
+
+def scan_lines(lines: Sequence[str], parts: Optional[frozenset] = None) -> LineScan:
+    """Classify every line once: headings, fences, link lines, tables and ToC.
+
+    Produces the same headings as ``extract_headings`` and the same entries as
+    ``parse_toc`` so the checks never walk ``lines`` again. ``parts`` limits
+    the work to a subset of ``SCAN_PARTS``; skipped parts come back empty.
+    """
+    if parts is None:
+        parts = SCAN_PARTS
+    want_toc = "toc" in parts
+    want_headings = "headings" in parts
+    want_fences = "fences" in parts
+    want_links = "links" in parts
+    want_tables = "tables" in parts
+    headings: List[Tuple[int, int, str]] = []
+    fences: List[Tuple[int, str]] = []
+    link_lines: List[int] = []
+    table_rows: List[int] = []
+    toc_entries: Optional[List[str]] = None
+    in_toc = False
+    previous_has_pipe = False
+    for idx, line in enumerate(lines):
+        if not want_toc:
+            pass
+        elif in_toc:
+            if line[:2] == "##" and TOC_END_PATTERN.match(line):
+                in_toc = False
+            elif "](#" in line:
+                toc_match = TOC_ENTRY_PATTERN.search(line)
+                if toc_match:
+                    toc_entries.append(slugify(toc_match.group(1)))  # type: ignore[union-attr]
+        elif toc_entries is None and line[:2] == "##" and TOC_START_PATTERN.match(line):
+            toc_entries = []
+            in_toc = True
+        if want_headings and line[:1] == "#":
+            match = HEADING_PATTERN.match(line)
+            if match:
+                text = match.group(2).strip()
+                if text:
+                    headings.append((idx + 1, len(match.group(1)), text))
+        if want_fences and "```" in line:
+            stripped = line.strip()
+            if stripped.startswith("```"):
+                fences.append((idx, stripped))
+        if want_links and "](" in line:
+            link_lines.append(idx)
+        if want_tables:
+            if previous_has_pipe and "-" in line:
+                table_rows.append(idx - 1)
+            previous_has_pipe = "|" in line
+    return LineScan(headings, fences, link_lines, table_rows, toc_entries)
+
+
+class ParsedDocument:
+    """One document and the structure parsed from it, computed on first use.
+
+    ``content``, ``lines``, ``frontmatter``, ``scan`` and ``lowered`` are
+    memoized properties, so every rule and fixer touching the same document
+    shares one decode and one parse. ``scan_parts`` limits ``scan_lines`` to
+    the parts the active rules need. Pickling keeps only the source (raw
+    bytes or text), so documents ship cheaply to worker processes.
+    """
+
+    __slots__ = (
+        "path",
+        "scan_parts",
+        "_raw",
+        "_content",
+        "_lines",
+        "_frontmatter",
+        "_scan",
+        "_lowered",
+    )
+
+    def __init__(
+        self,
+        path: Path,
+        raw_content: Optional[bytes] = None,
+        content: Optional[str] = None,
+        scan_parts: Optional[frozenset] = None,
+    ) -> None:
+        self.path = path
+        self.scan_parts = scan_parts
+        self._raw = raw_content
+        self._content = content
+        self._lines: Optional[List[str]] = None
+        self._frontmatter: Optional[Tuple[Optional[dict], Optional[int], Optional[int]]] = None
+        self._scan: Optional[LineScan] = None
+        self._lowered: Optional[str] = None
+
+    @classmethod
+    def from_text(cls, path: Path, text: str) -> "ParsedDocument":
+        return cls(path, content=text)
+
+    def __getstate__(self) -> tuple:
+        content = self._content if self._raw is None else None
+        return (self.path, self.scan_parts, self._raw, content)
+
+    def __setstate__(self, state: tuple) -> None:
+        path, scan_parts, raw_content, content = state
+        ParsedDocument.__init__(self, path, raw_content, content, scan_parts)
+
+    @property
+    def raw_content(self) -> bytes:
+        if self._raw is None:
+            self._raw = (self._content or "").encode("utf-8")
+        return self._raw
+
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            self._content = (self._raw or b"").decode("utf-8", errors="replace")
+        return self._content
+
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = self.content.splitlines()
+        return self._lines
+
+    @property
+    def frontmatter(self) -> Tuple[Optional[dict], Optional[int], Optional[int]]:
+        if self._frontmatter is None:
+            self._frontmatter = parse_frontmatter(self.lines)
+        return self._frontmatter
+
+    @property
+    def scan(self) -> LineScan:
+        if self._scan is None:
+            self._scan = scan_lines(self.lines, self.scan_parts)
+        return self._scan
+
+    @property
+    def headings(self) -> List[Tuple[int, int, str]]:
+        return self.scan.headings
+
+    @property
+    def lowered(self) -> str:
+        if self._lowered is None:
+            self._lowered = self.content.lower()
+        return self._lowered
+
+
+def extract_links(lines: Sequence[str]) -> List[Tuple[str, str]]:
+    """Relative ``(target, anchor)`` pairs for links and images (``?`` dropped)."""
+    links: List[Tuple[str, str]] = []
+    for line in lines:
+        if "](" not in line:
+            continue
+        for match in IMAGE_PATTERN.finditer(line):
+            target = match.group(2).split("#", 1)[0].split("?", 1)[0]
+            if target and not target.startswith("http"):
+                links.append((target, ""))
+        for match in LINK_PATTERN.finditer(line):
+            target = match.group(2).strip()
+            if target.startswith(("http://", "https://", "mailto:", "#", "tel:")):
+                continue
+            target, _, anchor = target.partition("#")
+            if target:
+                links.append((target, anchor))
+    return links
+
+
+class LinkGraph:
+    """Persistent document -> (resolved target, anchor) graph of the docs tree.
+
+    Entries are stamped with the document's ``(mtime_ns, size)``; ``refresh``
+    only re-reads documents whose stamp changed, so the graph answers
+    dependent and orphan queries without reparsing the whole tree.
+    """
+
+    def __init__(self, root: Path, path: Optional[Path] = None) -> None:
+        self.root = str(root)
+        self.path = path
+        self.docs: Dict[str, dict] = {}
+        self.dirty = False
+        self._reverse: Optional[Dict[str, set]] = None
+
+    def load(self) -> "LinkGraph":
+        if self.path is None:
+            return self
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self
+        if (
+            isinstance(data, dict)
+            and data.get("version") == LINK_GRAPH_VERSION
+            and data.get("root") == self.root
+        ):
+            self.docs = data.get("docs", {})
+        return self
+
+    def save(self, writer: Optional[BatchWriter] = None) -> None:
+        if self.path is None or not self.dirty:
+            return
+        payload = {"version": LINK_GRAPH_VERSION, "root": self.root, "docs": self.docs}
+        write = writer.write if writer is not None else atomic_write
+        write(self.path, json.dumps(payload, ensure_ascii=False))
+        self.dirty = False
+
+    def refresh(self, docs: Iterable[Path], index: PathIndex) -> "LinkGraph":
+        live = set()
+        for doc in docs:
+            live.add(str(doc))
+            self._refresh_doc(doc, index)
+        for key in list(self.docs):
+            if key not in live:
+                self._drop(key)
+        return self
+
+    def refresh_paths(self, paths: Iterable[str], index: PathIndex) -> List[str]:
+        """Refresh only ``paths`` (as returned by ``PathIndex.update``).
+
+        Paths that are no longer indexed Markdown documents are dropped.
+        Returns the documents whose entry was added, changed or dropped.
+        """
+        touched = []
+        for key in paths:
+            before = self.docs.get(key)
+            if (
+                key.endswith(".md")
+                and key in index.entries
+                and os.path.dirname(key) in index.dirs
+                and key not in index.dirs
+                and key not in index.symlinks
+            ):
+                self._refresh_doc(Path(key), index)
+            elif before is not None:
+                self._drop(key)
+            if self.docs.get(key) is not before:
+                touched.append(key)
+        return touched
+
+    def _refresh_doc(self, doc: Path, index: PathIndex) -> None:
+        key = str(doc)
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        entry = self.docs.get(key)
+        if entry is not None and entry["stamp"] == stamp:
+            return
+        raw_content = _read_target(doc)
+        if raw_content is None:
+            return
+        lines = raw_content.decode("utf-8", errors="replace").splitlines()
+        self.update(doc, stamp, lines, index)
+
+    def _drop(self, key: str) -> None:
+        del self.docs[key]
+        self.dirty = True
+        self._reverse = None
+
+    def update(
+        self, doc: Path, stamp: List[int], lines: Sequence[str], index: PathIndex
+    ) -> None:
+        base_dir = str(doc.parent)
+        edges = dict.fromkeys(
+            (str(index.locate(base_dir, target)[0]), anchor)
+            for target, anchor in extract_links(lines)
+        )
+        links = [list(edge) for edge in edges]
+        self.docs[str(doc)] = {
+            "stamp": stamp,
+            "links": links,
+            "anchors": heading_anchors(lines),
+        }
+        self.dirty = True
+        self._reverse = None
+
+    def record(self, doc: ParsedDocument, index: PathIndex) -> None:
+        """Add a document that was already read and parsed elsewhere."""
+        try:
+            stat = os.stat(doc.path)
+        except OSError:
+            return
+        self.update(doc.path, [stat.st_mtime_ns, stat.st_size], doc.lines, index)
+
+    def reverse(self) -> Dict[str, set]:
+        if self._reverse is None:
+            reverse: Dict[str, set] = {}
+            for doc, entry in self.docs.items():
+                for target, _ in entry["links"]:
+                    reverse.setdefault(target, set()).add(doc)
+            self._reverse = reverse
+        return self._reverse
+
+    def dependents(self, targets: Iterable[str]) -> set:
+        """Documents linking to any of ``targets`` (resolved path strings)."""
+        reverse = self.reverse()
+        found = set()
+        for target in targets:
+            found.update(reverse.get(target, ()))
+        return found
+
+    def orphans(self) -> List[str]:
+        """Documents that no other document links to."""
+        reverse = self.reverse()
+        return sorted(
+            doc for doc in self.docs if not reverse.get(doc, set()) - {doc}
+        )
+
+
+def heading_anchors(lines: Sequence[str]) -> List[str]:
+    """Anchor slugs a document exposes: headings (with -1, -2 duplicate
+    suffixes) plus explicit ``<a id=...>`` / ``<a name=...>`` targets."""
+    anchors: List[str] = []
+    seen: Dict[str, int] = {}
+    for _, _, text in extract_headings(lines):
+        slug = heading_slug(text)
+        if not slug:
+            continue
+        count = seen.get(slug, 0)
+        seen[slug] = count + 1
+        anchors.append(slug if count == 0 else f"{slug}-{count}")
+    for line in lines:
+        if "<a" not in line:
+            continue
+        for match in HTML_ANCHOR_PATTERN.finditer(line):
+            slug = heading_slug(match.group(1))
+            if slug:
+                anchors.append(slug)
+    return anchors
+
+
+class AnchorIndex:
+    """Per-document anchor slug sets, seeded from the link graph.
+
+    Documents missing from the graph (pruned trees, paths outside the root)
+    are read once on demand and memoized for the rest of the run.
+    """
+
+    def __init__(self, slugs: Optional[Dict[str, frozenset]] = None) -> None:
+        self.slugs: Dict[str, Optional[frozenset]] = dict(slugs or {})
+
+    @classmethod
+    def from_graph(cls, graph: LinkGraph) -> "AnchorIndex":
+        return cls(
+            {doc: frozenset(entry["anchors"]) for doc, entry in graph.docs.items()}
+        )
+
+    def lookup(self, doc: str) -> Optional[frozenset]:
+        if doc not in self.slugs:
+            raw_content = _read_target(Path(doc))
+            if raw_content is None:
+                self.slugs[doc] = None
+            else:
+                lines = raw_content.decode("utf-8", errors="replace").splitlines()
+                self.slugs[doc] = frozenset(heading_anchors(lines))
+        return self.slugs[doc]
+
+    def fingerprint(self, doc: str) -> Optional[str]:
+        known = self.lookup(doc)
+        if known is None:
+            return None
+        return content_digest("\n".join(sorted(known)).encode("utf-8"))
+
+
+def git_changed_paths(root: Path, rev: str) -> List[Path]:
+    """Paths added, modified or deleted since ``rev`` (including untracked files)."""
+    commands = [
+        ["git", "diff", "--name-only", "-z", "--no-renames", rev, "--"],
+        ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+    ]
+    try:
+        toplevel = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            cwd=root,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        outputs = [
+            subprocess.run(
+                command, cwd=toplevel, check=True, capture_output=True
+            ).stdout
+            for command in commands
+        ]
+    except (OSError, subprocess.CalledProcessError) as exc:
+        detail = getattr(exc, "stderr", b"") or b""
+        if isinstance(detail, bytes):
+            detail = detail.decode("utf-8", errors="replace")
+        raise SystemExit(f"Unable to compute changes since `{rev}`: {detail.strip() or exc}")
+    changed = set()
+    for output in outputs:
+        for chunk in output.split(b"\x00"):
+            if chunk:
+                changed.add(Path(toplevel) / chunk.decode("utf-8", errors="ignore"))
+    return sorted(changed)
+
+
+def collect_since_targets(
+    root: Path, rev: str, index: PathIndex, graph: Optional[LinkGraph] = None
+) -> List[Path]:
+    """Changed Markdown files plus every document linking to a changed path.
+
+    A link's verdict only depends on whether its target exists, so expanding
+    the changed set (and the changed paths' parent directories, which may
+    have appeared or vanished) through the reverse link graph re-checks
+    exactly the documents whose findings can differ from the last run.
+    """
+    changed = git_changed_paths(root, rev)
+    keys = set()
+    for path in changed:
+        keys.add(str(path))
+        keys.update(str(parent) for parent in path.parents)
+    if graph is None:
+        graph = LinkGraph(root)
+    graph.refresh(index.markdown_files(), index)
+    affected = set()
+    for path in changed:
+        if path.suffix == ".md" and path.is_file() and not any(
+            part in SKIP_DIRS for part in path.parts
+        ):
+            affected.add(path)
+    affected.update(Path(doc) for doc in graph.dependents(keys))
+    return sorted(affected)
+
+
+class RuleProfiler:
+    """Cumulative wall/CPU time and invocation counts per rule and per file.
+
+    ``check_file`` calls ``begin`` when it starts a file, ``lap(rule)`` after
+    each rule group (charging the time since the previous lap to ``rule``)
+    and ``end`` once the file is done. With ``trace`` set every lap is also
+    kept as a Chrome trace event, which speedscope can open as well.
+    """
+
+    def __init__(self, trace: bool = False) -> None:
+        self.rules: Dict[str, List[float]] = {}
+        self.files: Dict[str, List[float]] = {}
+        self.events: Optional[List[dict]] = [] if trace else None
+        self._origin = time.perf_counter()
+        self._file = ""
+        self._file_wall = self._wall = 0.0
+        self._file_cpu = self._cpu = 0.0
+
+    def begin(self, path: Path) -> None:
+        self._file = str(path)
+        self._file_wall = self._wall = time.perf_counter()
+        self._file_cpu = self._cpu = time.process_time()
+
+    def lap(self, rule: str) -> None:
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        totals = self.rules.get(rule)
+        if totals is None:
+            totals = self.rules[rule] = [0, 0.0, 0.0]
+        totals[0] += 1
+        totals[1] += wall - self._wall
+        totals[2] += cpu - self._cpu
+        if self.events is not None:
+            self.events.append(self._event(rule, "rule", self._wall, wall))
+        self._wall = wall
+        self._cpu = cpu
+
+    def end(self) -> None:
+        totals = self.files.setdefault(self._file, [0.0, 0.0])
+        totals[0] += self._wall - self._file_wall
+        totals[1] += self._cpu - self._file_cpu
+        if self.events is not None:
+            self.events.append(self._event(self._file, "file", self._file_wall, self._wall))
+
+    def _event(self, name: str, category: str, start: float, stop: float) -> dict:
+        return {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - self._origin) * 1e6, 1),
+            "dur": round((stop - start) * 1e6, 1),
+            "pid": 1,
+            "tid": 1,
+            "args": {"file": self._file},
+        }
+
+    def summary(self, limit: int = 20) -> dict:
+        rules = sorted(self.rules.items(), key=lambda item: -item[1][1])
+        files = sorted(self.files.items(), key=lambda item: -item[1][0])[:limit]
+        return {
+            "type": "profile",
+            "files_profiled": len(self.files),
+            "rules": {
+                rule: {
+                    "calls": int(calls),
+                    "wall_ms": round(wall * 1000, 3),
+                    "cpu_ms": round(cpu * 1000, 3),
+                }
+                for rule, (calls, wall, cpu) in rules
+            },
+            "slowest_files": [
+                {"file": file, "wall_ms": round(wall * 1000, 3), "cpu_ms": round(cpu * 1000, 3)}
+                for file, (wall, cpu) in files
+            ],
+        }
+
+    def write_trace(self, path: Path, writer: Optional[BatchWriter] = None) -> None:
+        payload = {"traceEvents": self.events or [], "displayTimeUnit": "ms"}
+        write = writer.write if writer is not None else atomic_write
+        write(path, json.dumps(payload, ensure_ascii=False))
+
+
+GOVERNED = "governed"
+ALL_DOCS = "all"
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One registered check group.
+
+    ``codes`` lists every check code the rule can emit, ``scope`` is
+    ``governed`` (docs/ops documents only) or ``all``, and ``needs`` names the
+    parsed artifacts it reads: ``raw``, ``content``, ``lines``,
+    ``frontmatter``, ``lowered`` or one of the ``scan_lines`` parts
+    (``headings``, ``fences``, ``links``, ``tables``, ``toc``).
+    """
+
+    name: str
+    codes: Tuple[str, ...]
+    scope: str
+    needs: frozenset
+    check: Callable[[ParsedDocument, CheckLogger, "CheckContext"], None]
+
+
+# Registration order is emission order; keep it stable so output does not move.
+RULES: List[Rule] = []
+
+
+def rule(name: str, codes: Sequence[str], scope: str, needs: Iterable[str]):
+    def register(check: Callable[[ParsedDocument, CheckLogger, "CheckContext"], None]):
+        RULES.append(Rule(name, tuple(codes), scope, frozenset(needs), check))
+        return check
+
+    return register
+
+
+class CheckContext:
+    """Run-scoped inputs shared by the rules while checking one document."""
+
+    __slots__ = ("deps", "index", "anchors")
+
+    def __init__(
+        self, deps: Optional[Dict[str, object]], index: PathIndex, anchors: AnchorIndex
+    ) -> None:
+        self.deps = deps
+        self.index = index
+        self.anchors = anchors
+
+
+@rule("bom", ["bom-detected"], ALL_DOCS, ["raw"])
+def _rule_bom(doc: ParsedDocument, logger: CheckLogger, ctx: CheckContext) -> None:
+    path, raw_content = doc.path, doc.raw_content
+    # Check for BOM
+    if raw_content.startswith(b'\xef\xbb\xbf'):
+        logger.error(
+            path,
+            1,
+            "bom-detected",
+            "File contains BOM (Byte Order Mark) at the beginning.",
+        )
+
+
+@rule("empty", ["empty-file"], ALL_DOCS, ["content"])
+def _rule_empty(doc: ParsedDocument, logger: CheckLogger, ctx: CheckContext) -> None:
+    path, content = doc.path, doc.content
+    # Check for empty file
+    if not content.strip():
+        logger.error(
+            path,
+            1,
+            "empty-file",
+            "File is empty or contains only whitespace.",
+        )
+
+
+@rule(
+    "frontmatter",
+    [
+        "frontmatter-missing",
+        "frontmatter-unclosed",
+        *(f"frontmatter-missing-{key}" for key in REQUIRED_FRONTMATTER),
+        "frontmatter-source",
+        "frontmatter-version",
+        "frontmatter-updated-date",
+        "frontmatter-owner",
+        "frontmatter-variation",
+    ],
+    GOVERNED,
+    ["frontmatter"],
+)
+def _rule_frontmatter(doc: ParsedDocument, logger: CheckLogger, ctx: CheckContext) -> None:
+    path = doc.path
+    frontmatter, fm_start, fm_end = doc.frontmatter
+    if frontmatter is None:
+        logger.error(
+            path,
+            1,
+            "frontmatter-missing",
+            "Frontmatter block missing or malformed (requires --- at start).",
+            fixable=True,
+        )
+    elif fm_end is None:
+        logger.error(
+            path,
+            1,
+            "frontmatter-unclosed",
+            "Frontmatter block opened but never closed with ---.",
+            fixable=True,
+        )
+    else:
+        for key in REQUIRED_FRONTMATTER:
+            if key not in frontmatter:
+                logger.error(
+                    path,
+                    1,
+                    f"frontmatter-missing-{key}",
+                    f"Frontmatter lacks `{key}`.",
+                    fixable=True,
+                )
+        source_val = frontmatter.get("source_of_truth", "").lower()
+        if source_val not in {"true", "True", "TRUE"}:
+            logger.error(
+                path,
+                1,
+                "frontmatter-source",
+                "`source_of_truth` must be `true`.",
+                fixable=True,
+            )
+        version_val = frontmatter.get("version", "")
+        if version_val and not re.match(r"^\d+\.\d+\.\d+(-[\w\.]+)?$", version_val):
+            logger.error(
+                path,
+                1,
+                "frontmatter-version",
+                "`version` must follow `x.y.z` semantic versioning.",
+            )
+        updated_val = frontmatter.get("updated_date", "")
+        if updated_val:
+            try:
+                datetime.strptime(updated_val, "%Y-%m-%d")
+            except ValueError:
+                logger.error(
+                    path,
+                    1,
+                    "frontmatter-updated-date",
+                    "`updated_date` must use `YYYY-MM-DD` format.",
+                )
+        owner_val = frontmatter.get("owner", "")
+        if owner_val == "":
+            logger.error(
+                path,
+                1,
+                "frontmatter-owner",
+                "`owner` must reference a responsible owner team.",
+            )
+
+        # Check for forbidden frontmatter key variations
+        for variation in FORBIDDEN_FRONTMATTER_VARIATIONS:
+            if variation in frontmatter:
+                logger.error(
+                    path,
+                    1,
+                    "frontmatter-variation",
+                    f"Forbidden frontmatter key variation: `{variation}` (use `source_of_truth` instead).",
+                )
+
+
+@rule("sections", [code for _, code, _ in SECTION_RULES], GOVERNED, ["headings"])
+def _rule_sections(doc: ParsedDocument, logger: CheckLogger, ctx: CheckContext) -> None:
+    path, lines, scan = doc.path, doc.lines, doc.scan
+    # section checks
+    h2_lines = [lines[line_no - 1] for line_no, level, _ in scan.headings if level == 2]
+    for pattern, code, label in SECTION_RULES:
+        if not any(pattern.match(line) for line in h2_lines):
+            logger.error(
+                path,
+                1,
+                code,
+                f"Missing required section: {label}.",
+                fixable=True if code == "section-dod" else False,
+            )
 
-            for match in LINK_PATTERN.finditer(line):
-                target = match.group(2).strip()
-                if target.startswith("http://"):
-                    logger.error(
-                        path,
-                        idx + 1,
-                        "link-insecure",
-                        "External links must use https.",
-                    )
-                if any(domain in target.lower() for domain in DISALLOWED_EXTERNAL_DOMAINS):
-                    logger.error(
-                        path,
-                        idx + 1,
-                        "link-domain",
-                        f"External link to prohibited domain found: {target}",
-                    )
-                if target.startswith(("http://", "https://", "mailto:", "#", "tel:")):
-                    continue
-                stripped = target.split("#", 1)[0]
-                if not stripped:
-                    logger.error(
-                        path,
-                        idx + 1,
-                        "link-empty-target",
-                        "Relative link target is empty.",
-                    )
-                    continue
-                candidate = (path.parent / stripped).resolve()
-                if not candidate.exists():
-                    logger.error(
-                        path,
-                        idx + 1,
-                        "link-missing",
-                        f"Link target `{stripped}` not found.",
-                    )
-                # Check for relative paths escaping docs/ directory
-                if path.parts and "docs" in path.parts:
-                    docs_index = path.parts.index("docs")
-                    resolved_path = (path.parent / stripped).resolve()
-                    try:
-                        resolved_relative = resolved_path.relative_to(path.parents[len(path.parts) - docs_index - 1])
-                        if resolved_relative.parts and resolved_relative.parts[0] in ("..", "."):
-                            logger.error(
-                                path,
-                                idx + 1,
-                                "link-escaping-docs",
-                                f"Relative link `{stripped}` escapes docs/ directory boundary.",
-                            )
-                    except ValueError:
-                        # Path is outside the docs directory
-                        logger.error(
-                            path,
-                            idx + 1,
-                            "link-escaping-docs",
-                            f"Relative link `{stripped}` escapes docs/ directory boundary.",
-                        )
 
-        # Forbidden words
-        for idx, line in enumerate(lines):
-            lowered = line.lower()
-            for word in FORBIDDEN_WORDS:
-                if re.search(rf"\b{re.escape(word)}\b", lowered):
+@rule(
+    "headings",
+    ["heading-none", "heading-h1-duplicate", "heading-order"],
+    GOVERNED,
+    ["headings"],
+)
+def _rule_headings(doc: ParsedDocument, logger: CheckLogger, ctx: CheckContext) -> None:
+    path, scan = doc.path, doc.scan
+    headings = scan.headings
+    if not headings:
+        logger.error(
+            path,
+            1,
+            "heading-none",
+            "Document does not use Markdown headings.",
+        )
+    else:
+        h1s = [entry for entry in headings if entry[1] == 1]
+        if len(h1s) > 1:
+            logger.error(
+                path,
+                h1s[1][0],
+                "heading-h1-duplicate",
+                "Document must contain at most one H1.",
+            )
+        last_level = 0
+        for line_no, level, text in headings:
+            if last_level and level - last_level > 1:
+                logger.error(
+                    path,
+                    line_no,
+                    "heading-order",
+                    "Heading levels must increase by at most one.",
+                )
+            last_level = level
+
+
+@rule("toc", ["toc-missing", "toc-missing-entry"], GOVERNED, ["toc", "headings"])
+def _rule_toc(doc: ParsedDocument, logger: CheckLogger, ctx: CheckContext) -> None:
+    path, scan = doc.path, doc.scan
+    headings = scan.headings
+    toc_entries = scan.toc_entries
+    if toc_entries is None:
+        logger.error(
+            path,
+            1,
+            "toc-missing",
+            "Table of Contents (目次) is required.",
+        )
+    else:
+        toc_set = set(toc_entries)
+        for line_no, level, text in headings:
+            if level in {2, 3}:
+                candidate = slugify(text)
+                if candidate and candidate not in toc_set:
                     logger.error(
                         path,
-                        idx + 1,
-                        "forbidden-word",
-                        f"Forbidden wording detected: {word}",
+                        line_no,
+                        "toc-missing-entry",
+                        f"Heading `{text}` is missing from ToC.",
                     )
 
-        # Code fence checks
-        open_block: Optional[dict] = None
-        for idx, line in enumerate(lines):
-            trimmed = line.strip()
-            if trimmed.startswith("```"):
-                if open_block is None:
-                    language = trimmed[3:].strip()
-                    open_block = {"start": idx + 1, "language": language, "body": []}
-                else:
-                    body_text = "\n".join(open_block["body"])
-                    language = (open_block["language"] or "").lower()
-                    if not language:
+
+@rule(
+    "mermaid",
+    ["mermaid-empty", "mermaid-keyword", "mermaid-unclosed", "mermaid-count-mismatch"],
+    ALL_DOCS,
+    ["fences"],
+)
+def _rule_mermaid(doc: ParsedDocument, logger: CheckLogger, ctx: CheckContext) -> None:
+    path, lines, scan = doc.path, doc.lines, doc.scan
+    # Mermaid validations (fence lines only; block bodies are the lines between)
+    in_mermaid = False
+    block_start = 0
+    for idx, stripped in scan.fences:
+        if stripped.startswith("```mermaid"):
+            in_mermaid = True
+            block_start = idx + 1
+            continue
+        if in_mermaid:
+            block_lines = lines[block_start:idx]
+            if not block_lines:
+                logger.error(
+                    path,
+                    block_start,
+                    "mermaid-empty",
+                    "Mermaid block must include content.",
+                )
+            block_text = "\n".join(block_lines).lower()
+            if not any(keyword in block_text for keyword in MERMAID_KEYWORDS):
+                logger.error(
+                    path,
+                    block_start,
+                    "mermaid-keyword",
+                    "Mermaid block lacks a diagram keyword.",
+                )
+            in_mermaid = False
+    if in_mermaid:
+        logger.error(
+            path,
+            block_start,
+            "mermaid-unclosed",
+            "Mermaid block requires closing ``` marker.",
+        )
+
+    # Check mermaid block count consistency
+    mermaid_start_count = 0
+    mermaid_end_count = 0
+    awaiting_end = False
+    for idx, stripped in scan.fences:
+        if stripped == "```mermaid":
+            mermaid_start_count += 1
+            awaiting_end = True
+        elif stripped == "```" and awaiting_end:
+            mermaid_end_count += 1
+            awaiting_end = False
+    if mermaid_start_count != mermaid_end_count:
+        logger.error(
+            path,
+            1,
+            "mermaid-count-mismatch",
+            f"Mermaid block count mismatch: {mermaid_start_count} starts, {mermaid_end_count} ends.",
+        )
+
+
+@rule(
+    "links",
+    [
+        "image-alt-empty",
+        "image-target-empty",
+        "image-missing",
+        "link-insecure",
+        "link-domain",
+        "link-empty-target",
+        "link-missing",
+        "link-anchor-missing",
+        "link-escaping-docs",
+    ],
+    ALL_DOCS,
+    ["links"],
+)
+def _rule_links(doc: ParsedDocument, logger: CheckLogger, ctx: CheckContext) -> None:
+    path, lines, scan = doc.path, doc.lines, doc.scan
+    index, anchors, deps = ctx.index, ctx.anchors, ctx.deps
+    base_dir = str(path.parent)
+    for idx in scan.link_lines:
+        line = lines[idx]
+        for match in IMAGE_PATTERN.finditer(line):
+            alt_text, target = match.groups()
+            if not alt_text.strip():
+                logger.error(
+                    path,
+                    idx + 1,
+                    "image-alt-empty",
+                    "Image alt text should be descriptive.",
+                )
+            target = target.split("#", 1)[0].split("?", 1)[0]
+            if not target:
+                logger.error(
+                    path,
+                    idx + 1,
+                    "image-target-empty",
+                    "Image link must include a target path.",
+                )
+                continue
+            if target.startswith("http"):
+                continue
+            candidate, exists = index.locate(base_dir, target)
+            if deps is not None:
+                deps[str(candidate)] = exists
+            if not exists:
+                logger.error(
+                    path,
+                    idx + 1,
+                    "image-missing",
+                    f"Referenced image `{target}` does not exist.",
+                )
+
+        for match in LINK_PATTERN.finditer(line):
+            target = match.group(2).strip()
+            if target.startswith("http://"):
+                logger.error(
+                    path,
+                    idx + 1,
+                    "link-insecure",
+                    "External links must use https.",
+                )
+            if any(domain in target.lower() for domain in DISALLOWED_EXTERNAL_DOMAINS):
+                logger.error(
+                    path,
+                    idx + 1,
+                    "link-domain",
+                    f"External link to prohibited domain found: {target}",
+                )
+            if target.startswith(("http://", "https://", "mailto:", "#", "tel:")):
+                continue
+            stripped, _, anchor = target.partition("#")
+            if not stripped:
+                logger.error(
+                    path,
+                    idx + 1,
+                    "link-empty-target",
+                    "Relative link target is empty.",
+                )
+                continue
+            candidate, exists = index.locate(base_dir, stripped)
+            if deps is not None:
+                deps[str(candidate)] = exists
+            if not exists:
+                logger.error(
+                    path,
+                    idx + 1,
+                    "link-missing",
+                    f"Link target `{stripped}` not found.",
+                )
+            elif anchor and candidate.suffix == ".md":
+                slug = heading_slug(unquote(anchor))
+                if slug:
+                    target_doc = str(candidate)
+                    known = anchors.lookup(target_doc)
+                    if deps is not None:
+                        deps[target_doc + "#"] = anchors.fingerprint(target_doc)
+                    if known is not None and slug not in known:
                         logger.error(
                             path,
-                            open_block["start"],
-                            "codefence-language",
-                            "Code fence must declare a language.",
+                            idx + 1,
+                            "link-anchor-missing",
+                            f"Anchor `#{anchor}` not found in `{stripped}`.",
                         )
-                    if language and language not in ALLOWED_CODE_LANGUAGES:
+            # Check for relative paths escaping docs/ directory
+            if path.parts and "docs" in path.parts:
+                docs_index = path.parts.index("docs")
+                try:
+                    resolved_relative = candidate.relative_to(path.parents[len(path.parts) - docs_index - 1])
+                    if resolved_relative.parts and resolved_relative.parts[0] in ("..", "."):
                         logger.error(
                             path,
-                            open_block["start"],
-                            "codefence-language-unsupported",
-                            f"Unsupported language: {language}",
+                            idx + 1,
+                            "link-escaping-docs",
+                            f"Relative link `{stripped}` escapes docs/ directory boundary.",
                         )
-                    if language in TS_LANGUAGE_SET | DART_LANGUAGE_SET:
-                        if not balanced_braces(body_text):
-                            logger.error(
-                                path,
-                                open_block["start"],
-                                "codefence-braces",
-                                f"Braces are not balanced in {language} sample.",
-                            )
-                    open_block = None
-            elif open_block:
-                open_block["body"].append(line)
-        if open_block:
+                except ValueError:
+                    # Path is outside the docs directory
+                    logger.error(
+                        path,
+                        idx + 1,
+                        "link-escaping-docs",
+                        f"Relative link `{stripped}` escapes docs/ directory boundary.",
+                    )
+
+
+@rule("forbidden-words", ["forbidden-word"], ALL_DOCS, ["lowered"])
+def _rule_forbidden_words(doc: ParsedDocument, logger: CheckLogger, ctx: CheckContext) -> None:
+    path = doc.path
+    # Forbidden words
+    for idx, word in FORBIDDEN_WORD_MATCHER.find_lines(doc.lowered):
+        logger.error(
+            path,
+            idx + 1,
+            "forbidden-word",
+            f"Forbidden wording detected: {word}",
+        )
+
+
+@rule(
+    "code-fences",
+    [
+        "codefence-language",
+        "codefence-language-unsupported",
+        "codefence-braces",
+        "codefence-unclosed",
+    ],
+    ALL_DOCS,
+    ["fences"],
+)
+def _rule_code_fences(doc: ParsedDocument, logger: CheckLogger, ctx: CheckContext) -> None:
+    path, lines, scan = doc.path, doc.lines, doc.scan
+    # Code fence checks
+    open_start: Optional[int] = None
+    open_language = ""
+    for idx, stripped in scan.fences:
+        if open_start is None:
+            open_start = idx + 1
+            open_language = stripped[3:].strip()
+            continue
+        body_text = "\n".join(lines[open_start:idx])
+        language = (open_language or "").lower()
+        if not language:
             logger.error(
                 path,
-                open_block["start"],
-                "codefence-unclosed",
-                "Code fence opened but never closed.",
+                open_start,
+                "codefence-language",
+                "Code fence must declare a language.",
             )
-
-        # Table checks
-        for idx in range(len(lines) - 1):
-            header = lines[idx]
-            separator = lines[idx + 1]
-            if "|" not in header or "-" not in separator:
-                continue
-            header_count = sum(1 for segment in header.split("|") if segment.strip())
-            separator_count = sum(
-                1 for segment in separator.split("|") if set(segment.strip()) <= {"-", ":"}
+        if language and language not in ALLOWED_CODE_LANGUAGES:
+            logger.error(
+                path,
+                open_start,
+                "codefence-language-unsupported",
+                f"Unsupported language: {language}",
             )
-            if header_count and separator_count and header_count != separator_count:
+        if language in TS_LANGUAGE_SET | DART_LANGUAGE_SET:
+            if not balanced_braces(body_text):
                 logger.error(
                     path,
-                    idx + 1,
-                    "table-columns",
-                    "Table columns do not align between header and separator.",
+                    open_start,
+                    "codefence-braces",
+                    f"Braces are not balanced in {language} sample.",
                 )
+        open_start = None
+    if open_start is not None:
+        logger.error(
+            path,
+            open_start,
+            "codefence-unclosed",
+            "Code fence opened but never closed.",
+        )
+
 
-        # Check for Cursor Implementation Prompt section
-        cursor_prompt_found = any(
-            keyword.lower() in content.lower() for keyword in CURSOR_PROMPT_KEYWORDS
+@rule("tables", ["table-columns"], ALL_DOCS, ["tables"])
+def _rule_tables(doc: ParsedDocument, logger: CheckLogger, ctx: CheckContext) -> None:
+    path, lines, scan = doc.path, doc.lines, doc.scan
+    # Table checks
+    for idx in scan.table_rows:
+        header = lines[idx]
+        separator = lines[idx + 1]
+        header_count = sum(1 for segment in header.split("|") if segment.strip())
+        separator_count = sum(
+            1 for segment in separator.split("|") if set(segment.strip()) <= {"-", ":"}
         )
-        if not cursor_prompt_found:
+        if header_count and separator_count and header_count != separator_count:
             logger.error(
                 path,
-                1,
-                "cursor-prompt-missing",
-                "Document must contain 'Cursor Implementation Prompt' section.",
+                idx + 1,
+                "table-columns",
+                "Table columns do not align between header and separator.",
             )
 
-        # Check for GitHub Copilot Implementation Prompt section
-        copilot_prompt_found = any(
-            keyword.lower() in content.lower() for keyword in GITHUB_COPILOT_PROMPT_KEYWORDS
+
+@rule("prompts", ["cursor-prompt-missing", "copilot-prompt-missing"], ALL_DOCS, ["lowered"])
+def _rule_prompts(doc: ParsedDocument, logger: CheckLogger, ctx: CheckContext) -> None:
+    path = doc.path
+    found = PROMPT_KEYWORD_MATCHER.find(doc.lowered)
+    # Check for Cursor Implementation Prompt section
+    if "cursor" not in found:
+        logger.error(
+            path,
+            1,
+            "cursor-prompt-missing",
+            "Document must contain 'Cursor Implementation Prompt' section.",
         )
-        if not copilot_prompt_found:
-            logger.error(
-                path,
-                1,
-                "copilot-prompt-missing",
-                "Document must contain 'GitHub Copilot Implementation Prompt' section.",
-            )
 
+    # Check for GitHub Copilot Implementation Prompt section
+    if "copilot" not in found:
+        logger.error(
+            path,
+            1,
+            "copilot-prompt-missing",
+            "Document must contain 'GitHub Copilot Implementation Prompt' section.",
+        )
+
+
+class _SelectedCodes:
+    """Logger proxy for partially selected rules: forwards only ``codes``."""
+
+    def __init__(self, logger: CheckLogger, codes: frozenset) -> None:
+        self.logger = logger
+        self.codes = codes
+
+    def error(
+        self,
+        path: Path,
+        line: int,
+        check: str,
+        message: str,
+        fixable: bool = False,
+    ) -> None:
+        if check in self.codes:
+            self.logger.error(path, line, check, message, fixable)
+
+
+class RuleSet:
+    """The rules selected for a run and the artifacts they need.
+
+    ``select`` / ``ignore`` entries name a rule, a check code, or a code
+    prefix (``frontmatter`` matches every ``frontmatter-*`` code). Rules left
+    with no selected code are never run and their artifacts never parsed;
+    rules with only some codes selected run behind ``_SelectedCodes``.
+    """
+
+    def __init__(
+        self, select: Optional[Iterable[str]] = None, ignore: Optional[Iterable[str]] = None
+    ) -> None:
+        self.select = sorted(self._tokens(select))
+        self.ignore = sorted(self._tokens(ignore))
+        self.active: List[Tuple[Rule, Optional[frozenset]]] = []
+        for entry in RULES:
+            codes = [code for code in entry.codes if self._wanted(entry, code)]
+            if codes:
+                partial = None if len(codes) == len(entry.codes) else frozenset(codes)
+                self.active.append((entry, partial))
+        needs_all: set = set()
+        needs_governed: set = set()
+        for entry, _ in self.active:
+            needs_governed |= entry.needs
+            if entry.scope == ALL_DOCS:
+                needs_all |= entry.needs
+        self.needs = {True: frozenset(needs_governed), False: frozenset(needs_all)}
+
+    @staticmethod
+    def _tokens(values: Optional[Iterable[str]]) -> set:
+        tokens = {token.strip() for value in values or () for token in value.split(",")}
+        tokens.discard("")
+        for token in tokens:
+            if not any(
+                token == entry.name or token == code or code.startswith(token + "-")
+                for entry in RULES
+                for code in entry.codes
+            ):
+                raise SystemExit(f"Unknown rule or check code: {token}")
+        return tokens
+
+    def _wanted(self, entry: Rule, code: str) -> bool:
+        def matches(token: str) -> bool:
+            if token in ALL_CHECK_CODES:
+                return token == code
+            return token == entry.name or code.startswith(token + "-")
+
+        if self.select and not any(matches(token) for token in self.select):
+            return False
+        return not any(matches(token) for token in self.ignore)
+
+    @property
+    def key(self) -> str:
+        return json.dumps({"select": self.select, "ignore": self.ignore})
+
+    @property
+    def codes(self) -> frozenset:
+        return frozenset(
+            code for entry, partial in self.active for code in (partial or entry.codes)
+        )
+
+
+ALL_CHECK_CODES = frozenset(code for entry in RULES for code in entry.codes)
+DEFAULT_RULES = RuleSet()
+
+# Named rule profiles: the check codes each profile leaves out.
+PROFILES: Dict[str, List[str]] = {
+    "strict": [],
+    # The checks of the former standalone validate_md_starlist.py (CI gate).
+    "ci": [
+        "bom-detected",
+        "empty-file",
+        "frontmatter-variation",
+        "mermaid-count-mismatch",
+        "link-escaping-docs",
+        "cursor-prompt-missing",
+        "copilot-prompt-missing",
+    ],
+}
+DEFAULT_PROFILE = "strict"
+
+
+class ProfileVerdicts:
+    """Verdicts for several rule profiles from a single run.
+
+    ``rules`` is the union of the profiles' rules, so each file is read and
+    parsed once; as a logger sink the instance then attributes every error
+    to the profiles whose codes include it.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        select: Optional[Iterable[str]] = None,
+        ignore: Optional[Iterable[str]] = None,
+    ) -> None:
+        for name in names:
+            if name not in PROFILES:
+                raise SystemExit(f"Unknown profile: {name} (expected one of {', '.join(PROFILES)})")
+        self.names = list(dict.fromkeys(names))
+        ignore = list(ignore or ())
+        self.codes = {
+            name: RuleSet(select, ignore + PROFILES[name]).codes for name in self.names
+        }
+        shared = set.intersection(*(set(PROFILES[name]) for name in self.names))
+        self.rules = RuleSet(select, ignore + sorted(shared))
+        self.restart()
+
+    def restart(self) -> None:
+        self.errors: Counter = Counter()
+        self.files: Dict[str, set] = {name: set() for name in self.names}
+
+    def profiles_for(self, check: str) -> List[str]:
+        return [name for name in self.names if check in self.codes[name]]
+
+    def write(self, path: Path, payload: dict) -> None:
+        for name in self.profiles_for(payload["check"]):
+            self.errors[name] += 1
+            self.files[name].add(path)
+
+    def as_dict(self) -> Dict[str, dict]:
+        return {
+            name: {
+                "status": "fail" if self.errors[name] else "pass",
+                "errors": self.errors[name],
+                "files_with_errors": len(self.files[name]),
+            }
+            for name in self.names
+        }
+
+
+class ProfileLogger(CheckLogger):
+    """CheckLogger that tags each error line with the profiles reporting it."""
+
+    def __init__(
+        self,
+        verdicts: ProfileVerdicts,
+        flush_size: int = 1,
+        max_entries: Optional[int] = None,
+        stream: Optional[TextIO] = None,
+    ) -> None:
+        super().__init__(flush_size, max_entries, stream)
+        self.verdicts = verdicts
+        self.sinks.append(verdicts)
+
+    def write(self, payload: dict) -> None:
+        if payload["severity"] == "error":
+            payload = {**payload, "profiles": self.verdicts.profiles_for(payload["check"])}
+        super().write(payload)
+
+
+def check_file(
+    path: Path,
+    root: Path,
+    logger: CheckLogger,
+    raw_content: Optional[bytes] = None,
+    deps: Optional[Dict[str, object]] = None,
+    index: Optional[PathIndex] = None,
+    anchors: Optional[AnchorIndex] = None,
+    profiler: Optional[RuleProfiler] = None,
+    rules: Optional[RuleSet] = None,
+    on_document: Optional[Callable[[ParsedDocument], None]] = None,
+) -> bool:
+    """Run the selected rules (every registered rule by default) on one file.
+
+    ``deps`` (when given) records each filesystem existence probe made while
+    checking links and images, and the anchor fingerprint of every document
+    targeted by an ``other.md#section`` link, so cached results can be
+    invalidated later. ``index`` answers existence probes from a run-scoped
+    snapshot of the tree and ``anchors`` answers heading-slug lookups.
+    ``profiler`` (when given) is charged with the time spent in each rule.
+    ``on_document`` (when given) receives the checked document afterwards,
+    e.g. so ``Autofixer`` can reuse its text and parse.
+    """
+    if rules is None:
+        rules = DEFAULT_RULES
+    if profiler is not None:
+        profiler.begin(path)
+    if raw_content is None:
+        if not path.exists():
+            return False
+        with open(path, 'rb') as f:
+            raw_content = f.read()
+    if profiler is not None:
+        profiler.lap("read")
+    governed = determine_governance(path)
+    doc = ParsedDocument(path, raw_content, scan_parts=rules.needs[governed] & SCAN_PARTS)
+    ctx = CheckContext(
+        deps,
+        index if index is not None else PathIndex(root),
+        anchors if anchors is not None else AnchorIndex(),
+    )
+    for entry, codes in rules.active:
+        if entry.scope == GOVERNED and not governed:
+            continue
+        sink = logger if codes is None else _SelectedCodes(logger, codes)
+        entry.check(doc, sink, ctx)  # type: ignore[arg-type]
+        if profiler is not None:
+            profiler.lap(entry.name)
+    if profiler is not None:
+        profiler.end()
+    if on_document is not None:
+        on_document(doc)
+    return True
+
+
+def _check_task(
+    task: Tuple[Path, Path, Optional[bytes]],
+    index: Optional[PathIndex],
+    anchors: Optional[AnchorIndex],
+    profiler: Optional[RuleProfiler] = None,
+    rules: Optional[RuleSet] = None,
+    on_document: Optional[Callable[[ParsedDocument], None]] = None,
+) -> Tuple[bool, List[dict], Dict[str, object]]:
+    path, root, raw_content = task
+    recorder = RecordingLogger()
+    deps: Dict[str, object] = {}
+    scanned = check_file(
+        path, root, recorder, raw_content, deps, index, anchors, profiler, rules, on_document
+    )
+    return scanned, recorder.records, deps
+
+
+# Set once per worker process by ``_init_worker`` so the indexes are shipped
+# to each worker a single time instead of with every task.
+_WORKER_INDEX: Optional[PathIndex] = None
+_WORKER_ANCHORS: Optional[AnchorIndex] = None
+_WORKER_RULES: Optional[RuleSet] = None
+
+
+def _init_worker(
+    index: Optional[PathIndex], anchors: Optional[AnchorIndex], rules: Optional[RuleSet] = None
+) -> None:
+    global _WORKER_INDEX, _WORKER_ANCHORS, _WORKER_RULES
+    _WORKER_INDEX = index
+    _WORKER_ANCHORS = anchors
+    _WORKER_RULES = rules
+
+
+def _check_file_worker(
+    task: Tuple[Path, Path, Optional[bytes]]
+) -> Tuple[bool, List[dict], Dict[str, object]]:
+    return _check_task(task, _WORKER_INDEX, _WORKER_ANCHORS, rules=_WORKER_RULES)
+
+
+def _read_target(path: Path) -> Optional[bytes]:
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+PREFETCH_THREADS = 4
+
+
+def _prefetched(targets: Sequence[Path], depth: int) -> Iterator[Tuple[Path, Optional[bytes]]]:
+    """Yield ``(path, content)`` in target order, reading ahead on threads.
+
+    At most ``depth`` reads are queued or held ahead of the consumer: the
+    next read is only submitted when the consumer takes a file, so memory
+    stays bounded however slow the checks are. ``depth`` 0 reads inline.
+    """
+    if depth <= 0:
+        for path in targets:
+            yield path, _read_target(path)
+        return
+    remaining = iter(targets)
+    with ThreadPoolExecutor(max_workers=min(depth, PREFETCH_THREADS)) as pool:
+        window = deque((path, pool.submit(_read_target, path)) for path in islice(remaining, depth))
+        try:
+            while window:
+                path, future = window.popleft()
+                upcoming = next(remaining, None)
+                if upcoming is not None:
+                    window.append((upcoming, pool.submit(_read_target, upcoming)))
+                yield path, future.result()
+        finally:
+            for _, future in window:
+                future.cancel()
+
+
+def _iter_streamed_results(
+    targets: List[Path],
+    root: Path,
+    cache: Optional[ResultCache],
+    index: Optional[PathIndex],
+    anchors: Optional[AnchorIndex],
+    profiler: Optional[RuleProfiler],
+    rules: Optional[RuleSet],
+    prefetch: int,
+    on_document: Optional[Callable[[ParsedDocument], None]] = None,
+) -> Iterator[Tuple[bool, List[dict]]]:
+    """In-process variant of ``_iter_file_results`` that overlaps reads with checks."""
+    for path, raw_content in _prefetched(targets, prefetch):
+        digest = None
+        if cache is not None:
+            if raw_content is None:
+                yield False, []
+                continue
+            digest = content_digest(raw_content)
+            cached = cache.lookup(path, digest, index, anchors)
+            if cached is not None:
+                yield True, cached
+                continue
+        scanned, records, deps = _check_task(
+            (path, root, raw_content), index, anchors, profiler, rules, on_document
+        )
+        if digest is not None and scanned:
+            cache.store(path, digest, records, deps)  # type: ignore[union-attr]
+        yield scanned, records
+
+
+PARALLEL_CHUNK_MAX = 32
+
+
+def _check_chunk_worker(
+    tasks: List[Tuple[Path, Path, Optional[bytes]]]
+) -> List[Tuple[bool, List[dict], Dict[str, object]]]:
+    return [_check_file_worker(task) for task in tasks]
+
+
+def _iter_pooled_results(
+    targets: List[Path],
+    root: Path,
+    jobs: int,
+    cache: Optional[ResultCache],
+    index: Optional[PathIndex],
+    anchors: Optional[AnchorIndex],
+    rules: Optional[RuleSet],
+    prefetch: int,
+) -> Iterator[Tuple[bool, List[dict]]]:
+    """Multi-process variant of ``_iter_file_results``.
+
+    Cache hits are answered in the parent. Misses are batched into chunks
+    that are submitted at most ``jobs * 4`` chunks ahead of the output, and a
+    chunk's file contents are dropped once it is submitted, so memory is
+    bounded by the read-ahead and in-flight windows rather than the corpus.
+    The pool only starts once a second miss shows up; a single miss is
+    checked in-process.
+    """
+    chunk_size = max(1, min(PARALLEL_CHUNK_MAX, len(targets) // (jobs * 4)))
+    window = jobs * 4
+    # Slots are [outcome, path, digest] in target order; outcome stays None
+    # until the chunk holding the miss comes back.
+    order: deque = deque()
+    in_flight: deque = deque()
+    chunk: List[Tuple[Path, Path, Optional[bytes]]] = []
+    chunk_slots: List[list] = []
+    misses = 0
+    pool: Optional[ProcessPoolExecutor] = None
+
+    def settle(slots: List[list], results: List[Tuple[bool, List[dict], Dict[str, object]]]) -> None:
+        for slot, (scanned, records, deps) in zip(slots, results):
+            if cache is not None and scanned:
+                cache.store(slot[1], slot[2], records, deps)
+            slot[0] = (scanned, records)
+
+    if cache is None:
+        # Workers read their own files, so the reads already overlap.
+        contents: Iterable[Tuple[Path, Optional[bytes]]] = ((path, None) for path in targets)
+    else:
+        contents = _prefetched(targets, prefetch)
+    try:
+        for path, raw_content in contents:
+            slot: list = [None, path, None]
+            order.append(slot)
+            if cache is not None:
+                if raw_content is None:
+                    slot[0] = (False, [])
+                else:
+                    slot[2] = content_digest(raw_content)
+                    cached = cache.lookup(path, slot[2], index, anchors)
+                    if cached is not None:
+                        slot[0] = (True, cached)
+            if slot[0] is None:
+                misses += 1
+                chunk.append((path, root, raw_content))
+                chunk_slots.append(slot)
+                if len(chunk) >= chunk_size and misses >= 2:
+                    if pool is None:
+                        pool = ProcessPoolExecutor(
+                            max_workers=jobs,
+                            initializer=_init_worker,
+                            initargs=(index, anchors, rules),
+                        )
+                    in_flight.append((pool.submit(_check_chunk_worker, chunk), chunk_slots))
+                    chunk, chunk_slots = [], []
+            if len(in_flight) >= window:
+                future, slots = in_flight.popleft()
+                settle(slots, future.result())
+            while order and order[0][0] is not None:
+                yield order.popleft()[0]
+        if chunk:
+            if pool is None:
+                settle(
+                    chunk_slots,
+                    [_check_task(task, index, anchors, rules=rules) for task in chunk],
+                )
+            else:
+                in_flight.append((pool.submit(_check_chunk_worker, chunk), chunk_slots))
+            chunk, chunk_slots = [], []
+        while in_flight:
+            future, slots = in_flight.popleft()
+            settle(slots, future.result())
+            while order and order[0][0] is not None:
+                yield order.popleft()[0]
+        while order:
+            yield order.popleft()[0]
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def _iter_file_results(
+    targets: List[Path],
+    root: Path,
+    jobs: int,
+    cache: Optional[ResultCache],
+    index: Optional[PathIndex],
+    anchors: Optional[AnchorIndex],
+    profiler: Optional[RuleProfiler] = None,
+    rules: Optional[RuleSet] = None,
+    prefetch: int = 0,
+    on_document: Optional[Callable[[ParsedDocument], None]] = None,
+) -> Iterator[Tuple[bool, List[dict]]]:
+    """Yield ``(scanned, records)`` per target, in target order.
+
+    Profiled runs stay in-process so every rule timing lands in ``profiler``.
+    Files stream through the cache and the checks one at a time; with
+    ``prefetch`` > 0 they are read up to that many ahead on threads. Workers
+    only record payloads and the parent replays them in target order, so the
+    JSON-lines stream matches a serial run exactly. ``on_document`` only
+    sees documents checked in this process (not cache hits or worker files).
+    """
+    if jobs == 1 or len(targets) < 2 or profiler is not None:
+        yield from _iter_streamed_results(
+            targets, root, cache, index, anchors, profiler, rules, prefetch, on_document
+        )
+        return
+    yield from _iter_pooled_results(targets, root, jobs, cache, index, anchors, rules, prefetch)
+
+
+def run_checks(
+    targets: Iterable[Path],
+    root: Path,
+    logger: CheckLogger,
+    jobs: int = 1,
+    cache: Optional[ResultCache] = None,
+    index: Optional[PathIndex] = None,
+    anchors: Optional[AnchorIndex] = None,
+    outcomes: Optional[List[Tuple[bool, List[dict]]]] = None,
+    profiler: Optional[RuleProfiler] = None,
+    rules: Optional[RuleSet] = None,
+    prefetch: int = 0,
+    on_document: Optional[Callable[[ParsedDocument], None]] = None,
+) -> int:
+    """Check ``targets`` in order and stream their findings to ``logger``.
+
+    When ``outcomes`` is given it receives ``(scanned, records)`` per target
+    so a later pass can replay unchanged files instead of re-checking them.
+    ``prefetch`` is the read-ahead depth (0 = read each file when checked).
+    """
+    targets = list(targets)
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    if index is None:
+        index = PathIndex.build(root)
+    if anchors is None:
+        anchors = AnchorIndex()
+    scanned = 0
+    results = _iter_file_results(
+        targets, root, jobs, cache, index, anchors, profiler, rules, prefetch, on_document
+    )
+    for file_scanned, records in results:
+        if outcomes is not None:
+            outcomes.append((file_scanned, records))
+        if file_scanned:
+            scanned += 1
+        for payload in records:
+            logger.write(payload)
+    return scanned
+
+
+def recheck_changed(
+    targets: Sequence[Path],
+    outcomes: List[Tuple[bool, List[dict]]],
+    changed: Iterable[Path],
+    root: Path,
+    logger: CheckLogger,
+    jobs: int = 1,
+    cache: Optional[ResultCache] = None,
+    index: Optional[PathIndex] = None,
+    anchors: Optional[AnchorIndex] = None,
+    graph: Optional[LinkGraph] = None,
+    profiler: Optional[RuleProfiler] = None,
+    rules: Optional[RuleSet] = None,
+    prefetch: int = 0,
+) -> int:
+    """Re-check ``changed`` targets (and targets linking to them via ``graph``)
+    and replay ``outcomes`` from the previous pass for every other target, so
+    the stream matches a full ``run_checks`` over ``targets``."""
+    stale = {str(path) for path in changed}
+    if graph is not None:
+        stale |= graph.dependents(list(stale))
+    positions = [position for position, path in enumerate(targets) if str(path) in stale]
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    if index is None:
+        index = PathIndex.build(root)
+    if anchors is None:
+        anchors = AnchorIndex()
+    fresh = _iter_file_results(
+        [targets[position] for position in positions],
+        root,
+        jobs,
+        cache,
+        index,
+        anchors,
+        profiler,
+        rules,
+        prefetch,
+    )
+    for position in positions:
+        outcomes[position] = next(fresh)
+    scanned = 0
+    for file_scanned, records in outcomes:
+        if file_scanned:
+            scanned += 1
+        for payload in records:
+            logger.write(payload)
     return scanned
 
 
@@ -751,63 +2805,325 @@ def rebuild_frontmatter_block(lines: Sequence[str]) -> List[str]:
     return rebuilt
 
 
-def ensure_frontmatter(path: Path, logger: CheckLogger) -> bool:
-    text = path.read_text(encoding="utf-8", errors="replace")
-    lines = text.splitlines()
-    frontmatter, fm_start, fm_end = parse_frontmatter(lines)
-    governed = determine_governance(path)
-    if not governed:
-        return False
-    needs_fix = False
+def fix_frontmatter_text(doc: ParsedDocument) -> Optional[Tuple[str, str]]:
+    """Return ``(new_text, note)`` when the frontmatter needs fixing, else None."""
+    if not determine_governance(doc.path):
+        return None
+    text = doc.content
+    lines = doc.lines
+    frontmatter, fm_start, fm_end = doc.frontmatter
     if frontmatter is None or fm_end is None:
         default = "\n".join(rebuild_frontmatter_block([])) + "\n"
         new_text = default + text.lstrip()
         if not new_text.endswith("\n"):
             new_text += "\n"
-        atomic_write(path, new_text)
-        logger.info(path, "Frontmatter block auto-fix applied.")
-        needs_fix = True
-    else:
-        existing_lines = lines[1:fm_end]
-        rebuilt = rebuild_frontmatter_block(existing_lines)
-        new_text = "\n".join(rebuilt + lines[fm_end + 1 :])  # type: ignore[index]
-        if new_text != text:
-            if not new_text.endswith("\n"):
-                new_text += "\n"
-            atomic_write(path, new_text)
-            logger.info(path, "Frontmatter schema auto-fix applied.")
-            needs_fix = True
-    return needs_fix
+        return new_text, "Frontmatter block auto-fix applied."
+    existing_lines = lines[1:fm_end]
+    rebuilt = rebuild_frontmatter_block(existing_lines)
+    new_text = "\n".join(rebuilt + lines[fm_end + 1 :])  # type: ignore[index]
+    if new_text == text:
+        return None
+    if not new_text.endswith("\n"):
+        new_text += "\n"
+    return new_text, "Frontmatter schema auto-fix applied."
 
 
-def ensure_dod_section(path: Path, logger: CheckLogger) -> bool:
+def fix_dod_section_text(doc: ParsedDocument) -> Optional[Tuple[str, str]]:
+    """Return ``(new_text, note)`` when the DoD section must be appended, else None."""
+    if not determine_governance(doc.path):
+        return None
+    text = doc.content
+    if re.search(r"^##\s+DoD\s+\(Definition of Done\)", text, re.MULTILINE):
+        return None
+    addition = "\n\n## DoD (Definition of Done)\n- [ ] 文書の目的と完了基準を明記しました。\n"
+    return text.rstrip() + addition + "\n", "DoD (Definition of Done) section appended."
+
+
+def ensure_frontmatter(path: Path, logger: CheckLogger) -> bool:
     text = path.read_text(encoding="utf-8", errors="replace")
-    lines = text.splitlines()
-    governed = determine_governance(path)
-    if not governed:
+    fixed = fix_frontmatter_text(ParsedDocument.from_text(path, text))
+    if fixed is None:
         return False
-    if re.search(r"^##\s+DoD\s+\(Definition of Done\)", text, re.MULTILINE):
+    new_text, note = fixed
+    atomic_write(path, new_text)
+    logger.info(path, note)
+    return True
+
+
+def ensure_dod_section(path: Path, logger: CheckLogger) -> bool:
+    text = path.read_text(encoding="utf-8", errors="replace")
+    fixed = fix_dod_section_text(ParsedDocument.from_text(path, text))
+    if fixed is None:
         return False
-    addition = "\n\n## DoD (Definition of Done)\n- [ ] 文書の目的と完了基準を明記しました。\n"
-    atomic_write(path, (text.rstrip() + addition + "\n"))
-    logger.info(path, "DoD (Definition of Done) section appended.")
+    new_text, note = fixed
+    atomic_write(path, new_text)
+    logger.info(path, note)
     return True
 
 
+TEXT_FIXERS = (fix_frontmatter_text, fix_dod_section_text)
+
+
+class Autofixer:
+    """Runs every text fixer over each governed document and stages the rewrites.
+
+    ``feed`` takes documents the check pass has already read and parsed, so
+    those files are not read again; ``commit`` reads whatever was not fed
+    (cache hits, files checked in worker processes), renames all rewrites
+    into place through one ``BatchWriter`` and logs the notes in ``paths``
+    order. A run that fails before ``commit`` finishes leaves every document
+    untouched and logs no notes.
+    """
+
+    def __init__(self) -> None:
+        self.batch = BatchWriter()
+        self.fixed: Dict[Path, List[str]] = {}
+        self.seen: Set[Path] = set()
+
+    def feed(self, doc: ParsedDocument) -> None:
+        if doc.path in self.seen or not determine_governance(doc.path):
+            return
+        self.seen.add(doc.path)
+        content = doc.content
+        if "\r" in content:
+            # The fixers expect text as ``read_text`` returns it.
+            doc = ParsedDocument.from_text(
+                doc.path, content.replace("\r\n", "\n").replace("\r", "\n")
+            )
+        notes = []
+        for fixer in TEXT_FIXERS:
+            fixed = fixer(doc)
+            if fixed is not None:
+                text, note = fixed
+                notes.append(note)
+                doc = ParsedDocument.from_text(doc.path, text)
+        if notes:
+            self.batch.write(doc.path, doc.content)
+            self.fixed[doc.path] = notes
+
+    def commit(self, paths: Sequence[Path], logger: CheckLogger) -> List[Path]:
+        """Fix the ``paths`` not fed yet, write every rewrite and return the changed paths."""
+        try:
+            for path in paths:
+                if path not in self.seen and determine_governance(path):
+                    self.feed(
+                        ParsedDocument.from_text(
+                            path, path.read_text(encoding="utf-8", errors="replace")
+                        )
+                    )
+        except BaseException:
+            self.abort()
+            raise
+        self.batch.commit()
+        changed = [path for path in dict.fromkeys(paths) if path in self.fixed]
+        for path in changed:
+            for note in self.fixed[path]:
+                logger.info(path, note)
+        return changed
+
+    def abort(self) -> None:
+        self.batch.abort()
+
+
+def apply_autofixes(paths: Sequence[Path], logger: CheckLogger) -> List[Path]:
+    """Run every text fixer over each document in memory and write it once.
+
+    Produces the same files and notes as calling ``ensure_frontmatter`` then
+    ``ensure_dod_section``, but reads each governed file once, skips
+    ungoverned files without touching them, and returns the rewritten paths.
+    See ``Autofixer`` for reusing documents from the check pass.
+    """
+    return Autofixer().commit(paths, logger)
+
+
 def run_autofix(paths: Sequence[Path], logger: CheckLogger) -> bool:
-    fixed = False
-    for path in paths:
-        fixed |= ensure_frontmatter(path, logger)
-        fixed |= ensure_dod_section(path, logger)
-    return fixed
+    return bool(apply_autofixes(paths, logger))
+
+
+REPORT_MAX_ROWS = 200
+REPORT_TABLE_HEADER = [
+    "| ファイル | 行 | チェック | メッセージ | 修復可能 |",
+    "| --- | --- | --- | --- | --- |",
+]
+
+
+def report_row(path: Path, line: int, check: str, message: str, fixable: bool) -> str:
+    try:
+        relative = path.relative_to(Path.cwd())
+    except ValueError:
+        relative = path
+    return f"| {relative} | {line} | {check} | {message} | {'はい' if fixable else 'いいえ'} |"
+
+
+class ReportStream:
+    """Companion issue log written row by row as errors are logged.
+
+    Attached to ``CheckLogger.sinks``. A ``.jsonl`` path receives one JSON
+    line per error; any other path receives the full Markdown issue table.
+    Rows go to a staged temp file that replaces ``path`` on ``close``, and
+    only per-check counters are kept in memory.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.jsonl = path.suffix == ".jsonl"
+        self.counts: Counter = Counter()
+        self.fixable: Counter = Counter()
+        self._batch = BatchWriter()
+        self._file = self._batch.open(path)
+        self._start()
+
+    def _start(self) -> None:
+        if self.jsonl:
+            return
+        today = datetime.now(timezone.utc).date().isoformat()
+        header = [
+            "---",
+            "source_of_truth: true",
+            "version: 1.0.0",
+            f"updated_date: {today}",
+            "owner: STARLIST Docs Automation Team",
+            "---",
+            "",
+            "# Markdown CI Issue Log",
+            "",
+            *REPORT_TABLE_HEADER,
+        ]
+        self._file.write("\n".join(header) + "\n")
+
+    def restart(self) -> None:
+        """Discard the rows written so far (e.g. before an autofix re-check)."""
+        self._file.seek(0)
+        self._file.truncate()
+        self.counts.clear()
+        self.fixable.clear()
+        self._start()
+
+    def write(self, path: Path, payload: dict) -> None:
+        self.counts[payload["check"]] += 1
+        if payload["fixable"]:
+            self.fixable[payload["check"]] += 1
+        if self.jsonl:
+            self._file.write(dumps_payload(payload) + "\n")
+        else:
+            self._file.write(
+                report_row(
+                    path,
+                    payload["line"],
+                    payload["check"],
+                    payload["message"],
+                    payload["fixable"],
+                )
+                + "\n"
+            )
+
+    def close(self) -> None:
+        self._file.close()
+        self._batch.commit()
+
+    def abort(self) -> None:
+        self._file.close()
+        self._batch.abort()
+
+
+TOP_FILES_LIMIT = 10
+
+
+class IssueStats:
+    """Error aggregates maintained incrementally as a ``CheckLogger`` sink.
+
+    Counts findings by check code, by top-level directory (``docs/<area>``
+    for anything under ``docs``) and by fixability, and ranks the worst
+    files. Each finding costs a few counter updates; directory buckets and
+    totals are derived from the per-file and per-check counters on demand.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = str(root)
+        self.by_check: Counter = Counter()
+        self.fixable_by_check: Counter = Counter()
+        self.by_file: Counter = Counter()
+
+    @classmethod
+    def from_entries(cls, root: Path, entries: Iterable[IssueEntry]) -> "IssueStats":
+        stats = cls(root)
+        if isinstance(entries, IssueStore):
+            stats.by_check = entries.count_by("check")
+            stats.by_file = entries.count_by("file")
+            for _, _, check, _, fixable in entries.rows():
+                if fixable:
+                    stats.fixable_by_check[check] += 1
+            return stats
+        for entry in entries:
+            stats.add(str(entry.path), entry.check, entry.fixable)
+        return stats
+
+    def write(self, path: Path, payload: dict) -> None:
+        self.add(payload["file"], payload["check"], payload["fixable"])
+
+    def add(self, file: str, check: str, fixable: bool) -> None:
+        self.by_check[check] += 1
+        self.by_file[file] += 1
+        if fixable:
+            self.fixable_by_check[check] += 1
+
+    @property
+    def total(self) -> int:
+        return sum(self.by_check.values())
+
+    @property
+    def fixable(self) -> int:
+        return sum(self.fixable_by_check.values())
+
+    @property
+    def by_directory(self) -> Counter:
+        buckets: Counter = Counter()
+        for file, count in self.by_file.items():
+            buckets[self._bucket(file)] += count
+        return buckets
+
+    def _bucket(self, file: str) -> str:
+        relative = os.path.relpath(file, self.root) if os.path.isabs(file) else file
+        parts = Path(relative).parts
+        if len(parts) <= 1:
+            return "."
+        if parts[0] == "docs" and len(parts) > 2:
+            return f"docs/{parts[1]}"
+        return parts[0]
+
+    def top_files(self, limit: int = TOP_FILES_LIMIT) -> List[Tuple[str, int]]:
+        return sorted(self.by_file.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+    def as_dict(self, limit: int = TOP_FILES_LIMIT) -> dict:
+        def ranked(counter: Counter) -> Dict[str, int]:
+            return dict(sorted(counter.items(), key=lambda item: (-item[1], item[0])))
+
+        fixable = self.fixable
+        return {
+            "by_check": ranked(self.by_check),
+            "by_directory": ranked(self.by_directory),
+            "fixability": {"fixable": fixable, "manual": self.total - fixable},
+            "top_files": [
+                {"file": file, "errors": count} for file, count in self.top_files(limit)
+            ],
+        }
 
 
 def build_report(
     report_path: Path,
     summary: dict,
-    issues: List[IssueEntry],
+    issues: Sequence[IssueEntry],
     args: argparse.Namespace,
+    writer: Optional[BatchWriter] = None,
+    issue_log: Optional[Path] = None,
+    stats: Optional[IssueStats] = None,
 ) -> None:
+    """Write the Markdown summary report.
+
+    The issue table is capped at ``REPORT_MAX_ROWS``; pass ``issue_log`` when
+    a ``ReportStream`` holds the full table so the report points at it.
+    Aggregates come from ``stats`` (computed from ``issues`` when omitted).
+    """
     timestamp = summary["timestamp"]
     lines = [
         "---",
@@ -831,32 +3147,68 @@ def build_report(
         f"- `reports_generated`: {summary['reports_generated']}",
         f"- `fixes_applied`: {summary['fixes_applied']}",
         "",
-        "## 失敗一覧",
     ]
-    if not issues:
-        lines.append("すべてのチェックを通過しました。")
-    else:
+    if summary.get("profiles"):
+        lines.extend(
+            ["## プロファイル別判定", "| プロファイル | 判定 | エラー数 | 対象ファイル数 |"]
+        )
+        lines.append("| --- | --- | --- | --- |")
+        for name, verdict in summary["profiles"].items():
+            lines.append(
+                f"| {name} | {verdict['status']} | {verdict['errors']} "
+                f"| {verdict['files_with_errors']} |"
+            )
+        lines.append("")
+    if issues:
+        if stats is None:
+            stats = IssueStats.from_entries(args.root.resolve(), issues)
+        fixable = stats.fixable
         lines.extend(
             [
-                "| ファイル | 行 | チェック | メッセージ | 修復可能 |",
-                "| --- | --- | --- | --- | --- |",
+                "## チェック別集計",
+                f"- 修復可能: {fixable} / 手動対応: {stats.total - fixable}",
+                "",
+                "| チェック | 件数 | 修復可能 |",
+                "| --- | --- | --- |",
             ]
         )
-        max_entries = 200
-        for entry in issues[:max_entries]:
+        for check, count in sorted(stats.by_check.items(), key=lambda item: (-item[1], item[0])):
+            lines.append(f"| {check} | {count} | {stats.fixable_by_check[check]} |")
+        lines.extend(["", "## ディレクトリ別集計", "| ディレクトリ | 件数 |", "| --- | --- |"])
+        for bucket, count in sorted(
+            stats.by_directory.items(), key=lambda item: (-item[1], item[0])
+        ):
+            lines.append(f"| {bucket} | {count} |")
+        lines.extend(["", "## 指摘の多いファイル", "| ファイル | 件数 |", "| --- | --- |"])
+        for file, count in stats.top_files():
             try:
-                relative = entry.path.relative_to(Path.cwd())
+                relative = Path(file).relative_to(Path.cwd())
             except ValueError:
-                relative = entry.path
+                relative = Path(file)
+            lines.append(f"| {relative} | {count} |")
+        lines.append("")
+    lines.append("## 失敗一覧")
+    if not issues:
+        lines.append("すべてのチェックを通過しました。")
+    else:
+        lines.extend(REPORT_TABLE_HEADER)
+        max_entries = REPORT_MAX_ROWS
+        for entry in islice(issues, max_entries):
             lines.append(
-                f"| {relative} | {entry.line} | {entry.check} | {entry.message} | {'はい' if entry.fixable else 'いいえ'} |"
+                report_row(entry.path, entry.line, entry.check, entry.message, entry.fixable)
             )
-        remaining = len(issues) - max_entries
+        remaining = summary["errors"] - max_entries
         if remaining > 0:
-            lines.append(
-                f"> 表は先頭 {max_entries} 件まで表示し、残り {remaining} 件はログファイルを参照してください。"
-            )
-    atomic_write(report_path, "\n".join(lines) + "\n")
+            if issue_log is not None:
+                lines.append(
+                    f"> 表は先頭 {max_entries} 件まで表示し、残り {remaining} 件は `{issue_log}` を参照してください。"
+                )
+            else:
+                lines.append(
+                    f"> 表は先頭 {max_entries} 件まで表示し、残り {remaining} 件はログファイルを参照してください。"
+                )
+    write = writer.write if writer is not None else atomic_write
+    write(report_path, "\n".join(lines) + "\n")
 
 
 def summarize(
@@ -864,7 +3216,11 @@ def summarize(
     logger: CheckLogger,
     args: argparse.Namespace,
     fixes_applied: bool,
+    stats: Optional[IssueStats] = None,
+    verdicts: Optional[ProfileVerdicts] = None,
 ) -> dict:
+    if stats is None:
+        stats = IssueStats.from_entries(args.root.resolve(), logger.entries)
     timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds") + "Z"
     max_args = 6
     preview_args = sys.argv[:max_args]
@@ -873,28 +3229,623 @@ def summarize(
     if extra_args > 0:
         command_preview += f" ...(+{extra_args} more args)"
     entry = {
-        "status": "pass" if not logger.entries else "fail",
+        "status": "pass" if not logger.error_count else "fail",
         "files_scanned": scanned,
-        "errors": len(logger.entries),
+        "errors": logger.error_count,
         "timestamp": timestamp,
         "command": command_preview,
         "dry_run": args.dry_run,
         "autofix": args.autofix,
         "fixes_applied": fixes_applied,
         "reports_generated": 1 if args.report else 0,
+        "stats": stats.as_dict(),
     }
+    if verdicts is not None:
+        entry["profiles"] = verdicts.as_dict()
     print(json.dumps({"type": "summary", **entry}, ensure_ascii=False))
     return entry
 
 
-def parse_args() -> argparse.Namespace:
+class PollingWatcher:
+    """Fallback change detector comparing ``(mtime_ns, size)`` snapshots."""
+
+    def __init__(self, root: Path, interval: float = 1.0) -> None:
+        self.root = root
+        self.interval = interval
+        self.snapshot = self._take()
+
+    def _take(self) -> Dict[str, Tuple[int, int]]:
+        snapshot: Dict[str, Tuple[int, int]] = {}
+        index = PathIndex.build(self.root)
+        for entry in index.entries:
+            if entry in index.dirs:
+                continue
+            try:
+                stat = os.stat(entry)
+            except OSError:
+                continue
+            snapshot[entry] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self, timeout: float) -> set:
+        time.sleep(min(timeout, self.interval))
+        current = self._take()
+        previous, self.snapshot = self.snapshot, current
+        return {
+            path
+            for path in previous.keys() | current.keys()
+            if previous.get(path) != current.get(path)
+        }
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watcher (via ctypes) over every directory of a PathIndex."""
+
+    MASK = 0x8 | 0x40 | 0x80 | 0x100 | 0x200  # CLOSE_WRITE, MOVED_*, CREATE, DELETE
+    IN_Q_OVERFLOW = 0x4000
+    IN_ISDIR = 0x40000000
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self, index: PathIndex) -> None:
+        import ctypes
+
+        self.libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches: Dict[int, str] = {}
+        self.overflowed = False
+        for directory in sorted(index.dirs):
+            self.add(directory)
+
+    def add(self, directory: str) -> None:
+        import ctypes
+
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self.watches[wd] = directory
+
+    def wait(self, timeout: float) -> set:
+        changed: set = set()
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return changed
+        try:
+            buffer = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset + self.EVENT.size <= len(buffer):
+            wd, mask, _, length = self.EVENT.unpack_from(buffer, offset)
+            raw_name = buffer[offset + self.EVENT.size : offset + self.EVENT.size + length]
+            offset += self.EVENT.size + length
+            if mask & self.IN_Q_OVERFLOW:
+                self.overflowed = True
+                continue
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+            name = os.fsdecode(raw_name.rstrip(b"\x00"))
+            path = os.path.join(directory, name) if name else directory
+            changed.add(path)
+            if mask & self.IN_ISDIR and mask & 0x100 and name not in SKIP_DIRS:
+                try:
+                    self.add(path)
+                except OSError:
+                    self.overflowed = True
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def make_watcher(root: Path, index: PathIndex, interval: float):
+    try:
+        return InotifyWatcher(index)
+    except (OSError, AttributeError, TypeError):
+        return PollingWatcher(root, interval)
+
+
+class WatchSession:
+    """Keeps per-file findings, the path index and the link graph hot.
+
+    ``apply`` re-checks only the touched documents plus the documents that
+    link to touched paths, and returns ``added`` / ``resolved`` diff payloads.
+    With ``track_new``, Markdown files that appear later become targets when
+    discovery would have picked them (``.gitignore`` and ``globs`` apply).
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        targets: Sequence[Path],
+        track_new: bool,
+        rules: Optional[RuleSet] = None,
+        globs: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.root = root
+        self.rules = rules
+        self.targets = set(targets)
+        self.track_new = TargetFilter(root, globs) if track_new else None
+        self.index = PathIndex.build(root)
+        self.graph = LinkGraph(root).refresh(self.index.markdown_files(), self.index)
+        self.anchors = AnchorIndex.from_graph(self.graph)
+        self.findings: Dict[Path, List[dict]] = {}
+
+    def _check(self, path: Path) -> List[dict]:
+        recorder = RecordingLogger()
+        check_file(
+            path, self.root, recorder, index=self.index, anchors=self.anchors, rules=self.rules
+        )
+        return recorder.records
+
+    def initial(self, logger: CheckLogger) -> int:
+        for path in sorted(self.targets):
+            self.findings[path] = self._check(path)
+            for payload in self.findings[path]:
+                logger.write(payload)
+        return len(self.findings)
+
+    def apply(self, changed: Iterable[str], full: bool = False) -> Tuple[int, List[dict]]:
+        changed = set(changed)
+        if full:
+            # The watcher lost events: nothing short of a rescan is reliable.
+            self.index = PathIndex.build(self.root)
+            self.graph.refresh(self.index.markdown_files(), self.index)
+            self.anchors = AnchorIndex.from_graph(self.graph)
+            touched = changed
+        else:
+            touched = changed | self.index.update(changed)
+            for doc in self.graph.refresh_paths(touched, self.index):
+                entry = self.graph.docs.get(doc)
+                if entry is None:
+                    self.anchors.slugs.pop(doc, None)
+                else:
+                    self.anchors.slugs[doc] = frozenset(entry["anchors"])
+        if self.track_new is not None:
+            if full or any(os.path.basename(raw) == ".gitignore" for raw in changed):
+                self.track_new.reset()
+                candidates: Iterable[Path] = self.index.markdown_files()
+            else:
+                candidates = (Path(doc) for doc in touched if doc in self.graph.docs)
+            self.targets.update(filter(self.track_new, candidates))
+        if full:
+            affected = set(self.targets)
+        else:
+            keys = set()
+            for raw in touched:
+                keys.add(raw)
+                keys.update(str(parent) for parent in Path(raw).parents)
+            affected = {Path(doc) for doc in self.graph.dependents(keys)}
+            affected.update(Path(raw) for raw in touched if raw.endswith(".md"))
+            affected &= self.targets
+        diffs: List[dict] = []
+        for path in sorted(affected):
+            before = self.findings.pop(path, [])
+            after = self._check(path) if path.is_file() else []
+            if after:
+                self.findings[path] = after
+            elif not path.exists():
+                self.targets.discard(path)
+            diffs.extend(_diff_records(before, after))
+        return len(affected), diffs
+
+    def errors(self) -> int:
+        return sum(
+            1
+            for records in self.findings.values()
+            for payload in records
+            if payload["severity"] == "error"
+        )
+
+
+def _diff_records(before: List[dict], after: List[dict]) -> List[dict]:
+    """Findings only in ``before`` (resolved) and only in ``after`` (added)."""
+    diffs = []
+    for change, source, other in (("resolved", before, after), ("added", after, before)):
+        unmatched = Counter(dumps_payload(payload) for payload in other)
+        for payload in source:
+            key = dumps_payload(payload)
+            if unmatched[key] > 0:
+                unmatched[key] -= 1
+            else:
+                diffs.append({"type": "diff", "change": change, **payload})
+    return diffs
+
+
+def run_watch(
+    args: argparse.Namespace, root: Path, targets: List[Path], rules: Optional[RuleSet] = None
+) -> None:
+    logger = CheckLogger(flush_size=args.flush_size)
+    # Only discovery modes pick up new files; explicit paths stay fixed.
+    track_new = bool(args.all or args.glob) or not (args.paths or args.stdin_0)
+    session = WatchSession(root, targets, track_new, rules=rules, globs=args.glob)
+    scanned = session.initial(logger)
+    logger.flush()
+    summarize(scanned, logger, args, False)
+    watcher = make_watcher(root, session.index, args.watch_interval)
+    try:
+        while True:
+            changed = watcher.wait(args.watch_interval)
+            if not changed and not getattr(watcher, "overflowed", False):
+                continue
+            # Debounce editors that write through several syscalls.
+            changed |= watcher.wait(WATCH_DEBOUNCE_SECONDS)
+            full = getattr(watcher, "overflowed", False)
+            if full:
+                watcher.overflowed = False
+            checked, diffs = session.apply(changed, full=full)
+            for payload in diffs:
+                print(dumps_payload(payload))
+            print(
+                json.dumps(
+                    {
+                        "type": "watch",
+                        "files_checked": checked,
+                        "added": sum(1 for d in diffs if d["change"] == "added"),
+                        "resolved": sum(1 for d in diffs if d["change"] == "resolved"),
+                        "errors": session.errors(),
+                    },
+                    ensure_ascii=False,
+                ),
+                flush=True,
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+LSP_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+LSP_SOURCE = "starlist-md"
+
+
+def lsp_offset(text: str, line: int, character: int) -> int:
+    """String offset of an LSP position (``character`` counts UTF-16 units)."""
+    start = 0
+    for _ in range(line):
+        match = LSP_LINE_BREAK.search(text, start)
+        if match is None:
+            return len(text)
+        start = match.end()
+    match = LSP_LINE_BREAK.search(text, start)
+    end = match.start() if match else len(text)
+    offset = start
+    units = 0
+    while offset < end and units < character:
+        units += 2 if ord(text[offset]) > 0xFFFF else 1
+        offset += 1
+    return offset
+
+
+def utf16_length(text: str) -> int:
+    return len(text) + sum(1 for char in text if ord(char) > 0xFFFF)
+
+
+def lsp_end_position(text: str) -> dict:
+    line = 0
+    start = 0
+    for match in LSP_LINE_BREAK.finditer(text):
+        line += 1
+        start = match.end()
+    return {"line": line, "character": utf16_length(text[start:])}
+
+
+def uri_to_path(uri: str) -> Optional[Path]:
+    parsed = urlparse(uri)
+    if parsed.scheme != "file":
+        return None
+    return Path(unquote(parsed.path))
+
+
+# Each text fixer paired with the check codes it resolves.
+LSP_FIXERS = (
+    (
+        fix_frontmatter_text,
+        lambda code: code.startswith("frontmatter-"),
+        "Fix frontmatter block",
+    ),
+    (
+        fix_dod_section_text,
+        lambda code: code == "section-dod",
+        "Append DoD (Definition of Done) section",
+    ),
+)
+
+
+class LspServer:
+    """Minimal stdio Language Server Protocol front-end over ``check_file``.
+
+    Open documents are validated from their in-memory text after every edit
+    (incremental sync, UTF-16 positions). The tree is walked once; after
+    that the path index, link graph and anchor index are updated only for
+    the paths reported by open, save and ``workspace/didChangeWatchedFiles``.
+    Code actions are backed by the same text fixers as ``--autofix``.
+    """
+
+    def __init__(self, root: Path, reader, writer) -> None:
+        self.root = root
+        self.reader = reader
+        self.writer = writer
+        self.documents: Dict[str, str] = {}
+        self.index: Optional[PathIndex] = None
+        self.graph: Optional[LinkGraph] = None
+        self.anchors: Optional[AnchorIndex] = None
+        self.shutdown_requested = False
+
+    def read_message(self) -> Optional[dict]:
+        length = None
+        while True:
+            header = self.reader.readline()
+            if not header:
+                return None
+            header = header.strip()
+            if not header:
+                break
+            name, _, value = header.decode("ascii", errors="replace").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value.strip())
+        if length is None:
+            return None
+        return json.loads(self.reader.read(length).decode("utf-8"))
+
+    def send(self, message: dict) -> None:
+        body = json.dumps({"jsonrpc": "2.0", **message}, ensure_ascii=False).encode("utf-8")
+        self.writer.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+        self.writer.flush()
+
+    def run(self) -> int:
+        """Serve until ``exit`` or end of input.
+
+        A failing handler never ends the server: requests get a JSON-RPC
+        error reply and notifications are logged to stderr.
+        """
+        while True:
+            try:
+                message = self.read_message()
+            except ValueError as exc:
+                self.send({"id": None, "error": {"code": -32700, "message": f"Parse error: {exc}"}})
+                continue
+            if message is None:
+                return 0 if self.shutdown_requested else 1
+            if not isinstance(message, dict):
+                self.send({"id": None, "error": {"code": -32600, "message": "Invalid request"}})
+                continue
+            method = message.get("method")
+            if method == "exit":
+                return 0 if self.shutdown_requested else 1
+            handler = getattr(self, "on_" + str(method or "").replace("/", "_"), None)
+            params = message.get("params") or {}
+            if "id" not in message:
+                if handler is not None:
+                    try:
+                        handler(params)
+                    except Exception as exc:
+                        print(f"starlist-md: {method} failed: {exc!r}", file=sys.stderr)
+                continue
+            if handler is None:
+                self.send(
+                    {
+                        "id": message["id"],
+                        "error": {"code": -32601, "message": f"Unhandled method {method}"},
+                    }
+                )
+                continue
+            try:
+                result = handler(params)
+            except Exception as exc:
+                self.send(
+                    {
+                        "id": message["id"],
+                        "error": {"code": -32603, "message": f"{method} failed: {exc!r}"},
+                    }
+                )
+                continue
+            self.send({"id": message["id"], "result": result})
+
+    def refresh_indexes(self, paths: Optional[Iterable[str]] = None) -> None:
+        """Walk the tree, or with ``paths`` re-examine only those paths."""
+        if self.index is None or self.graph is None or self.anchors is None or paths is None:
+            self.index = PathIndex.build(self.root)
+            if self.graph is None:
+                self.graph = LinkGraph(self.root, self.root / DEFAULT_LINK_GRAPH_PATH).load()
+            self.graph.refresh(self.index.markdown_files(), self.index)
+            self.anchors = AnchorIndex.from_graph(self.graph)
+        else:
+            paths = set(paths)
+            touched = paths | self.index.update(paths)
+            for doc in self.graph.refresh_paths(touched, self.index):
+                entry = self.graph.docs.get(doc)
+                if entry is None:
+                    self.anchors.slugs.pop(doc, None)
+                else:
+                    self.anchors.slugs[doc] = frozenset(entry["anchors"])
+        for uri, text in self.documents.items():
+            path = uri_to_path(uri)
+            if path is not None:
+                self.anchors.slugs[str(path)] = frozenset(heading_anchors(text.splitlines()))
+
+    def diagnostics(self, path: Path, text: str) -> List[dict]:
+        if self.index is None:
+            self.refresh_indexes()
+        recorder = RecordingLogger()
+        check_file(
+            path,
+            self.root,
+            recorder,
+            raw_content=text.encode("utf-8"),
+            index=self.index,
+            anchors=self.anchors,
+        )
+        lines = text.splitlines()
+        diagnostics = []
+        for payload in recorder.records:
+            line = max(payload["line"] - 1, 0)
+            width = utf16_length(lines[line]) if line < len(lines) else 0
+            diagnostics.append(
+                {
+                    "range": {
+                        "start": {"line": line, "character": 0},
+                        "end": {"line": line, "character": width},
+                    },
+                    "severity": 1 if payload["severity"] == "error" else 3,
+                    "code": payload["check"],
+                    "source": LSP_SOURCE,
+                    "message": payload["message"],
+                    "data": {"fixable": payload["fixable"]},
+                }
+            )
+        return diagnostics
+
+    def publish(self, uri: str) -> None:
+        path = uri_to_path(uri)
+        if path is None:
+            return
+        self.send(
+            {
+                "method": "textDocument/publishDiagnostics",
+                "params": {"uri": uri, "diagnostics": self.diagnostics(path, self.documents[uri])},
+            }
+        )
+
+    def on_initialize(self, params: dict) -> dict:
+        root_uri = params.get("rootUri")
+        root_path = uri_to_path(root_uri) if root_uri else None
+        if root_path is not None:
+            self.root = root_path.resolve()
+        self.refresh_indexes()
+        return {
+            "capabilities": {
+                "textDocumentSync": {"openClose": True, "change": 2, "save": True},
+                "codeActionProvider": {"codeActionKinds": ["quickfix", "source.fixAll"]},
+            },
+            "serverInfo": {"name": LSP_SOURCE},
+        }
+
+    def on_shutdown(self, params: dict) -> None:
+        self.shutdown_requested = True
+        if self.graph is not None:
+            self.graph.save()
+        return None
+
+    def on_textDocument_didOpen(self, params: dict) -> None:
+        document = params["textDocument"]
+        self.documents[document["uri"]] = document["text"]
+        self.refresh_indexes(self._paths([document["uri"]]))
+        self.publish(document["uri"])
+
+    def on_textDocument_didChange(self, params: dict) -> None:
+        uri = params["textDocument"]["uri"]
+        text = self.documents.get(uri, "")
+        for change in params["contentChanges"]:
+            if "range" not in change:
+                text = change["text"]
+                continue
+            start = lsp_offset(text, **change["range"]["start"])
+            end = lsp_offset(text, **change["range"]["end"])
+            text = text[:start] + change["text"] + text[end:]
+        self.documents[uri] = text
+        self.publish(uri)
+        path = uri_to_path(uri)
+        if path is None or self.anchors is None or self.graph is None:
+            return
+        # Re-publish open documents that link here when the anchors moved.
+        doc = str(path)
+        slugs = frozenset(heading_anchors(text.splitlines()))
+        if self.anchors.slugs.get(doc) == slugs:
+            return
+        self.anchors.slugs[doc] = slugs
+        dependents = self.graph.dependents([doc])
+        for other in list(self.documents):
+            other_path = uri_to_path(other)
+            if other != uri and other_path is not None and str(other_path) in dependents:
+                self.publish(other)
+
+    def on_textDocument_didSave(self, params: dict) -> None:
+        uri = params["textDocument"]["uri"]
+        self.refresh_indexes(self._paths([uri]))
+        if uri in self.documents:
+            self.publish(uri)
+
+    def on_workspace_didChangeWatchedFiles(self, params: dict) -> None:
+        self.refresh_indexes(self._paths(change["uri"] for change in params.get("changes", [])))
+        for uri in list(self.documents):
+            self.publish(uri)
+
+    @staticmethod
+    def _paths(uris: Iterable[str]) -> List[str]:
+        return [str(path) for path in map(uri_to_path, uris) if path is not None]
+
+    def on_textDocument_didClose(self, params: dict) -> None:
+        uri = params["textDocument"]["uri"]
+        self.documents.pop(uri, None)
+        self.send(
+            {"method": "textDocument/publishDiagnostics", "params": {"uri": uri, "diagnostics": []}}
+        )
+
+    def on_textDocument_codeAction(self, params: dict) -> List[dict]:
+        uri = params["textDocument"]["uri"]
+        path = uri_to_path(uri)
+        text = self.documents.get(uri)
+        if path is None or text is None:
+            return []
+        reported = [
+            diagnostic
+            for diagnostic in params.get("context", {}).get("diagnostics", [])
+            if diagnostic.get("source") == LSP_SOURCE
+        ]
+        actions = []
+        fixed_text = text
+        for fixer, resolves, title in LSP_FIXERS:
+            fixed = fixer(ParsedDocument.from_text(path, text))
+            if fixed is not None:
+                actions.append(
+                    self._code_action(
+                        uri,
+                        text,
+                        fixed[0],
+                        title,
+                        "quickfix",
+                        [d for d in reported if resolves(str(d.get("code", "")))],
+                    )
+                )
+            fixed = fixer(ParsedDocument.from_text(path, fixed_text))
+            if fixed is not None:
+                fixed_text = fixed[0]
+        if len(actions) > 1:
+            actions.append(
+                self._code_action(
+                    uri, text, fixed_text, "Apply all STARLIST auto-fixes", "source.fixAll", reported
+                )
+            )
+        return actions
+
+    @staticmethod
+    def _code_action(
+        uri: str, text: str, new_text: str, title: str, kind: str, diagnostics: List[dict]
+    ) -> dict:
+        edit = {
+            "range": {"start": {"line": 0, "character": 0}, "end": lsp_end_position(text)},
+            "newText": new_text,
+        }
+        action = {"title": title, "kind": kind, "edit": {"changes": {uri: [edit]}}}
+        if diagnostics:
+            action["diagnostics"] = diagnostics
+        return action
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="STARLIST Extended Markdown Governance Validator"
     )
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Run checks without modifying files (default behavior).",
+        help="Run checks without modifying files or saving the result cache and link graph.",
     )
     parser.add_argument(
         "--autofix",
@@ -906,6 +3857,11 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="Write Markdown test report to the specified path.",
     )
+    parser.add_argument(
+        "--report-log",
+        type=Path,
+        help="Stream every error to this companion file (.jsonl for JSON lines, else Markdown).",
+    )
     parser.add_argument(
         "--root",
         type=Path,
@@ -917,29 +3873,277 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Read null-delimited paths from STDIN (for find . -print0).",
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Discover every *.md under --root (prunes SKIP_DIRS and .gitignore'd trees).",
+    )
+    parser.add_argument(
+        "--glob",
+        action="append",
+        metavar="PATTERN",
+        help="Discover *.md whose root-relative path matches PATTERN (fnmatch, repeatable).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for checks (0 = one per CPU).",
+    )
+    parser.add_argument(
+        "--no-discover",
+        action="store_true",
+        help="Exit instead of scanning the whole tree when no explicit target exists (CI).",
+    )
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=0,
+        metavar="DEPTH",
+        help="Read up to DEPTH files ahead on background threads while checking (0 = off).",
+    )
+    parser.add_argument(
+        "--flush-size",
+        type=int,
+        default=DEFAULT_FLUSH_SIZE,
+        help="Number of JSON lines buffered before each write to stdout.",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help=f"Result cache location (default: <root>/{DEFAULT_CACHE_PATH}).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-validate every target without reading or writing the cache.",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="REV",
+        help="Validate only Markdown changed since REV plus documents linking to changed paths.",
+    )
+    parser.add_argument(
+        "--orphans",
+        action="store_true",
+        help="List Markdown documents that no other document links to, then exit.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-validate touched files (inotify, polling fallback).",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=1.0,
+        help="Polling interval in seconds when inotify is unavailable.",
+    )
+    parser.add_argument(
+        "--select",
+        action="append",
+        metavar="RULES",
+        help="Run only these rules / check codes / code prefixes (comma-separated, repeatable).",
+    )
+    parser.add_argument(
+        "--ignore",
+        action="append",
+        metavar="RULES",
+        help="Skip these rules / check codes / code prefixes (comma-separated, repeatable).",
+    )
+    parser.add_argument(
+        "--profiles",
+        default=DEFAULT_PROFILE,
+        metavar="NAMES",
+        help=f"Rule profiles evaluated from one parse per file ({', '.join(PROFILES)}; comma-separated).",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record wall/CPU time and call counts per rule and per file (runs checks in-process).",
+    )
+    parser.add_argument(
+        "--profile-trace",
+        type=Path,
+        help="Also write a Chrome trace (speedscope-compatible) of every rule invocation.",
+    )
+    parser.add_argument(
+        "--lsp",
+        action="store_true",
+        help="Serve diagnostics and code actions over the Language Server Protocol (stdio).",
+    )
     parser.add_argument("paths", nargs="*", help="Markdown files to validate.")
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main() -> None:
-    args = parse_args()
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
     root = args.root.resolve()
-    logger = CheckLogger()
-    targets = collect_targets(args, root)
-    scanned = run_checks(targets, root, logger)
-
-    fixes_applied = False
-    if args.autofix:
-        fixes_applied = run_autofix(targets, logger)
-        if fixes_applied:
-            logger = CheckLogger()
-            scanned = run_checks(targets, root, logger)
-
-    summary = summarize(scanned, logger, args, fixes_applied)
-    if args.report:
-        build_report(args.report, summary, logger.entries, args)
-
-    exit_code = 0 if not logger.entries else 1
+    if args.lsp:
+        sys.exit(LspServer(root, sys.stdin.buffer, sys.stdout.buffer).run())
+    names = [name.strip() for name in args.profiles.split(",") if name.strip()]
+    verdicts = ProfileVerdicts(names or [DEFAULT_PROFILE], args.select, args.ignore)
+    rules = verdicts.rules
+    if len(verdicts.names) == 1:
+        # A single profile keeps the plain output format.
+        verdicts = None
+
+    def new_logger() -> CheckLogger:
+        # Only the first report rows are read back; the stream, stats and
+        # profile verdicts see every finding as it is logged.
+        if verdicts is None:
+            return CheckLogger(flush_size=args.flush_size, max_entries=REPORT_MAX_ROWS)
+        verdicts.restart()
+        return ProfileLogger(verdicts, flush_size=args.flush_size, max_entries=REPORT_MAX_ROWS)
+
+    logger = new_logger()
+    index = PathIndex.build(root)
+    graph_path = None if args.no_cache else root / DEFAULT_LINK_GRAPH_PATH
+    # Refreshing the link graph reads every changed document in the tree, so
+    # it is only done for the queries that need inbound links.
+    graph: Optional[LinkGraph] = None
+    if args.orphans or args.since:
+        graph = LinkGraph(root, graph_path).load().refresh(index.markdown_files(), index)
+    if args.orphans:
+        if not args.dry_run:
+            graph.save()
+        for doc in graph.orphans():
+            print(json.dumps({"type": "orphan", "file": doc}, ensure_ascii=False))
+        sys.exit(0)
+    if args.since:
+        targets = collect_since_targets(root, args.since, index, graph)
+    else:
+        targets = collect_targets(args, root)
+    if args.watch:
+        run_watch(args, root, targets, rules)
+        return
+    cache = None
+    if not args.no_cache:
+        cache_path = args.cache or root / DEFAULT_CACHE_PATH
+        fingerprint = rules_fingerprint(rules)
+        if (rules.select or rules.ignore) and args.cache is None:
+            # Keep subset runs (e.g. pre-commit) from evicting the full-run cache.
+            cache_path = cache_path.with_name(f"{cache_path.stem}-{fingerprint[:8]}.json")
+        cache = ResultCache(cache_path, fingerprint).load()
+    # Without a graph, link target anchors are parsed on demand.
+    anchors = AnchorIndex.from_graph(graph) if graph is not None else AnchorIndex()
+    profiler = None
+    if args.profile or args.profile_trace:
+        profiler = RuleProfiler(trace=args.profile_trace is not None)
+    stats = IssueStats(root)
+    logger.sinks.append(stats)
+    stream = ReportStream(args.report_log) if args.report_log else None
+    if stream is not None:
+        logger.sinks.append(stream)
+    fixer = Autofixer() if args.autofix else None
+    on_document = fixer.feed if fixer is not None else None
+    # Without a saved graph, the autofix recheck only needs the targets'
+    # links, so record them from the documents the first pass parses.
+    target_graph = LinkGraph(root) if fixer is not None and graph_path is None else None
+    if target_graph is not None:
+
+        def on_document(doc: ParsedDocument) -> None:
+            fixer.feed(doc)  # type: ignore[union-attr]
+            target_graph.record(doc, index)  # type: ignore[union-attr]
+
+    try:
+        outcomes: Optional[List[Tuple[bool, List[dict]]]] = [] if args.autofix else None
+        scanned = run_checks(
+            targets,
+            root,
+            logger,
+            jobs=args.jobs,
+            cache=cache,
+            index=index,
+            anchors=anchors,
+            outcomes=outcomes,
+            profiler=profiler,
+            rules=rules,
+            prefetch=args.prefetch,
+            on_document=on_document,
+        )
+
+        fixes_applied = False
+        if fixer is not None:
+            changed = fixer.commit(targets, logger)
+            fixes_applied = bool(changed)
+            if fixes_applied:
+                logger.flush()
+                logger = new_logger()
+                stats = IssueStats(root)
+                logger.sinks.append(stats)
+                if stream is not None:
+                    stream.restart()
+                    logger.sinks.append(stream)
+                if target_graph is not None:
+                    # Reads only the rewritten targets and those checked
+                    # outside this process; other documents' anchors stay
+                    # memoized in ``anchors``.
+                    graph = target_graph.refresh(targets, index)
+                    for path in changed:
+                        anchors.slugs.pop(str(path), None)
+                else:
+                    if graph is None:
+                        graph = LinkGraph(root, graph_path).load()
+                    graph.refresh(index.markdown_files(), index)
+                    anchors = AnchorIndex.from_graph(graph)
+                scanned = recheck_changed(
+                    targets,
+                    outcomes,
+                    changed,
+                    root,
+                    logger,
+                    jobs=args.jobs,
+                    cache=cache,
+                    index=index,
+                    anchors=anchors,
+                    graph=graph,
+                    profiler=profiler,
+                    rules=rules,
+                    prefetch=args.prefetch,
+                )
+    except BaseException:
+        # Keep the findings already produced on stdout.
+        logger.flush()
+        if fixer is not None:
+            fixer.abort()
+        if stream is not None:
+            stream.abort()
+        raise
+    if stream is not None:
+        stream.close()
+
+    logger.flush()
+    if profiler is not None:
+        print(json.dumps(profiler.summary(), ensure_ascii=False))
+    summary = summarize(scanned, logger, args, fixes_applied, stats, verdicts)
+    # The cache and link graph only speed up later runs: failing to save them
+    # must not cost the run its report, so they are committed on their own.
+    # A dry run leaves them untouched.
+    for name, store in (("result cache", cache), ("link graph", graph)):
+        if store is None or args.dry_run:
+            continue
+        try:
+            with BatchWriter() as batch:
+                store.save(batch)
+        except OSError as exc:
+            print(f"warning: could not save the {name}: {exc}", file=sys.stderr)
+    with BatchWriter() as batch:
+        if args.profile_trace:
+            profiler.write_trace(args.profile_trace, batch)
+        if args.report:
+            build_report(
+                args.report,
+                summary,
+                logger.entries,
+                args,
+                batch,
+                issue_log=args.report_log,
+                stats=stats,
+            )
+
+    exit_code = 0 if not logger.error_count else 1
     sys.exit(exit_code)
 
 
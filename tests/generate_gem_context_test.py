@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the STARLIST Gem knowledge base generator
+"""
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from scripts.generate_gem_context import (
+    BudgetedWriter,
+    TRUNCATION_NOTE,
+    estimate_tokens,
+    generate_context,
+)
+
+SOURCES = [
+    "docs/overview/STARLIST_OVERVIEW.md",
+    "docs/development/starlist-rules.md",
+    "docs/planning/Task.md",
+    "docs/aistudio/starlist_context.md",
+]
+
+
+class TestGenerateGemContext(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.previous_cwd = os.getcwd()
+        for number, relative in enumerate(SOURCES):
+            path = self.temp_dir / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            lines = [f"line {row} of source {number} — 説明テキスト" for row in range(200)]
+            path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        (self.temp_dir / "lib").mkdir()
+        (self.temp_dir / "lib" / "main.dart").write_text("void main() {}\n", encoding="utf-8")
+        os.chdir(self.temp_dir)
+
+    def tearDown(self):
+        os.chdir(self.previous_cwd)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def generate(self, **limits) -> str:
+        output = self.temp_dir / "out.md"
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_context(str(output), **limits)
+        return output.read_text(encoding="utf-8")
+
+    def assert_fences_closed(self, text: str):
+        fences = [line for line in text.splitlines() if line.startswith("```")]
+        self.assertEqual(len(fences) % 2, 0)
+
+    def test_unlimited_output_copies_every_source(self):
+        """Test that without limits every source and the listing are copied whole"""
+        text = self.generate()
+        for number in range(len(SOURCES)):
+            self.assertIn(f"line 199 of source {number}", text)
+        self.assertIn("main.dart", text)
+        self.assertNotIn("(truncated:", text)
+        self.assert_fences_closed(text)
+
+    def test_max_bytes_is_a_hard_cap(self):
+        """Test that the whole file, framing included, stays within --max-bytes"""
+        for max_bytes in (0, 150, 400, 2000, 9000):
+            text = self.generate(max_bytes=max_bytes)
+            self.assertLessEqual(len(text.encode("utf-8")), max_bytes)
+            self.assert_fences_closed(text)
+        text = self.generate(max_bytes=2000)
+        self.assertIn(TRUNCATION_NOTE.format(reason="output byte budget"), text)
+        self.assertNotIn("## 2.", text)
+
+    def test_max_tokens_is_a_hard_cap(self):
+        """Test that the estimated token count stays within --max-tokens"""
+        text = self.generate(max_tokens=700)
+        self.assertLessEqual(estimate_tokens(text), 700)
+        self.assertIn(TRUNCATION_NOTE.format(reason="output token budget"), text)
+        self.assert_fences_closed(text)
+
+    def test_section_limit_truncates_each_section(self):
+        """Test that --section-max-bytes cuts every source section and the listing"""
+        text = self.generate(section_max_bytes=120)
+        marker = TRUNCATION_NOTE.format(reason="section limit")
+        self.assertEqual(text.count(marker), len(SOURCES) + 1)
+        for section in text.split("```markdown\n")[1:]:
+            body = section.split(marker, 1)[0]
+            self.assertLessEqual(len(body.encode("utf-8")), 120 + 1)
+        self.assert_fences_closed(text)
+
+    def test_truncation_note_starts_on_its_own_line(self):
+        """Test that the overflow marker is written after a line break"""
+        handle = io.StringIO()
+        writer = BudgetedWriter(handle)
+        writer.write("partial")
+        writer.truncated("section limit")
+        self.assertEqual(handle.getvalue(), "partial\n... (truncated: section limit)")
+
+    def test_copy_file_cuts_mid_file_on_a_line_boundary(self):
+        """Test that copy_file stops inside a file at the last whole line that fits"""
+        source = self.temp_dir / "docs" / "planning" / "Task.md"
+        content = source.read_text(encoding="utf-8")
+        handle = io.StringIO()
+        writer = BudgetedWriter(handle, max_bytes=500)
+
+        reason = writer.copy_file(str(source))
+
+        copied = handle.getvalue()
+        self.assertEqual(reason, "output byte budget")
+        self.assertTrue(content.startswith(copied))
+        self.assertTrue(copied.endswith("\n"))
+        self.assertLessEqual(writer.bytes_written, 500)
+        next_line = content[len(copied):].splitlines(keepends=True)[0]
+        self.assertGreater(writer.bytes_written + len(next_line.encode("utf-8")), 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
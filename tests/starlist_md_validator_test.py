@@ -2,18 +2,53 @@
 """
 Unit tests for STARLIST Markdown Validator
 """
+import io
+import json
+import pickle
 import unittest
 import tempfile
 from pathlib import Path
 from scripts.starlist_md_validator import (
     parse_frontmatter,
     extract_headings,
+    parse_toc,
+    scan_lines,
     CheckLogger,
+    RecordingLogger,
     run_checks,
     determine_governance,
+    ResultCache,
+    PathIndex,
+    collect_since_targets,
+    LinkGraph,
+    WatchSession,
+    LspServer,
+    apply_autofixes,
+    Autofixer,
+    BatchWriter,
+    ReportStream,
+    IssueStats,
+    IssueStore,
+    IssueEntry,
+    RuleProfiler,
+    RuleSet,
+    ParsedDocument,
+    fix_frontmatter_text,
+    fix_dod_section_text,
+    recheck_changed,
+    iter_markdown_files,
+    heading_anchors,
+    ProfileVerdicts,
+    ProfileLogger,
+    _prefetched,
     FORBIDDEN_WORDS,
     REQUIRED_FRONTMATTER,
+    ForbiddenWordMatcher,
+    KeywordGroupMatcher,
+    CURSOR_PROMPT_KEYWORDS,
+    GITHUB_COPILOT_PROMPT_KEYWORDS,
 )
+from scripts.starlist_md_benchmark import generate_corpus, run_benchmark
 
 
 class TestStarlistMdValidator(unittest.TestCase):
@@ -32,6 +67,15 @@ class TestStarlistMdValidator(unittest.TestCase):
         test_file.write_text(content, encoding="utf-8")
         return test_file
 
+    def lsp_frame(self, message: dict) -> bytes:
+        """Frame a JSON-RPC message the way an LSP client sends it"""
+        body = json.dumps({"jsonrpc": "2.0", **message}).encode("utf-8")
+        return b"Content-Length: %d\r\n\r\n" % len(body) + body
+
+    def lsp_messages(self, output: bytes) -> list:
+        """Split the server's output stream back into JSON-RPC messages"""
+        return [json.loads(chunk.split(b"\r\n\r\n", 1)[1]) for chunk in output.split(b"Content-Length: ")[1:]]
+
     def test_parse_frontmatter_valid(self):
         """Test parsing valid frontmatter"""
         content = """---
@@ -107,6 +151,35 @@ Some content here.
         levels = [level for level, line_num, text in headings]
         self.assertEqual(levels, [1, 2, 3, 2, 4])
 
+    def test_scan_lines_matches_standalone_parsers(self):
+        """Test that the single-pass scanner agrees with the helper parsers"""
+        content = """# Title
+
+## 目次
+- [Overview](#overview)
+- [Usage | CLI](#usage-cli)
+
+## Overview
+
+```ts
+const a = { b: 1 };
+```
+
+| A | B |
+|---|---|
+
+## Usage | CLI
+[doc](other.md)
+"""
+        lines = content.splitlines()
+        scan = scan_lines(lines)
+
+        self.assertEqual(scan.headings, extract_headings(lines))
+        self.assertEqual(scan.toc_entries, parse_toc(lines))
+        self.assertEqual([idx for idx, _ in scan.fences], [8, 10])
+        self.assertEqual(scan.table_rows, [12])
+        self.assertEqual(scan.link_lines, [3, 4, 16])
+
     def test_determine_governance(self):
         """Test governance determination"""
         # Governed file (in docs/ops/)
@@ -129,6 +202,16 @@ Some content here.
         self.assertIn("fixme", FORBIDDEN_WORDS)
         self.assertIn("wip", FORBIDDEN_WORDS)
 
+    def test_forbidden_word_matcher_reports_every_word_per_line(self):
+        """Test that the combined matcher keeps per-line, per-word reporting"""
+        matcher = ForbiddenWordMatcher(["temp", "temp fix", "todo"])
+        text = "a temp fix here\ntodo todo\ntemporary\n\ntemp"
+
+        self.assertEqual(
+            matcher.find_lines(text),
+            [(0, "temp"), (0, "temp fix"), (1, "todo"), (4, "temp")],
+        )
+
     def test_run_checks_valid_file(self):
         """Test running checks on a valid file"""
         content = """---
@@ -269,6 +352,715 @@ owner: Test Team
         error_codes = [entry["check"] for entry in self.logger.entries]
         self.assertIn("bom-detected", error_codes)
 
+    def test_run_checks_parallel_matches_serial(self):
+        """Test that --jobs output merges in the same order as a serial run"""
+        targets = [
+            self.create_test_file("# Doc A\n\nStill tbd.\n", "a.md"),
+            self.create_test_file("# Doc B\n\n[missing](nope.md)\n", "b.md"),
+            self.create_test_file("", "c.md"),
+        ]
+        serial = CheckLogger()
+        parallel = CheckLogger()
+        scanned_serial = run_checks(targets, self.temp_dir, serial)
+        scanned_parallel = run_checks(targets, self.temp_dir, parallel, jobs=2)
+
+        self.assertEqual(scanned_serial, scanned_parallel)
+        self.assertEqual(serial.entries, parallel.entries)
+
+    def test_result_cache_replays_and_invalidates_on_link_target(self):
+        """Test that cached results are replayed until a link target appears"""
+        target = self.create_test_file("# Doc\n\n[guide](guide.md)\n")
+        cache_path = self.temp_dir / "cache.json"
+
+        cold = CheckLogger()
+        run_checks([target], self.temp_dir, cold, cache=ResultCache(cache_path))
+        self.assertIn("link-missing", [entry.check for entry in cold.entries])
+
+        warm_cache = ResultCache(cache_path)
+        run_checks([target], self.temp_dir, CheckLogger(), cache=warm_cache)
+        warm_cache.save()
+        reloaded = ResultCache(cache_path).load()
+        warm = CheckLogger()
+        run_checks([target], self.temp_dir, warm, cache=reloaded)
+        self.assertEqual(reloaded.hits, 1)
+        self.assertEqual(cold.entries, warm.entries)
+
+        self.create_test_file("# Guide\n", "guide.md")
+        fresh = CheckLogger()
+        run_checks([target], self.temp_dir, fresh, cache=reloaded)
+        self.assertEqual(reloaded.hits, 1)
+        self.assertNotIn("link-missing", [entry.check for entry in fresh.entries])
+
+    def test_path_index_matches_resolve(self):
+        """Test that indexed lookups agree with Path.resolve().exists()"""
+        import os
+
+        (self.temp_dir / "docs" / "ops").mkdir(parents=True)
+        (self.temp_dir / "docs" / "ops" / "guide.md").write_text("# Guide\n")
+        (self.temp_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (self.temp_dir / "node_modules" / "pkg" / "README.md").write_text("x")
+        os.symlink(self.temp_dir / "docs" / "ops", self.temp_dir / "docs" / "link")
+        index = PathIndex.build(self.temp_dir)
+        base = self.temp_dir / "docs" / "ops"
+
+        for target in [
+            "guide.md",
+            "missing.md",
+            "../ops/guide.md",
+            "../../node_modules/pkg/README.md",
+            "../link/guide.md",
+            "../link/../ops/guide.md",
+            "../../../outside.md",
+        ]:
+            expected = (base / target).resolve()
+            candidate, exists = index.locate(str(base), target)
+            self.assertEqual(candidate, expected, target)
+            self.assertEqual(exists, expected.exists(), target)
+
+    def test_buffered_logger_preserves_json_lines(self):
+        """Test that buffered output matches one json.dumps line per payload"""
+        import contextlib
+        import io
+        import json
+
+        logger = CheckLogger(flush_size=3)
+        path = self.temp_dir / "doc \"quoted\".md"
+        stream = io.StringIO()
+        with contextlib.redirect_stdout(stream):
+            logger.error(path, 1, "forbidden-word", "Forbidden wording detected: tbd")
+            logger.error(path, 2, "link-missing", "Link target `日本語.md` not found.")
+            self.assertEqual(stream.getvalue(), "")
+            logger.info(path, "Frontmatter block auto-fix applied.", {"step": 1})
+            logger.error(path, 3, "empty-file", "File is empty or contains only whitespace.")
+            logger.flush()
+
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 4)
+        payloads = [json.loads(line) for line in lines]
+        self.assertEqual([payload["line"] for payload in payloads], [1, 2, 0, 3])
+        for line, payload in zip(lines, payloads):
+            self.assertEqual(line, json.dumps(payload, ensure_ascii=False))
+        self.assertEqual(len(logger.entries), 3)
+
+    def test_collect_since_targets_includes_link_dependents(self):
+        """Test that --since re-checks documents linking to deleted files"""
+        import subprocess
+
+        def git(*args):
+            subprocess.run(
+                ["git", "-c", "user.name=t", "-c", "user.email=t@example.invalid", *args],
+                cwd=self.temp_dir,
+                check=True,
+                capture_output=True,
+            )
+
+        linking = self.create_test_file("# A\n\n[b](b.md)\n", "a.md")
+        self.create_test_file("# B\n", "b.md")
+        self.create_test_file("# C\n", "c.md")
+        git("init", "-q")
+        git("add", "-A")
+        git("commit", "-qm", "init")
+
+        (self.temp_dir / "b.md").unlink()
+        edited = self.create_test_file("# C\n\nEdited.\n", "c.md")
+        targets = collect_since_targets(
+            self.temp_dir, "HEAD", PathIndex.build(self.temp_dir)
+        )
+
+        self.assertEqual(
+            [path.resolve() for path in targets],
+            [linking.resolve(), edited.resolve()],
+        )
+
+    def test_link_graph_persists_and_answers_queries(self):
+        """Test that the link graph reloads and reports dependents and orphans"""
+        hub = self.create_test_file("# Hub\n\n[a](a.md#intro) ![img](pic.png)\n", "hub.md")
+        leaf = self.create_test_file("# A\n\n[self](a.md)\n", "a.md")
+        graph_path = self.temp_dir / "graph.json"
+        index = PathIndex.build(self.temp_dir)
+        LinkGraph(self.temp_dir, graph_path).refresh([hub, leaf], index).save()
+
+        graph = LinkGraph(self.temp_dir, graph_path).load()
+        self.assertEqual(
+            graph.docs[str(hub)]["links"],
+            [[str(self.temp_dir / "pic.png"), ""], [str(leaf), "intro"]],
+        )
+        self.assertEqual(graph.dependents([str(leaf)]), {str(hub), str(leaf)})
+        self.assertEqual(graph.orphans(), [str(hub)])
+
+        graph.refresh([hub, leaf], index)
+        self.assertFalse(graph.dirty)
+
+    def test_run_checks_cross_document_anchor(self):
+        """Test that other.md#section links are validated against headings"""
+        self.create_test_file("# Guide\n\n## Setup Steps\n\n## 背景 (Background)\n", "guide.md")
+        source = self.create_test_file(
+            "# Doc\n\n"
+            "[ok](guide.md#setup-steps)\n"
+            "[encoded](guide.md#%E8%83%8C%E6%99%AF-background)\n"
+            "[broken](guide.md#teardown)\n",
+            "doc.md",
+        )
+        run_checks([source], self.temp_dir, self.logger)
+
+        anchor_errors = [
+            entry.line for entry in self.logger.entries if entry.check == "link-anchor-missing"
+        ]
+        self.assertEqual(anchor_errors, [5])
+
+    def test_heading_anchors_follow_github_slugs(self):
+        """Test that heading markup is stripped and each space becomes one hyphen"""
+        lines = ["## [Foo](bar.md)", "## Foo  Bar", "## **Bold** _it_ `code`", "## Foo"]
+        self.assertEqual(
+            heading_anchors(lines), ["foo", "foo--bar", "bold-it-code", "foo-1"]
+        )
+
+        self.create_test_file("\n".join(["# Guide", *lines]) + "\n", "guide.md")
+        source = self.create_test_file(
+            "# Doc\n\n[a](guide.md#foo)\n[b](guide.md#foo--bar)\n[c](guide.md#foo-bar)\n",
+            "doc.md",
+        )
+        run_checks([source], self.temp_dir, self.logger)
+        anchor_errors = [
+            entry.line for entry in self.logger.entries if entry.check == "link-anchor-missing"
+        ]
+        self.assertEqual(anchor_errors, [5])
+
+    def test_result_cache_invalidates_when_target_anchor_changes(self):
+        """Test that cached anchor verdicts are dropped when target headings change"""
+        self.create_test_file("# Guide\n\n## Setup\n", "guide.md")
+        source = self.create_test_file("# Doc\n\n[s](guide.md#setup)\n", "doc.md")
+        cache = ResultCache(self.temp_dir / "cache.json")
+        run_checks([source], self.temp_dir, CheckLogger(), cache=cache)
+
+        self.create_test_file("# Guide\n\n## Install\n", "guide.md")
+        logger = CheckLogger()
+        run_checks([source], self.temp_dir, logger, cache=cache)
+
+        self.assertEqual(cache.hits, 0)
+        self.assertIn("link-anchor-missing", [entry.check for entry in logger.entries])
+
+    def test_watch_session_emits_incremental_diffs(self):
+        """Test that watch mode re-checks touched files and their link dependents"""
+        source = self.create_test_file("# Doc\n\n[guide](guide.md)\n", "doc.md")
+        other = self.create_test_file("# Other\n\nStill tbd.\n", "other.md")
+        session = WatchSession(self.temp_dir, [source, other], track_new=True)
+        session.initial(CheckLogger())
+
+        guide = self.create_test_file("# Guide\n", "guide.md")
+        checked, diffs = session.apply([str(guide)])
+
+        self.assertEqual(checked, 2)
+        changes = [(diff["change"], diff["file"], diff["check"]) for diff in diffs]
+        self.assertIn(("resolved", str(source), "link-missing"), changes)
+        self.assertFalse(any(diff["file"] == str(other) for diff in diffs))
+        self.assertTrue(all(diff["change"] != "added" or diff["file"] == str(guide) for diff in diffs))
+
+    def test_path_index_update_matches_a_rebuild(self):
+        """Test that applying change events to a PathIndex equals rebuilding it"""
+        kept = self.create_test_file("# Kept\n", "kept.md")
+        gone = self.create_test_file("# Gone\n", "gone.md")
+        (self.temp_dir / "old" / "sub").mkdir(parents=True)
+        old = self.create_test_file("# Old\n", "old/sub/old.md")
+        index = PathIndex.build(self.temp_dir)
+
+        gone.unlink()
+        import shutil
+        shutil.rmtree(self.temp_dir / "old")
+        (self.temp_dir / "new" / "deep").mkdir(parents=True)
+        added = self.create_test_file("# New\n", "new/deep/new.md")
+        kept.write_text("# Kept\n\nedited\n", encoding="utf-8")
+        touched = index.update([str(gone), str(old), str(added), str(kept)])
+
+        fresh = PathIndex.build(self.temp_dir)
+        self.assertEqual(
+            (index.entries, index.dirs, index.symlinks), (fresh.entries, fresh.dirs, fresh.symlinks)
+        )
+        self.assertIn(str(old), touched)
+        self.assertIn(str(self.temp_dir / "new"), touched)
+        self.assertEqual(index.markdown_files(), [kept, added])
+
+    def test_watch_session_tracks_new_files_like_discovery(self):
+        """Test that files appearing during watch pass the same glob and .gitignore filter"""
+        (self.temp_dir / ".gitignore").write_text("scratch/\n", encoding="utf-8")
+        ops = self.temp_dir / "docs" / "ops"
+        ops.mkdir(parents=True)
+        first = ops / "a.md"
+        first.write_text("# A\n", encoding="utf-8")
+        session = WatchSession(self.temp_dir, [first], track_new=True, globs=["*docs/ops/*.md"])
+        session.initial(CheckLogger())
+
+        added = ops / "b.md"
+        added.write_text("# B\n\nStill tbd.\n", encoding="utf-8")
+        outside = self.create_test_file("# Other\n\nStill tbd.\n", "b.md")
+        (self.temp_dir / "scratch" / "docs" / "ops").mkdir(parents=True)
+        ignored = self.create_test_file("# Scratch\n", "scratch/docs/ops/c.md")
+        _, diffs = session.apply([str(added), str(outside), str(ignored)])
+
+        self.assertEqual({diff["file"] for diff in diffs}, {str(added)})
+        self.assertEqual(session.targets, {first, added})
+
+    def test_lsp_server_publishes_diagnostics_and_fixes(self):
+        """Test the LSP front-end on in-memory streams with incremental edits"""
+        doc = self.temp_dir / "docs" / "ops" / "guide.md"
+        doc.parent.mkdir(parents=True)
+        doc.write_text("# Guide 🚀\n", encoding="utf-8")
+        uri = doc.as_uri()
+
+        requests = [
+            {"id": 1, "method": "initialize", "params": {"rootUri": self.temp_dir.as_uri()}},
+            {
+                "method": "textDocument/didOpen",
+                "params": {"textDocument": {"uri": uri, "text": "# Guide 🚀\n"}},
+            },
+            {
+                "method": "textDocument/didChange",
+                "params": {
+                    "textDocument": {"uri": uri},
+                    "contentChanges": [
+                        {
+                            "range": {
+                                "start": {"line": 0, "character": 10},
+                                "end": {"line": 0, "character": 10},
+                            },
+                            "text": " tbd",
+                        }
+                    ],
+                },
+            },
+            {"id": 2, "method": "textDocument/codeAction", "params": {"textDocument": {"uri": uri}}},
+            {"id": 3, "method": "shutdown"},
+            {"method": "exit"},
+        ]
+        output = io.BytesIO()
+        server = LspServer(self.temp_dir, io.BytesIO(b"".join(map(self.lsp_frame, requests))), output)
+        self.assertEqual(server.run(), 0)
+
+        messages = self.lsp_messages(output.getvalue())
+        published = [m["params"] for m in messages if m.get("method") == "textDocument/publishDiagnostics"]
+        self.assertEqual(server.documents[uri], "# Guide 🚀 tbd\n")
+        codes = {d["code"] for d in published[-1]["diagnostics"]}
+        self.assertIn("frontmatter-missing", codes)
+        self.assertIn("forbidden-word", codes - {d["code"] for d in published[0]["diagnostics"]})
+
+        actions = next(m["result"] for m in messages if m.get("id") == 2)
+        kinds = [action["kind"] for action in actions]
+        self.assertEqual(kinds, ["quickfix", "quickfix", "source.fixAll"])
+        new_text = actions[-1]["edit"]["changes"][uri][0]["newText"]
+        self.assertTrue(new_text.startswith("---\n"))
+        self.assertIn("## DoD (Definition of Done)", new_text)
+
+    def test_lsp_server_updates_indexes_for_reported_paths(self):
+        """Test that open, save and watched-file events update the indexes without a rebuild"""
+        doc = self.create_test_file("# Guide\n\n[next](other.md#next-steps)\n", "guide.md")
+        server = LspServer(self.temp_dir, io.BytesIO(), io.BytesIO())
+        server.on_initialize({"rootUri": self.temp_dir.as_uri()})
+        index = server.index
+        server.on_textDocument_didOpen({"textDocument": {"uri": doc.as_uri(), "text": doc.read_text()}})
+
+        other = self.create_test_file("# Other\n\n## Next steps\n", "other.md")
+        server.on_workspace_didChangeWatchedFiles({"changes": [{"uri": other.as_uri(), "type": 1}]})
+        other.write_text("# Other\n\n## Later\n", encoding="utf-8")
+        server.on_textDocument_didSave({"textDocument": {"uri": other.as_uri()}})
+
+        self.assertIs(server.index, index)
+        other_key = str(other.resolve())
+        self.assertIn(Path(other_key), server.index.markdown_files())
+        self.assertEqual(server.anchors.slugs[other_key], frozenset({"other", "later"}))
+        published = self.lsp_messages(server.writer.getvalue())
+        codes = [{d["code"] for d in message["params"]["diagnostics"]} for message in published]
+        self.assertEqual(len(codes), 2)
+        self.assertIn("link-missing", codes[0])
+        self.assertNotIn("link-missing", codes[1])
+
+    def test_lsp_server_survives_failing_handlers(self):
+        """Test that malformed messages get JSON-RPC errors instead of killing the server"""
+        import contextlib
+
+        stream = b"".join(
+            [
+                self.lsp_frame({"method": "textDocument/didOpen", "params": {}}),
+                self.lsp_frame({"id": 1, "method": "textDocument/codeAction", "params": {}}),
+                self.lsp_frame({"id": 2, "method": "workspace/unknown"}),
+                b"Content-Length: 5\r\n\r\n{oops",
+                self.lsp_frame({"id": 3, "method": "shutdown"}),
+                self.lsp_frame({"method": "exit"}),
+            ]
+        )
+        output, errors = io.BytesIO(), io.StringIO()
+        server = LspServer(self.temp_dir, io.BytesIO(stream), output)
+        with contextlib.redirect_stderr(errors):
+            self.assertEqual(server.run(), 0)
+
+        replies = self.lsp_messages(output.getvalue())
+        codes = [reply.get("error", {}).get("code") for reply in replies]
+        self.assertEqual(codes, [-32603, -32601, -32700, None])
+        self.assertIn("textDocument/didOpen failed", errors.getvalue())
+
+    def test_autofix_rechecks_only_changed_files_and_dependents(self):
+        """Test that the in-memory autofix replays unchanged files and re-checks the rest"""
+        ops = self.temp_dir / "docs" / "ops"
+        ops.mkdir(parents=True)
+        fixed = ops / "fixed.md"
+        fixed.write_text("# Fixed\n", encoding="utf-8")
+        linker = self.create_test_file("# Linker\n\n[dod](docs/ops/fixed.md#dod-definition-of-done)\n", "linker.md")
+        plain = self.create_test_file("# Plain\n", "plain.md")
+        targets = [fixed, linker, plain]
+        index = PathIndex.build(self.temp_dir)
+        graph = LinkGraph(self.temp_dir).refresh(index.markdown_files(), index)
+
+        outcomes = []
+        run_checks(targets, self.temp_dir, CheckLogger(), index=index, outcomes=outcomes)
+        self.assertIn("link-anchor-missing", {p["check"] for p in outcomes[1][1]})
+        changed = apply_autofixes(targets, CheckLogger())
+        self.assertEqual(changed, [fixed])
+
+        graph.refresh(index.markdown_files(), index)
+        replayed = RecordingLogger()
+        recheck_changed(targets, outcomes, changed, self.temp_dir, replayed, index=index, graph=graph)
+        fresh = RecordingLogger()
+        run_checks(targets, self.temp_dir, fresh, index=PathIndex.build(self.temp_dir))
+        self.assertEqual(replayed.records, fresh.records)
+        self.assertNotIn("link-anchor-missing", {p["check"] for p in replayed.records})
+
+    def test_autofixer_reuses_checked_documents(self):
+        """Test that documents fed from the check pass are fixed like freshly read ones"""
+        ops = self.temp_dir / "docs" / "ops"
+        ops.mkdir(parents=True)
+        crlf = ops / "crlf.md"
+        crlf.write_bytes(b"# Crlf\r\n\r\nbody\r\n")
+        missing = ops / "missing.md"
+        missing.write_text("# Missing\n", encoding="utf-8")
+        expected = {
+            path: fix_dod_section_text(
+                ParsedDocument.from_text(path, fix_frontmatter_text(
+                    ParsedDocument.from_text(path, path.read_text(encoding="utf-8"))
+                )[0])
+            )[0]
+            for path in (crlf, missing)
+        }
+
+        fixer = Autofixer()
+        run_checks([crlf], self.temp_dir, CheckLogger(), on_document=fixer.feed)
+        self.assertEqual(fixer.seen, {crlf})
+        changed = fixer.commit([crlf, missing], CheckLogger())
+
+        self.assertEqual(changed, [crlf, missing])
+        for path, text in expected.items():
+            self.assertEqual(path.read_text(encoding="utf-8"), text)
+
+    def test_batch_writer_commits_together_or_not_at_all(self):
+        """Test that staged writes land on commit and vanish on abort"""
+        first = self.create_test_file("old\n", "first.md")
+        second = self.temp_dir / "nested" / "second.md"
+
+        with self.assertRaises(RuntimeError):
+            with BatchWriter() as batch:
+                batch.write(first, "new\n")
+                batch.write(second, "new\n")
+                raise RuntimeError("abort midway")
+        self.assertEqual(first.read_text(encoding="utf-8"), "old\n")
+        self.assertFalse(second.exists())
+        self.assertEqual(sorted(p.name for p in self.temp_dir.rglob("*")), ["first.md", "nested"])
+
+        with BatchWriter() as batch:
+            batch.write(first, "new\n")
+            batch.write(second, "new\n")
+            self.assertEqual(first.read_text(encoding="utf-8"), "old\n")
+        self.assertEqual(first.read_text(encoding="utf-8"), "new\n")
+        self.assertEqual(second.read_text(encoding="utf-8"), "new\n")
+
+        # A failing rename rolls back the targets already replaced.
+        blocked = self.temp_dir / "blocked.md"
+        blocked.mkdir()
+        third = self.temp_dir / "third.md"
+        with self.assertRaises(OSError):
+            with BatchWriter() as batch:
+                batch.write(first, "newer\n")
+                batch.write(third, "newer\n")
+                batch.write(blocked, "newer\n")
+        self.assertEqual(first.read_text(encoding="utf-8"), "new\n")
+        self.assertFalse(third.exists())
+        self.assertEqual(
+            sorted(p.name for p in self.temp_dir.iterdir()), ["blocked.md", "first.md", "nested"]
+        )
+
+    def test_report_stream_writes_issue_log_incrementally(self):
+        """Test that the companion issue log receives every error and per-check counts"""
+        log_path = self.temp_dir / "issues.jsonl"
+        stream = ReportStream(log_path)
+        logger = CheckLogger()
+        logger.sinks.append(stream)
+        target = self.create_test_file("# Title\n\nThis is tbd.\n\n```\ncode\n```\n")
+        run_checks([target], self.temp_dir, logger)
+        self.assertFalse(log_path.exists())
+        stream.close()
+
+        lines = log_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), len(logger.entries))
+        self.assertEqual([json.loads(line)["check"] for line in lines], [e.check for e in logger.entries])
+        self.assertEqual(stream.counts["forbidden-word"], 1)
+        self.assertEqual(sum(stream.counts.values()), len(logger.entries))
+
+    def test_issue_stats_aggregates_incrementally(self):
+        """Test per-check, per-directory, fixability and worst-file aggregates"""
+        ops = self.temp_dir / "docs" / "ops"
+        ops.mkdir(parents=True)
+        governed = ops / "guide.md"
+        governed.write_text("# Guide\n\nStill tbd.\n", encoding="utf-8")
+        loose = self.create_test_file("# Loose\n\n```\ncode\n```\n", "loose.md")
+        stats = IssueStats(self.temp_dir)
+        logger = CheckLogger()
+        logger.sinks.append(stats)
+        run_checks([governed, loose], self.temp_dir, logger)
+
+        summary = stats.as_dict(limit=1)
+        self.assertEqual(summary, IssueStats.from_entries(self.temp_dir, logger.entries).as_dict(limit=1))
+        self.assertEqual(sum(summary["by_check"].values()), len(logger.entries))
+        self.assertEqual(set(summary["by_directory"]), {"docs/ops", "."})
+        self.assertEqual(summary["fixability"]["fixable"], sum(1 for e in logger.entries if e.fixable))
+        self.assertEqual(summary["top_files"], [{"file": str(governed), "errors": stats.by_file[str(governed)]}])
+
+    def test_benchmark_corpus_is_deterministic_and_timed(self):
+        """Test the synthetic corpus generator and the benchmark phases"""
+        first = generate_corpus(self.temp_dir / "a", 12, seed=7)
+        second = generate_corpus(self.temp_dir / "b", 12, seed=7)
+        self.assertEqual(first, second)
+
+        results = run_benchmark(self.temp_dir / "c", 12, seed=7)
+        self.assertEqual([r["phase"] for r in results], ["check", "check-cached", "report", "autofix"])
+        self.assertEqual(results[0]["findings"], results[1]["findings"])
+        for result in results:
+            self.assertEqual(result["files"], 12)
+            self.assertGreater(result["peak_rss_so_far_mb"], 0)
+
+    def test_rule_profiler_records_rules_files_and_trace(self):
+        """Test that profiling charges time to rules and files without changing findings"""
+        targets = [
+            self.create_test_file("# One\n\n[x](missing.md)\n", "one.md"),
+            self.create_test_file("# Two\n\n| a | b |\n| --- |\n", "two.md"),
+        ]
+        plain = RecordingLogger()
+        run_checks(targets, self.temp_dir, plain)
+        profiler = RuleProfiler(trace=True)
+        profiled = RecordingLogger()
+        run_checks(targets, self.temp_dir, profiled, jobs=2, profiler=profiler)
+        self.assertEqual(plain.records, profiled.records)
+
+        summary = profiler.summary()
+        self.assertEqual(summary["files_profiled"], 2)
+        self.assertEqual(summary["rules"]["links"]["calls"], 2)
+        self.assertIn("forbidden-words", summary["rules"])
+        self.assertEqual({event["cat"] for event in profiler.events}, {"rule", "file"})
+        trace_path = self.temp_dir / "trace.json"
+        profiler.write_trace(trace_path)
+        self.assertIn("traceEvents", json.loads(trace_path.read_text(encoding="utf-8")))
+
+    def test_rule_set_select_and_ignore_skip_work(self):
+        """Test that --select / --ignore pick rules up front and limit parsing"""
+        target = self.create_test_file(
+            "# Title\n\nStill tbd.\n\n[x](missing.md)\n\n```\ncode\n```\n"
+        )
+        full = RecordingLogger()
+        run_checks([target], self.temp_dir, full)
+
+        rules = RuleSet(["links,forbidden-word"], ["link-missing"])
+        self.assertEqual([entry.name for entry, _ in rules.active], ["links", "forbidden-words"])
+        self.assertEqual(rules.needs[False], frozenset({"links", "lowered"}))
+        subset = RecordingLogger()
+        run_checks([target], self.temp_dir, subset, rules=rules)
+        expected = [
+            payload for payload in full.records
+            if payload["check"] == "forbidden-word"
+            or (payload["check"].startswith(("link-", "image-")) and payload["check"] != "link-missing")
+        ]
+        self.assertEqual(subset.records, expected)
+        self.assertIn("forbidden-word", {payload["check"] for payload in subset.records})
+
+        self.assertEqual([entry.name for entry, _ in RuleSet(["toc-missing"]).active], ["toc"])
+        with self.assertRaises(SystemExit):
+            RuleSet(["no-such-rule"])
+
+    def test_parsed_document_parses_lazily_once(self):
+        """Test that ParsedDocument memoizes each view and pickles only its source"""
+        path = self.temp_dir / "docs" / "ops" / "parsed.md"
+        doc = ParsedDocument.from_text(path, "# Title\n\nBody TBD.\n")
+        self.assertIsNone(doc._scan)
+        self.assertIs(doc.lines, doc.lines)
+        self.assertIs(doc.scan, doc.scan)
+        self.assertEqual(doc.headings, [(1, 1, "Title")])
+        self.assertIn("tbd", doc.lowered)
+
+        clone = pickle.loads(pickle.dumps(doc))
+        self.assertIsNone(clone._lines)
+        self.assertEqual(clone.lines, doc.lines)
+
+        fixed = fix_frontmatter_text(doc)
+        self.assertIsNotNone(fixed)
+        self.assertIsNotNone(fix_dod_section_text(ParsedDocument.from_text(path, fixed[0])))
+
+    def test_iter_markdown_files_prunes_skip_dirs_and_gitignore(self):
+        """Test that target discovery prunes SKIP_DIRS and .gitignore'd trees"""
+        for relative in [
+            "README.md",
+            "docs/ops/a.md",
+            "docs/ops/notes.txt",
+            "node_modules/pkg/README.md",
+            "tmp/scratch.md",
+            "docs/generated/out.md",
+            "docs/generated/keep.md",
+            "docs/draft.md",
+        ]:
+            path = self.temp_dir / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("# Title\n", encoding="utf-8")
+        (self.temp_dir / ".gitignore").write_text("tmp/\n# comment\n", encoding="utf-8")
+        (self.temp_dir / "docs" / ".gitignore").write_text(
+            "generated/*.md\n!generated/keep.md\n/draft.md\n", encoding="utf-8"
+        )
+
+        found = [
+            path.relative_to(self.temp_dir).as_posix() for path in iter_markdown_files(self.temp_dir)
+        ]
+        self.assertEqual(sorted(found), ["README.md", "docs/generated/keep.md", "docs/ops/a.md"])
+        selected = iter_markdown_files(self.temp_dir, ["docs/ops/*"])
+        self.assertEqual([path.name for path in selected], ["a.md"])
+        self.assertEqual(len(list(iter_markdown_files(self.temp_dir, gitignore=False))), 6)
+
+    def test_gitignore_anchored_directory_pattern_keeps_nested_namesakes(self):
+        """Test that /gen/ prunes only the top-level gen/ while gen/ prunes any depth"""
+        for relative in ["gen/a.md", "docs/gen/b.md", "docs/build/c.md", "build/d.md"]:
+            path = self.temp_dir / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("# Title\n", encoding="utf-8")
+        (self.temp_dir / ".gitignore").write_text("/gen/\nbuild/\n", encoding="utf-8")
+
+        found = [
+            path.relative_to(self.temp_dir).as_posix() for path in iter_markdown_files(self.temp_dir)
+        ]
+        self.assertEqual(found, ["docs/gen/b.md"])
+
+    def test_keyword_group_matcher_matches_substring_checks(self):
+        """Test that the one-scan prompt matcher agrees with per-keyword `in` checks"""
+        groups = {"cursor": CURSOR_PROMPT_KEYWORDS, "copilot": GITHUB_COPILOT_PROMPT_KEYWORDS}
+        matcher = KeywordGroupMatcher(groups)
+        self.assertEqual(matcher.anchor, " prompt")
+        samples = [
+            "",
+            "## cursor implementation prompt\n",
+            "see the github copilot prompt prompt",
+            "copilot  prompt and cursorprompt",
+            "## github copilot implementation prompt\n## cursor prompt",
+            "prompt prompt prompt",
+        ]
+        for text in samples:
+            expected = {
+                name
+                for name, keywords in groups.items()
+                if any(keyword.lower() in text for keyword in keywords)
+            }
+            self.assertEqual(matcher.find(text), expected, text)
+
+        fallback = KeywordGroupMatcher({"a": ["Foo"], "b": ["bar", "BAZ"]})
+        self.assertEqual(fallback.anchor, "")
+        self.assertEqual(fallback.find("xx baz foo"), {"a", "b"})
+
+    def test_profiles_share_one_run_and_split_verdicts(self):
+        """Test that ci and strict verdicts come from one run of the union of their rules"""
+        import contextlib
+
+        target = self.create_test_file("\ufeff# Title\n\nStill tbd.\n")
+        verdicts = ProfileVerdicts(["ci", "strict"])
+        self.assertEqual(verdicts.rules.codes, RuleSet().codes)
+        self.assertNotIn("bom-detected", verdicts.codes["ci"])
+
+        logger = ProfileLogger(verdicts)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            run_checks([target], self.temp_dir, logger, rules=verdicts.rules)
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        by_check = {record["check"]: record["profiles"] for record in records}
+        self.assertEqual(by_check["bom-detected"], ["strict"])
+        self.assertEqual(by_check["forbidden-word"], ["ci", "strict"])
+        result = verdicts.as_dict()
+        self.assertEqual(result["strict"]["errors"], len(records))
+        self.assertEqual(result["ci"]["errors"], sum("ci" in r for r in by_check.values()))
+
+        self.assertEqual(ProfileVerdicts(["ci"]).rules.codes, verdicts.codes["ci"])
+        with self.assertRaises(SystemExit):
+            ProfileVerdicts(["lenient"])
+
+    def test_prefetch_matches_serial_run_and_bounds_read_ahead(self):
+        """Test that --prefetch keeps target order, results and a bounded window"""
+        targets = [
+            self.create_test_file(f"# Doc {number}\n\nStill tbd.\n", f"doc{number}.md")
+            for number in range(12)
+        ]
+        serial, prefetched = RecordingLogger(), RecordingLogger()
+        run_checks(targets, self.temp_dir, serial)
+        cache = ResultCache(self.temp_dir / "cache.json")
+        run_checks(targets, self.temp_dir, prefetched, cache=cache, prefetch=3)
+        self.assertEqual(prefetched.records, serial.records)
+
+        pulled = []
+
+        def lazy_targets():
+            for path in targets:
+                pulled.append(path)
+                yield path
+
+        for consumed, (path, content) in enumerate(_prefetched(lazy_targets(), 3), 1):
+            self.assertEqual(content, path.read_bytes())
+            self.assertLessEqual(len(pulled) - consumed, 3)
+        self.assertEqual(consumed, len(targets))
+
+    def test_issue_store_interns_columns_and_behaves_like_a_list(self):
+        """Test that IssueStore interns paths/codes and keeps list semantics"""
+        store = IssueStore()
+        self.assertFalse(store)
+        rows = [
+            ("/repo/docs/ops/a.md", 1, "cursor-prompt-missing", "Missing prompt.", False),
+            ("/repo/docs/ops/b.md", 1, "cursor-prompt-missing", "Missing prompt.", False),
+            ("/repo/docs/ops/a.md", 7, "frontmatter-missing", "No frontmatter.", True),
+        ]
+        for row in rows:
+            store.append(*row)
+        entries = [IssueEntry(Path(file), *rest) for file, *rest in rows]
+
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store, entries)
+        self.assertEqual(store[-1], entries[-1])
+        self.assertEqual(store[:2], entries[:2])
+        self.assertEqual(store[::-2], entries[::-2])
+        self.assertIs(store[0].path, store[2].path)
+        reordered = IssueStore()
+        reordered.path("/repo/docs/ops/b.md")
+        for row in rows:
+            reordered.append(*row)
+        self.assertEqual(store, reordered)
+        self.assertNotEqual(store, entries[::-1])
+        self.assertEqual((len(store.paths), len(store.checks), len(store.messages)), (2, 2, 2))
+        self.assertEqual(store.count_by("check")["cursor-prompt-missing"], 2)
+        self.assertEqual(
+            IssueStats.from_entries(Path("/repo"), store).as_dict(),
+            IssueStats.from_entries(Path("/repo"), entries).as_dict(),
+        )
+
+    def test_check_logger_caps_kept_entries_but_counts_everything(self):
+        """Test that max_entries bounds entries while sinks and error_count see every error"""
+        import contextlib
+
+        target = self.create_test_file("# Title\n\ntbd todo\n")
+        logger = CheckLogger(flush_size=1000, max_entries=2)
+        stats = IssueStats(self.temp_dir)
+        logger.sinks.append(stats)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            run_checks([target], self.temp_dir, logger)
+            logger.flush()
+        lines = output.getvalue().splitlines()
+        self.assertGreater(len(lines), 2)
+        self.assertEqual(len(logger.entries), 2)
+        self.assertEqual(logger.error_count, len(lines))
+        self.assertEqual(stats.total, len(lines))
 
 if __name__ == "__main__":
     unittest.main()